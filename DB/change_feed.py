@@ -0,0 +1,216 @@
+import time
+from collections import defaultdict
+
+from DB.data_access import get_schema, CHANGE_LOG_TABLE
+
+# Change feed
+# ---------------------------
+# Triggers on every table append one line per inserted, updated or deleted
+# row to CHANGE_LOG_TABLE: the table, the row's primary key, its JobID when
+# the table has one, and the connection that made the change. Each terminal
+# polls the log for ids above the last one it saw (one indexed range read),
+# skips its own connection's changes and tells open views exactly which
+# tables, rows and jobs changed.
+#
+# ChangeIDs are handed out when a trigger fires but only become visible when
+# the writing transaction commits, so a long transaction can commit an id
+# below ones already read. A ChangePosition therefore stops at the first
+# missing id and keeps re-reading from there (skipping ids it already
+# reported) until the id shows up, or for GAP_TIMEOUT_SECONDS, after which
+# the id is taken to belong to a rolled-back transaction and skipped.
+#
+# install_change_feed() needs the TRIGGER privilege and is run once per
+# database (Options -> "Enable Live Updates"). Old entries are pruned by the
+# pollers themselves, so no event scheduler is needed.
+
+TRIGGER_PREFIX = "dbdoc_chg_"
+CHANGE_ACTIONS = {"INSERT": "insert", "UPDATE": "update", "DELETE": "delete"}
+CHANGE_RETENTION_HOURS = 24
+POLL_BATCH_SIZE = 500
+GAP_TIMEOUT_SECONDS = 60
+
+
+class ChangeSet:
+    """ The changes from one poll, grouped by table. """
+
+    def __init__(self, entries=()):
+        self.last_id = None
+        self.tables = defaultdict(list)  # table -> [(row_key, job_id, action)]
+        for change_id, table, row_key, job_id, action in entries:
+            self.tables[table].append((row_key, job_id, action))
+            self.last_id = change_id
+
+    def __bool__(self):
+        return bool(self.tables)
+
+    def __repr__(self):
+        return f"ChangeSet({ {table: len(rows) for table, rows in self.tables.items()} })"
+
+    def touches(self, table, key=None, job_id=None):
+        """
+        True if `table` changed at all, or (when given) the row `key` or any row of job `job_id`.
+        Comparison is on strings, as keys come back from the log as text.
+        """
+        changes = self._lookup(table)
+        if key is not None:
+            changes = [change for change in changes if change[0] == str(key)]
+        if job_id is not None:
+            changes = [change for change in changes if change[1] is not None and str(change[1]) == str(job_id)]
+        return bool(changes)
+
+    def keys(self, table):
+        return {row_key for row_key, _, _ in self._lookup(table)}
+
+    def _lookup(self, table):
+        if table in self.tables:
+            return self.tables[table]
+        lowered = table.lower()
+        return next((rows for name, rows in self.tables.items() if name.lower() == lowered), [])
+
+
+class ChangePosition:
+    """
+    Where a poller is in the change log: every id up to `settled` has been
+    reported or given up on; `seen` holds the ids above it already reported.
+    """
+
+    def __init__(self, settled=0):
+        self.settled = settled
+        self.seen = set()
+        self.gap_noticed_at = None  # when the current gap at settled + 1 was first noticed
+        self.gap_horizon = None  # highest id read at that time
+
+    @property
+    def highest(self):
+        return max(self.seen, default=self.settled)
+
+    def record(self, change_ids, now=None):
+        """ Marks `change_ids` as reported and moves `settled` up as far as there are no gaps. """
+        now = time.monotonic() if now is None else now
+        self.seen.update(change_ids)
+        self._advance()
+
+        if not self.seen:
+            self.gap_noticed_at = self.gap_horizon = None
+        elif self.gap_noticed_at is None:
+            self.gap_noticed_at, self.gap_horizon = now, self.highest
+        elif now - self.gap_noticed_at >= GAP_TIMEOUT_SECONDS:
+            # Every missing id below the horizon has been missing for the whole timeout
+            print(f"⚠️ Change feed: missing ids between {self.settled + 1} and {self.gap_horizon} never committed; skipping them.")
+            self.settled = self.gap_horizon
+            self.seen = {i for i in self.seen if i > self.settled}
+            self._advance()
+            self.gap_noticed_at, self.gap_horizon = (now, self.highest) if self.seen else (None, None)
+
+    def _advance(self):
+        while self.settled + 1 in self.seen:
+            self.settled += 1
+            self.seen.discard(self.settled)
+
+
+#--------------------------------------------------------------------
+# Setup
+
+def is_change_feed_installed(cursor):
+    cursor.execute("""
+        SELECT COUNT(*) FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (CHANGE_LOG_TABLE,))
+    return cursor.fetchone()[0] > 0
+
+def install_change_feed(cursor, conn, tables=None):
+    """
+    Creates the change log and (re)creates the triggers on every table with a primary key.
+
+    Returns:
+        list: Tables that are now tracked.
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS `{CHANGE_LOG_TABLE}` (
+            ChangeID BIGINT AUTO_INCREMENT PRIMARY KEY,
+            TableName VARCHAR(64) NOT NULL,
+            RowKey VARCHAR(255),
+            JobID INT NULL,
+            Action VARCHAR(10) NOT NULL,
+            SessionID BIGINT UNSIGNED NOT NULL,
+            ChangedAt TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+            INDEX (ChangedAt)
+        )
+    """)
+
+    schema = get_schema(cursor, refresh=True)
+    tracked = []
+    for table, entry in schema.items():
+        if table == CHANGE_LOG_TABLE or (tables and table not in tables):
+            continue
+        primary_key = entry["primary_key"]
+        if not primary_key:
+            print(f"⚠️ {table} has no primary key; changes to it won't be tracked.")
+            continue
+
+        for event, action in CHANGE_ACTIONS.items():
+            row = "OLD" if event == "DELETE" else "NEW"
+            job_id = f"{row}.`JobID`" if "JobID" in entry["columns"] else "NULL"
+            trigger = f"{TRIGGER_PREFIX}{table}_{action}"[:64]
+            cursor.execute(f"DROP TRIGGER IF EXISTS `{trigger}`")
+            cursor.execute(f"""
+                CREATE TRIGGER `{trigger}` AFTER {event} ON `{table}` FOR EACH ROW
+                INSERT INTO `{CHANGE_LOG_TABLE}` (TableName, RowKey, JobID, Action, SessionID)
+                VALUES ('{table}', {row}.`{primary_key}`, {job_id}, '{action}', CONNECTION_ID())
+            """)
+        tracked.append(table)
+
+    conn.commit()
+    return tracked
+
+def uninstall_change_feed(cursor, conn):
+    """ Drops every change feed trigger and the change log. """
+    cursor.execute("""
+        SELECT TRIGGER_NAME FROM information_schema.TRIGGERS
+        WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME LIKE %s
+    """, (f"{TRIGGER_PREFIX}%",))
+    for (trigger,) in cursor.fetchall():
+        cursor.execute(f"DROP TRIGGER IF EXISTS `{trigger}`")
+    cursor.execute(f"DROP TABLE IF EXISTS `{CHANGE_LOG_TABLE}`")
+    conn.commit()
+
+
+#--------------------------------------------------------------------
+# Reading
+
+def current_session_id(cursor):
+    cursor.execute("SELECT CONNECTION_ID()")
+    return cursor.fetchone()[0]
+
+def latest_change_id(cursor):
+    cursor.execute(f"SELECT COALESCE(MAX(ChangeID), 0) FROM `{CHANGE_LOG_TABLE}`")
+    return cursor.fetchone()[0]
+
+def fetch_changes(cursor, position, ignore_sessions=(), limit=POLL_BATCH_SIZE):
+    """
+    Reads the changes not yet reported since `position` (a ChangePosition,
+    updated in place), leaving out those made by `ignore_sessions`. Ids inside
+    an open gap are re-read until they commit, then the next `limit` after it.
+
+    Returns:
+        ChangeSet: The new changes.
+    """
+    select = f"SELECT ChangeID, TableName, RowKey, JobID, Action, SessionID FROM `{CHANGE_LOG_TABLE}`"
+    highest = position.highest
+    rows = []
+    if highest > position.settled:  # late commits inside the gap
+        cursor.execute(f"{select} WHERE ChangeID > %s AND ChangeID < %s ORDER BY ChangeID", (position.settled, highest))
+        rows = [row for row in cursor.fetchall() if row[0] not in position.seen]
+    cursor.execute(f"{select} WHERE ChangeID > %s ORDER BY ChangeID LIMIT %s", (highest, limit))
+    rows += cursor.fetchall()
+
+    position.record(row[0] for row in rows)
+    ignored = set(ignore_sessions)
+    return ChangeSet(row[:5] for row in rows if row[5] not in ignored)
+
+def prune_changes(cursor, conn, hours=CHANGE_RETENTION_HOURS):
+    cursor.execute(
+        f"DELETE FROM `{CHANGE_LOG_TABLE}` WHERE ChangedAt < NOW() - INTERVAL %s HOUR", (hours,)
+    )
+    conn.commit()
+    return cursor.rowcount
@@ -0,0 +1,81 @@
+from contextlib import contextmanager
+
+# Cursor management
+# ---------------------------
+# The app keeps one long-lived buffered cursor (from connect_to_database())
+# for the small everyday reads and writes. Anything that needs a cursor of
+# its own opens it here, so it is always closed (and its server-side result
+# or statement freed) even when the work in between raises.
+#
+# The cursor kind is chosen per call site:
+#
+#   - "buffered"    the whole result is read into memory on execute; other
+#                   statements can run on the connection while it is open
+#   - "unbuffered"  rows stay on the server and are read as they are
+#                   fetched, so a big read (backup, export) never holds the
+#                   full result; nothing else may run on the connection
+#                   until it is read to the end or closed, so only use it
+#                   on a connection no other thread shares (a background
+#                   job opens its own from the login parameters)
+#   - "dictionary"  buffered, rows come back as {column: value}
+#
+# stream_rows() runs a statement on an unbuffered cursor and yields its
+# rows in batches of `batch_size`.
+
+CURSOR_KINDS = {
+    "buffered": {"buffered": True},
+    "unbuffered": {"buffered": False},
+    "dictionary": {"buffered": True, "dictionary": True},
+}
+STREAM_BATCH_ROWS = 1000
+
+
+def _connection_of(source):
+    """ Accepts a connection or a cursor (whose connection is used). """
+    return getattr(source, "connection", None) if hasattr(source, "execute") else source
+
+@contextmanager
+def managed_cursor(source, kind="buffered"):
+    """
+    Opens a cursor of the given kind and closes it on exit.
+
+    Args:
+        source: A connection, or a cursor whose connection should be used.
+        kind (str): "buffered", "unbuffered" or "dictionary" (see CURSOR_KINDS).
+
+    Yields:
+        The new cursor.
+    """
+    if kind not in CURSOR_KINDS:
+        raise ValueError(f"Unknown cursor kind: {kind}")
+    conn = _connection_of(source)
+    if conn is None:
+        raise ValueError("No connection to open a cursor on")
+
+    cursor = conn.cursor(**CURSOR_KINDS[kind])
+    try:
+        yield cursor
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+def stream_rows(source, statement, params=None, batch_size=STREAM_BATCH_ROWS):
+    """
+    Runs `statement` on an unbuffered cursor and yields (columns, rows) batches,
+    so the full result is never held in memory at once. The connection is busy
+    until the generator is exhausted or closed.
+
+    Yields:
+        tuple: (column names, list of at most `batch_size` rows). At least one
+               batch is yielded, so an empty result still gives its columns.
+    """
+    with managed_cursor(source, "unbuffered") as cursor:
+        cursor.execute(statement, params)
+        columns = [desc[0] for desc in cursor.description]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            yield columns, rows
+            if len(rows) < batch_size:
+                break
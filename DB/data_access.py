@@ -1,7 +1,18 @@
 import mariadb
 from datetime import datetime
-import pandas as pd
 import os
+import json
+
+from UTILS.lazy_import import lazy_import
+from DB.reconnect import ResilientConnection, CONNECT_TIMEOUT_SECONDS
+from DB.cursors import managed_cursor
+
+pd = lazy_import("pandas")
+
+# The app's own bookkeeping tables (change feed log, see DB/change_feed.py):
+# not user data, so they are left out of table lists, backups, exports and reports
+CHANGE_LOG_TABLE = "dbdoc_changes"
+INTERNAL_TABLES = (CHANGE_LOG_TABLE,)
 
 #--------------------------------------------------------------------
 # Handles connecting and disconnnecting from the database
@@ -16,7 +27,8 @@ def connect_to_database(username, password, host, database, ssl_enabled=False, s
             "user": username,
             "password": password,
             "host": host,
-            "database": database
+            "database": database,
+            "connect_timeout": CONNECT_TIMEOUT_SECONDS,  # also bounds every reconnect attempt
         }
 
         if ssl_enabled and ssl_path:
@@ -46,7 +58,12 @@ def connect_to_database(username, password, host, database, ssl_enabled=False, s
                 "ssl_key": ssl_key
             })
 
-        conn = mariadb.connect(**connection_kwargs)
+        # ⏱ Every cursor from this connection is timed into QUERY_STATS;
+        # 🔌 a dropped connection is re-opened in place with the same parameters
+        conn = ResilientConnection(
+            mariadb.connect(**connection_kwargs),
+            connect=lambda: mariadb.connect(**connection_kwargs)
+        )
         cursor = conn.cursor()
         return conn, cursor
 
@@ -69,6 +86,68 @@ def close_connection(conn=None, cursor=None):
 
     return None, None
 
+def _run_prepared(cursor, statement, params=()):
+    """
+    Runs a hot parameterized statement through the connection's prepared-statement
+    registry (see InstrumentedConnection.execute_prepared). Returns the cursor that
+    holds the result. Connections without a registry just use `cursor`.
+    """
+    execute_prepared = getattr(getattr(cursor, "connection", None), "execute_prepared", None)
+    if execute_prepared is None:
+        cursor.execute(statement, params)
+        return cursor
+    return execute_prepared(statement, params)
+
+#--------------------------------------------------------------------
+#--------------------------------------------------------------------
+# Schema cache (one information_schema read per connection)
+
+_schema_cache = {}
+
+def _schema_cache_key(cursor):
+    return id(getattr(cursor, "connection", cursor))
+
+def get_schema(cursor, refresh=False):
+    """
+    Returns the column layout of every table in the current database:
+    {table_name: {"columns": [...], "types": {column: column_type}, "primary_key": column or None}}
+
+    The whole schema is read from information_schema in a single query and
+    cached per connection, so repeated DESCRIBE / SHOW KEYS round-trips are avoided.
+    """
+    key = _schema_cache_key(cursor)
+    if refresh or key not in _schema_cache:
+        cursor.execute("""
+            SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, COLUMN_KEY
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """)
+        schema = {}
+        for table, column, column_type, column_key in cursor.fetchall():
+            entry = schema.setdefault(table, {"columns": [], "types": {}, "primary_key": None})
+            entry["columns"].append(column)
+            entry["types"][column] = column_type
+            if column_key == "PRI" and entry["primary_key"] is None:
+                entry["primary_key"] = column
+        _schema_cache[key] = schema
+    return _schema_cache[key]
+
+def get_table_schema(cursor, table_name):
+    """Case-insensitive lookup of a single table in the cached schema. Returns None if unknown."""
+    schema = get_schema(cursor)
+    if table_name in schema:
+        return schema[table_name]
+    lowered = table_name.lower()
+    return next((entry for name, entry in schema.items() if name.lower() == lowered), None)
+
+def clear_schema_cache(cursor=None):
+    """Drops the cached schema for one connection, or for all connections if no cursor is given."""
+    if cursor is None:
+        _schema_cache.clear()
+    else:
+        _schema_cache.pop(_schema_cache_key(cursor), None)
+
 #--------------------------------------------------------------------
 #--------------------------------------------------------------------
 #Fetching data
@@ -78,14 +157,22 @@ def fetch_primary_key_column(cursor, table_name):
     pk_info = cursor.fetchone()
     return pk_info[4] if pk_info else None
 
-def fetch_tables(cursor):
+def fetch_primary_key_columns(cursor, table_name):
+    """ Every column of the primary key, in key order (empty when the table has none). """
+    cursor.execute(f"SHOW KEYS FROM {table_name} WHERE Key_name = 'PRIMARY'")
+    return [key[4] for key in sorted(cursor.fetchall(), key=lambda key: key[3])]  # Seq_in_index
+
+def fetch_tables(cursor, include_internal=False):
     """
     Fetches and returns a list of tables from the database.
+    INTERNAL_TABLES are left out unless `include_internal` is True.
     """
     try:
         cursor.execute("SHOW TABLES;")
         tables = [table[0] for table in cursor.fetchall()]
-        return tables
+        if include_internal:
+            return tables
+        return [table for table in tables if table not in INTERNAL_TABLES]
     except mariadb.Error as e:
         raise Exception(f"Failed to retrieve tables: {e}")
 
@@ -127,6 +214,270 @@ def fetch_table_data_with_columns(cursor, table_name, limit=50, offset=0, order_
     columns = [desc[0] for desc in cursor.description]
     return rows, columns
 
+#--------------------------------------------------------------------
+# Table pages (one call per page for the table viewer)
+#
+# "exact"    SELECT COUNT(*) every time the total is needed
+# "estimate" information_schema.TABLES.TABLE_ROWS (InnoDB's estimate, no scan)
+# "auto"     the estimate, replaced by an exact count when the estimate is
+#            small enough for COUNT(*) to be cheap
+
+ROW_COUNT_MODES = ("exact", "estimate", "auto")
+DEFAULT_ROW_COUNT_MODE = "auto"
+EXACT_COUNT_THRESHOLD = 100_000
+
+def count_table_rows(cursor, table_name, mode=DEFAULT_ROW_COUNT_MODE):
+    """
+    Returns:
+        tuple: (row_count, is_exact)
+    """
+    if mode not in ROW_COUNT_MODES:
+        mode = DEFAULT_ROW_COUNT_MODE
+
+    if mode != "exact":
+        cursor.execute("""
+            SELECT TABLE_ROWS FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table_name,))
+        row = cursor.fetchone()
+        estimate = int(row[0]) if row and row[0] is not None else None
+        if estimate is not None and (mode == "estimate" or estimate >= EXACT_COUNT_THRESHOLD):
+            return estimate, False
+
+    cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+    return int(cursor.fetchone()[0]), True
+
+def _keyset_condition(primary_key, sort_column, descending, bound, backward=False, inclusive=False):
+    """
+    SQL for "rows after `bound` in the display order" (or before it, when `backward`),
+    where the display order is `sort_column` then the primary key, both ascending or
+    both descending. NULLs sort first ascending and last descending, as in MariaDB.
+
+    Args:
+        bound (tuple): (sort value, key) of the row to continue from.
+
+    Returns:
+        tuple: (condition, params, order_clause); condition is "" when bound is None.
+    """
+    reading_down = descending != backward  # walking the index in DESC order
+    op = ("<" if reading_down else ">") + ("=" if inclusive else "")
+    direction = "DESC" if reading_down else "ASC"
+
+    if sort_column in (None, primary_key):
+        order = f"ORDER BY `{primary_key}` {direction}"
+        if bound is None:
+            return "", [], order
+        return f"`{primary_key}` {op} %s", [bound[-1]], order
+
+    order = f"ORDER BY `{sort_column}` {direction}, `{primary_key}` {direction}"
+    if bound is None:
+        return "", [], order
+
+    value, key = bound
+    if value is None:
+        condition = f"(`{sort_column}` IS NULL AND `{primary_key}` {op} %s)"
+        if not reading_down:
+            condition = f"({condition} OR `{sort_column}` IS NOT NULL)"
+        return condition, [key], order
+
+    strict = op[0]
+    condition = f"(`{sort_column}` {strict} %s OR (`{sort_column}` = %s AND `{primary_key}` {op} %s))"
+    if reading_down:
+        condition = f"({condition} OR `{sort_column}` IS NULL)"
+    return condition, [value, value, key], order
+
+def projected_columns(cursor, table_name, columns=None, sort_column=None):
+    """
+    The columns the table viewer selects: `columns` plus the primary key and the
+    sort column (paging needs both), in table order. All columns when `columns` is None.
+    """
+    table = get_table_schema(cursor, table_name)
+    if not table:
+        return None
+    if not columns:
+        return list(table["columns"])
+    wanted = set(columns) | {table["primary_key"], sort_column}
+    return [col for col in table["columns"] if col in wanted]
+
+def _select_table_rows(cursor, table_name, limit=None, offset=0, sort_column=None, descending=True,
+                       columns=None, after=None, before=None, inclusive=False):
+    """
+    Shared read behind fetch_table_page() and fetch_table_chunk().
+
+    Only `columns` are selected (plus the primary key and sort column, which paging
+    needs); with `after` and/or `before` the rows are found by keyset, otherwise by OFFSET.
+
+    Returns:
+        dict: rows, columns, primary_key, sort_column, descending.
+    """
+    table = get_table_schema(cursor, table_name)
+    primary_key = table["primary_key"] if table else fetch_primary_key_column(cursor, table_name)
+    if sort_column and table and sort_column not in table["columns"]:
+        sort_column = None  # unknown column: never interpolate it into SQL
+
+    if columns and table:
+        select_list = ", ".join(f"`{col}`" for col in projected_columns(cursor, table_name, columns, sort_column))
+    else:
+        select_list = "*"
+
+    conditions, params, order_clause = [], [], ""
+    if primary_key:
+        for bound, backward in ((after, False), (before, True)):
+            condition, bound_params, order = _keyset_condition(
+                primary_key, sort_column, descending, bound, backward, inclusive
+            )
+            if condition:
+                conditions.append(condition)
+                params.extend(bound_params)
+        # Walking backwards from `before` alone reads in reverse; flipped again below
+        reverse = before is not None and after is None
+        order_clause = _keyset_condition(primary_key, sort_column, descending, None, reverse)[2]
+    else:
+        reverse = False
+
+    query = f"SELECT {select_list} FROM `{table_name}`"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" {order_clause}"
+    if limit is not None:
+        query += " LIMIT %s"
+        params.append(limit)
+        if offset and after is None and before is None:
+            query += " OFFSET %s"
+            params.append(offset)
+
+    cursor.execute(query, tuple(params))
+    rows = cursor.fetchall()
+    if reverse:
+        rows.reverse()
+
+    return {
+        "rows": rows,
+        "columns": [desc[0] for desc in cursor.description],
+        "primary_key": primary_key,
+        "sort_column": sort_column,
+        "descending": descending,
+    }
+
+def page_row_bounds(page):
+    """ (sort value, key) of every row in a page or chunk, for continuing from it by keyset. """
+    if not page.get("primary_key"):
+        return []
+    columns = page["columns"]
+    key_index = columns.index(page["primary_key"])
+    sort_index = columns.index(page["sort_column"]) if page.get("sort_column") in columns else key_index
+    return [(row[sort_index], row[key_index]) for row in page["rows"]]
+
+def fetch_table_page(cursor, table_name, limit=50, offset=0, count_mode=DEFAULT_ROW_COUNT_MODE, refresh_snapshot=True,
+                     sort_column=None, descending=True, columns=None, after=None, before=None):
+    """
+    Everything the table viewer needs for one page in a single call: rows
+    (newest first by primary key unless sorted), column names, the primary
+    key and, unless count_mode is None, the total row count.
+
+    Args:
+        count_mode (str or None): One of ROW_COUNT_MODES, or None to skip counting
+                                  (e.g. when paging and the total is already known).
+        refresh_snapshot (bool): Commit first so the read sees other sessions' latest commits.
+        sort_column (str, optional): Column clicked in the header; the primary key breaks ties.
+        columns (list, optional): Columns to select instead of *.
+        after / before (tuple, optional): (sort value, key) of the last row of the previous
+                                          page / first row of the next page. The page is then
+                                          found by keyset and `offset` only labels it.
+
+    Returns:
+        dict: rows, columns, primary_key, sort_column, descending, total_rows (None if not
+              counted), total_exact.
+    """
+    if refresh_snapshot and hasattr(cursor, "connection"):
+        cursor.connection.commit()  # end the old snapshot so the page is current
+
+    page = _select_table_rows(
+        cursor, table_name, limit, offset, sort_column, descending, columns, after, before
+    )
+
+    total_rows, total_exact = None, False
+    if count_mode:
+        total_rows, total_exact = count_table_rows(cursor, table_name, count_mode)
+        # An estimate can be behind; never report fewer rows than we can see
+        total_rows = max(total_rows, offset + len(page["rows"]))
+
+    page["total_rows"] = total_rows
+    page["total_exact"] = total_exact
+    return page
+
+def fetch_table_chunk(cursor, table_name, after=None, before=None, limit=None, inclusive=False, refresh_snapshot=False,
+                      sort_column=None, descending=True, columns=None):
+    """
+    Keyset read for the infinite-scroll viewer, in the same order as
+    fetch_table_page() but found by (sort value, key) instead of OFFSET,
+    so chunk 100 costs the same as chunk 1.
+
+    Args:
+        after (tuple): Rows that come after this (sort value, key) bound (scrolling down).
+        before (tuple): Rows that come before it (scrolling back up).
+                        With both, every row between the two (refreshing what is loaded).
+        limit (int or None): Rows to read next to the bound; None for no limit.
+        inclusive (bool): Include the bound rows themselves.
+        refresh_snapshot (bool): Commit first so the read sees other sessions' latest commits.
+
+    Returns:
+        dict: rows, columns, primary_key (None if the table has none: nothing is read),
+              sort_column, descending.
+    """
+    if refresh_snapshot and hasattr(cursor, "connection"):
+        cursor.connection.commit()
+
+    table = get_table_schema(cursor, table_name)
+    if not (table["primary_key"] if table else fetch_primary_key_column(cursor, table_name)):
+        return {"rows": [], "columns": table["columns"] if table else [], "primary_key": None,
+                "sort_column": None, "descending": descending}
+
+    return _select_table_rows(
+        cursor, table_name, limit, 0, sort_column, descending, columns, after, before, inclusive
+    )
+
+def locate_table_row(cursor, table_name, key, limit=50, sort_column=None, descending=True, columns=None):
+    """
+    Finds the page of the table viewer that contains the row with primary key `key`,
+    in the current sort order, without reading the pages before it:
+    a point lookup for the row, a COUNT of the rows ahead of it (its position),
+    then the rest of its page by keyset on both sides of it.
+
+    Returns:
+        dict or None: A page (see fetch_table_page()) plus "offset" (where the page
+                      starts) and "row_index" (the row's place on it); None if no such row.
+    """
+    table = get_table_schema(cursor, table_name)
+    primary_key = table["primary_key"] if table else fetch_primary_key_column(cursor, table_name)
+    if not primary_key:
+        return None
+    if sort_column and table and sort_column not in table["columns"]:
+        sort_column = None
+
+    sort_by = sort_column or primary_key
+    cursor.execute(f"SELECT `{sort_by}` FROM `{table_name}` WHERE `{primary_key}` = %s", (key,))
+    found = cursor.fetchone()
+    if not found:
+        return None
+    bound = (found[0], key)
+
+    condition, params, _ = _keyset_condition(primary_key, sort_column, descending, bound, backward=True)
+    cursor.execute(f"SELECT COUNT(*) FROM `{table_name}` WHERE {condition}", tuple(params))
+    position = int(cursor.fetchone()[0])
+
+    offset = position - position % limit
+    row_index = position - offset
+    view = {"sort_column": sort_column, "descending": descending, "columns": columns}
+
+    page = _select_table_rows(cursor, table_name, limit - row_index, after=bound, inclusive=True, **view)
+    if row_index:
+        ahead = _select_table_rows(cursor, table_name, row_index, before=bound, **view)
+        page["rows"] = list(ahead["rows"]) + list(page["rows"])
+
+    page.update({"offset": offset, "row_index": row_index, "total_rows": None, "total_exact": False})
+    return page
+
 #--------------------------------------------------------------------
 #--------------------------------------------------------------------
 #Record Manipulation
@@ -146,8 +497,43 @@ def insert_record(cursor, conn, table_name, columns, values):
         print(f"❌ DB Insert Failed: {e}")
         return False
 
+def insert_records_bulk(cursor, conn, table_name, columns, rows):
+    """
+    Inserts many rows with a single executemany() and commits them as one transaction.
+
+    On failure the batch is rolled back and the rows are retried one by one so
+    that good rows are still loaded and each bad row can be reported.
+
+    Returns:
+        tuple: (inserted_count, failures) where failures is a list of (row_index, error_message).
+    """
+    if not rows:
+        return 0, []
+
+    column_list = ", ".join(f"`{col}`" for col in columns)
+    placeholders = ", ".join(["%s"] * len(columns))
+    query = f"INSERT INTO `{table_name}` ({column_list}) VALUES ({placeholders})"
+
+    try:
+        cursor.executemany(query, rows)
+        conn.commit()
+        return len(rows), []
+    except mariadb.Error:
+        conn.rollback()
+
+    inserted, failures = 0, []
+    for idx, row in enumerate(rows):
+        try:
+            cursor.execute(query, row)
+            inserted += 1
+        except mariadb.Error as e:
+            failures.append((idx, str(e)))
+    conn.commit()
+    return inserted, failures
+
 def update_column(cursor, conn, table_name, column_name, new_value, pk_column, pk_value):
-    cursor.execute(
+    _run_prepared(
+        cursor,
         f"UPDATE {table_name} SET {column_name} = %s WHERE {pk_column} = %s",
         (new_value, pk_value)
     )
@@ -169,14 +555,14 @@ def update_status(cursor, conn, table_name, pk_column, pk_value, new_status):
                 SET status = %s, EndDate = %s
                 WHERE {pk_column} = %s
             """
-            cursor.execute(query, (new_status, current_datetime, pk_value))
+            _run_prepared(cursor, query, (new_status, current_datetime, pk_value))
         else:
             query = f"""
                 UPDATE {table_name}
                 SET status = %s
                 WHERE {pk_column} = %s
             """
-            cursor.execute(query, (new_status, pk_value))
+            _run_prepared(cursor, query, (new_status, pk_value))
 
         conn.commit()
         return True
@@ -185,82 +571,225 @@ def update_status(cursor, conn, table_name, pk_column, pk_value, new_status):
         print(f"❌ ERROR in update_status: {e}")
         return False
 
-def update_auto_increment_if_needed(cursor, conn, table_name, pk_column):
-    cursor.execute(f"SELECT MAX({pk_column}) FROM {table_name}")
-    max_pk = cursor.fetchone()[0]
-
-    if max_pk is None:
+#--------------------------------------------------------------------
+#--------------------------------------------------------------------
+# AUTO_INCREMENT maintenance
+#
+# Resetting a table's AUTO_INCREMENT needs MAX() plus an ALTER TABLE, and the
+# ALTER takes a metadata lock on the whole table. Edits and deletes therefore
+# only *note* which tables may need their counter pulled back; the actual
+# ALTERs happen in compact_auto_increment(), depending on the policy:
+#
+#   "never"     - counters are left alone (gaps in IDs are kept)
+#   "deferred"  - tables are queued and compacted in one batch on demand
+#                 (Settings ▸ Compact ID Counters, or on logout)
+#   "immediate" - the old behaviour: compact right after the change
+
+KEY_MAINTENANCE_POLICIES = ("never", "deferred", "immediate")
+DEFAULT_KEY_MAINTENANCE_POLICY = "deferred"
+
+_key_maintenance = {
+    "policy": DEFAULT_KEY_MAINTENANCE_POLICY,
+    "pending": {},  # table_name -> pk_column
+}
+
+def set_key_maintenance_policy(policy):
+    """ Sets the AUTO_INCREMENT policy; unknown values fall back to the default. """
+    if policy not in KEY_MAINTENANCE_POLICIES:
+        print(f"⚠️ Unknown key maintenance policy '{policy}', using '{DEFAULT_KEY_MAINTENANCE_POLICY}'.")
+        policy = DEFAULT_KEY_MAINTENANCE_POLICY
+    _key_maintenance["policy"] = policy
+    if policy == "never":
+        _key_maintenance["pending"].clear()
+
+def get_key_maintenance_policy():
+    return _key_maintenance["policy"]
+
+def get_pending_key_maintenance():
+    """ Returns the tables queued for compaction as {table_name: pk_column}. """
+    return dict(_key_maintenance["pending"])
+
+def note_key_change(cursor, conn, table_name, pk_column):
+    """
+    Records that rows in a table were deleted or had their key changed.
+    Costs nothing unless the policy is "immediate".
+    """
+    policy = _key_maintenance["policy"]
+    if policy == "never":
         return
+    _key_maintenance["pending"][table_name] = pk_column
+    if policy == "immediate":
+        compact_auto_increment(cursor, conn, [table_name])
 
-    cursor.execute(f"SHOW TABLE STATUS LIKE %s", (table_name,))
-    table_status = cursor.fetchone()
-    if table_status is None:
-        return
+def compact_auto_increment(cursor, conn, tables=None):
+    """
+    Resets AUTO_INCREMENT to MAX(pk) + 1 for the given (or all queued) tables.
 
-    current_ai = table_status[10]
-    new_ai = max_pk + 1
+    Current counters for every table are read in one information_schema query
+    and ALTER TABLE is only issued where the counter is out of step.
 
-    if current_ai != new_ai:
-        cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = {new_ai}")
-        conn.commit()
+    Args:
+        tables (list, optional): Table names; defaults to the queued tables.
 
-def delete_record_by_id(conn, table_name, primary_key_column, primary_key_value):
-    """Deletes a record safely and resets AUTO_INCREMENT if needed."""
-    cursor = conn.cursor()
+    Returns:
+        list: (table_name, old_value, new_value) for each table that was altered.
+    """
+    pending = _key_maintenance["pending"]
+    if tables is None:
+        tables = list(pending)
+    if not tables:
+        return []
 
-    # Check if record exists
-    cursor.execute(
-        f"SELECT COUNT(*) FROM {table_name} WHERE {primary_key_column} = %s;",
-        (primary_key_value,)
-    )
-    if cursor.fetchone()[0] == 0:
-        return False, "Record not found"
+    placeholders = ", ".join(["%s"] * len(tables))
+    cursor.execute(f"""
+        SELECT TABLE_NAME, AUTO_INCREMENT
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders})
+    """, tuple(tables))
+    counters = {name: value for name, value in cursor.fetchall()}
+
+    altered = []
+    for table_name in tables:
+        pk_column = pending.pop(table_name, None)
+        current_ai = counters.get(table_name)
+        if current_ai is None:
+            continue  # no AUTO_INCREMENT column
+
+        pk_column = pk_column or (get_table_schema(cursor, table_name) or {}).get("primary_key")
+        if not pk_column:
+            continue
+
+        cursor.execute(f"SELECT MAX(`{pk_column}`) FROM `{table_name}`")
+        max_pk = cursor.fetchone()[0]
+        new_ai = (int(max_pk) + 1) if max_pk is not None else 1
+
+        if current_ai != new_ai:
+            cursor.execute(f"ALTER TABLE `{table_name}` AUTO_INCREMENT = {new_ai}")
+            altered.append((table_name, current_ai, new_ai))
 
-    # Delete the record
-    cursor.execute(
-        f"DELETE FROM {table_name} WHERE {primary_key_column} = %s;",
-        (primary_key_value,)
-    )
     conn.commit()
+    return altered
 
-    # Reset AUTO_INCREMENT
-    cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-    remaining = cursor.fetchone()[0]
-
-    if remaining > 0:
-        cursor.execute(f"SELECT MAX({primary_key_column}) FROM {table_name};")
-        max_id = cursor.fetchone()[0]
-        if max_id:
-            cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = {max_id + 1};")
-    else:
-        cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = 1;")
+def delete_record_by_id(conn, table_name, primary_key_column, primary_key_value):
+    """Deletes a record; AUTO_INCREMENT is handled by the key maintenance policy."""
+    with managed_cursor(conn) as cursor:
+        cursor.execute(
+            f"DELETE FROM {table_name} WHERE {primary_key_column} = %s;",
+            (primary_key_value,)
+        )
+        if cursor.rowcount == 0:
+            return False, "Record not found"
+        conn.commit()
 
-    conn.commit()
+        note_key_change(cursor, conn, table_name, primary_key_column)
     return True, None
 
 def delete_multiple_records(conn, table_name, primary_key_column, key_list):
-    cursor = conn.cursor()
     try:
-        placeholders = ','.join(['%s'] * len(key_list))
-        query = f"DELETE FROM {table_name} WHERE {primary_key_column} IN ({placeholders});"
-        cursor.execute(query, key_list)
-        conn.commit()
+        with managed_cursor(conn) as cursor:
+            placeholders = ','.join(['%s'] * len(key_list))
+            query = f"DELETE FROM {table_name} WHERE {primary_key_column} IN ({placeholders});"
+            cursor.execute(query, key_list)
+            conn.commit()
+            note_key_change(cursor, conn, table_name, primary_key_column)
         return True, None
     except Exception as e:
         return False, str(e)
 
+def update_column_bulk(cursor, conn, table_name, column_name, new_value, pk_column, pk_values, chunk_size=1000):
+    """
+    Sets one column to the same value for many rows in a single transaction,
+    using UPDATE ... WHERE pk IN (...) in chunks of `chunk_size` keys.
+
+    Returns:
+        tuple: (rows_updated, None) on success, (0, error_message) on failure (nothing is changed).
+    """
+    return _update_bulk(
+        cursor, conn, table_name, f"`{column_name}` = %s", (new_value,), pk_column, pk_values, chunk_size
+    )
+
+def update_status_bulk(cursor, conn, table_name, pk_column, pk_values, new_status, chunk_size=1000, end_date=None):
+    """
+    Bulk version of update_status(): sets Status (and EndDate when Completed) for many rows at once.
+
+    Args:
+        end_date (str, optional): EndDate written for Completed ("%Y-%m-%d %H:%M:%S");
+                                  defaults to now. Pass it to show the same value in the grid.
+
+    Returns:
+        tuple: (rows_updated, None) on success, (0, error_message) on failure.
+    """
+    if new_status == "Completed":
+        end_date = end_date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _update_bulk(
+            cursor, conn, table_name, "status = %s, EndDate = %s", (new_status, end_date),
+            pk_column, pk_values, chunk_size
+        )
+    return _update_bulk(cursor, conn, table_name, "status = %s", (new_status,), pk_column, pk_values, chunk_size)
+
+def _update_bulk(cursor, conn, table_name, set_clause, set_params, pk_column, pk_values, chunk_size):
+    pk_values = list(pk_values)
+    updated = 0
+    try:
+        for start in range(0, len(pk_values), chunk_size):
+            chunk = pk_values[start:start + chunk_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(
+                f"UPDATE `{table_name}` SET {set_clause} WHERE `{pk_column}` IN ({placeholders})",
+                (*set_params, *chunk)
+            )
+            updated += cursor.rowcount
+        conn.commit()
+        return updated, None
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ ERROR in bulk update: {e}")
+        return 0, str(e)
+
 #--------------------------------------------------------------------
 #--------------------------------------------------------------------
 #Validation and checking
 
+def search_table_rows(cursor, table_name, columns, search_text, select_columns=None):
+    """
+    Multi-token search: every whitespace-separated token must match (LIKE %token%)
+    at least one of the given columns.
+
+    Args:
+        select_columns (list, optional): Columns to return (the viewer's visible ones)
+                                         instead of SELECT *.
+
+    Returns:
+        list: Matching rows, or [] if there are no tokens.
+    """
+    tokens = [word.strip() for word in search_text.strip().split() if word.strip()]
+    if not tokens or not columns:
+        return []
+
+    conditions = []
+    params = []
+    for token in tokens:
+        token_conditions = [f"`{col}` LIKE %s" for col in columns]
+        conditions.append(f"({' OR '.join(token_conditions)})")
+        params.extend([f"%{token}%"] * len(columns))
+
+    select_list = ", ".join(f"`{col}`" for col in select_columns) if select_columns else "*"
+    cursor.execute(f"""
+        SELECT {select_list} FROM `{table_name}`
+        WHERE {" AND ".join(conditions)};
+    """, tuple(params))
+    return cursor.fetchall()
+
 def check_primary_key_exists(cursor, table_name, pk_column, pk_value):
-    cursor.execute(f"SELECT {pk_column} FROM {table_name} WHERE {pk_column} = %s", (pk_value,))
-    result = cursor.fetchone()
+    result = _run_prepared(
+        cursor, f"SELECT {pk_column} FROM {table_name} WHERE {pk_column} = %s", (pk_value,)
+    ).fetchone()
     return result[0] if result else None
 
 def check_duplicate_primary_key(cursor, table_name, pk_column, new_pk_value):
-    cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {pk_column} = %s", (new_pk_value,))
-    return cursor.fetchone()[0] > 0
+    return _run_prepared(
+        cursor, f"SELECT COUNT(*) FROM {table_name} WHERE {pk_column} = %s", (new_pk_value,)
+    ).fetchone()[0] > 0
 
 #--------------------------------------------------------------------
 #--------------------------------------------------------------------
@@ -425,6 +954,89 @@ def get_database_summary_counts(cursor):
 #--------------------------------------------------------------------
 # Handles Search Customer logic
 
+def _fetch_json_union(cursor, arms):
+    """
+    Runs several SELECTs as one UNION ALL round-trip.
+
+    Each arm is (select_sql, params) where select_sql returns exactly one
+    JSON_ARRAY(...) column; arms may have different shapes. Returns one list
+    of row tuples per arm, in the order the arms were given.
+    """
+    results = [[] for _ in arms]
+    if not arms:
+        return results
+
+    query = "\nUNION ALL\n".join(
+        f"SELECT {idx} AS arm, row_json FROM ({sql}) AS arm_{idx}"
+        for idx, (sql, _) in enumerate(arms)
+    )
+    params = [param for _, arm_params in arms for param in arm_params]
+
+    cursor.execute(query, tuple(params))
+    for arm, row_json in cursor.fetchall():
+        results[int(arm)].append(tuple(json.loads(row_json)))
+    return results
+
+def _json_array_of(columns, alias):
+    return "JSON_ARRAY(" + ", ".join(f"{alias}.`{col}`" for col in columns) + ")"
+
+def get_customer_report(cursor, job_id, exclude_tables=("customers", "jobs", "walkins")):
+    """
+    Loads everything the customer report needs in a single round-trip:
+    the customer owning `job_id`, all of their jobs, and the rows of every
+    other table linked to those jobs through a JobID column.
+
+    Column lists come from the cached schema, so no DESCRIBE / SHOW TABLES
+    queries are issued.
+
+    Returns:
+        tuple: (customer_id, customer_columns, customer_info, job_columns, jobs_data, related_tables_data)
+               or None if no job with that ID exists.
+    """
+    customers = get_table_schema(cursor, "customers")
+    jobs = get_table_schema(cursor, "jobs")
+    if not customers or not jobs:
+        raise Exception("Customer report requires 'customers' and 'jobs' tables.")
+
+    owner = "(SELECT CustomerID FROM jobs WHERE JobID = %s)"
+
+    arms = [
+        (f"SELECT {_json_array_of(customers['columns'], 'c')} AS row_json "
+         f"FROM customers c WHERE c.CustomerID = {owner}", (job_id,)),
+        (f"SELECT {_json_array_of(jobs['columns'], 'j')} AS row_json "
+         f"FROM jobs j WHERE j.CustomerID = {owner}", (job_id,)),
+    ]
+
+    related_tables = []
+    for table_name, entry in sorted(get_schema(cursor).items()):
+        if table_name.lower() in exclude_tables or table_name in INTERNAL_TABLES:
+            continue
+        if not any(col.lower() == "jobid" for col in entry["columns"]):
+            continue
+        related_tables.append((table_name, entry["columns"]))
+        arms.append((
+            f"SELECT {_json_array_of(entry['columns'], 't')} AS row_json "
+            f"FROM `{table_name}` t JOIN jobs j ON j.JobID = t.JobID "
+            f"WHERE j.CustomerID = {owner}",
+            (job_id,)
+        ))
+
+    results = _fetch_json_union(cursor, arms)
+
+    if not results[0]:
+        return None
+
+    customer_info = results[0][0]
+    customer_columns = customers["columns"]
+    customer_id = customer_info[customer_columns.index("CustomerID")] if "CustomerID" in customer_columns else None
+
+    related_tables_data = {
+        table_name: (columns, rows)
+        for (table_name, columns), rows in zip(related_tables, results[2:])
+    }
+
+    return customer_id, customer_columns, customer_info, jobs["columns"], results[1], related_tables_data
+
 def get_customer_id_by_job(cursor, job_id):
     cursor.execute("SELECT CustomerID FROM Jobs WHERE JobID = %s", (job_id,))
     result = cursor.fetchone()
@@ -474,17 +1086,18 @@ def get_table_data_for_customer(cursor, table_name, customer_id):
 # data_access/jobs.py
 
 def get_job_notes(cursor, job_id):
-    cursor.execute("SELECT notes, status, technician FROM jobs WHERE JOBID = %s", (job_id,))
-    return cursor.fetchone()
+    return _run_prepared(cursor, "SELECT notes, status, technician FROM jobs WHERE JOBID = %s", (job_id,)).fetchone()
 
 def update_job_notes(cursor, job_id, notes, status, technician, end_date=None):
     if end_date:
-        cursor.execute(
+        _run_prepared(
+            cursor,
             "UPDATE jobs SET notes = %s, status = %s, technician = %s, EndDate = %s WHERE JOBID = %s",
             (notes, status, technician, end_date, job_id)
         )
     else:
-        cursor.execute(
+        _run_prepared(
+            cursor,
             "UPDATE jobs SET notes = %s, status = %s, technician = %s WHERE JOBID = %s",
             (notes, status, technician, job_id)
         )
@@ -497,8 +1110,7 @@ def get_cost_columns(cursor):
     return [col[0] for col in cursor.fetchall()]
 
 def get_costs_by_job(cursor, job_id, columns):
-    cursor.execute(f"SELECT {', '.join(columns)} FROM costs WHERE JOBID = %s", (job_id,))
-    return cursor.fetchall()
+    return _run_prepared(cursor, f"SELECT {', '.join(columns)} FROM costs WHERE JOBID = %s", (job_id,)).fetchall()
 
 def insert_cost(cursor, job_id, cost_type, amount, description):
     cursor.execute(
@@ -512,8 +1124,9 @@ def delete_cost(cursor, cost_id):
 # data_access/payments.py
 
 def get_payments(cursor, job_id):
-    cursor.execute("SELECT PaymentID, Amount, PaymentType, Date FROM payments WHERE JOBID = %s", (job_id,))
-    return cursor.fetchall()
+    return _run_prepared(
+        cursor, "SELECT PaymentID, Amount, PaymentType, Date FROM payments WHERE JOBID = %s", (job_id,)
+    ).fetchall()
 
 def insert_payment(cursor, job_id, amount, payment_type, payment_date):
     cursor.execute(
@@ -527,21 +1140,19 @@ def delete_payment(cursor, payment_id):
 # data_access/communications.py
 
 def get_customer_contact(cursor, job_id):
-    cursor.execute("""
+    return _run_prepared(cursor, """
         SELECT customers.FirstName, customers.SurName, customers.Phone, customers.Email, customers.PostCode, customers.DoorNumber
         FROM customers 
         JOIN jobs ON customers.CustomerID = jobs.CustomerID 
         WHERE jobs.JOBID = %s
-    """, (job_id,))
-    return cursor.fetchone()
+    """, (job_id,)).fetchone()
 
 def get_communications(cursor, job_id):
-    cursor.execute("""
+    return _run_prepared(cursor, """
         SELECT CommunicationID, DateTime, CommunicationType, Note 
         FROM communications 
         WHERE JOBID = %s
-    """, (job_id,))
-    return cursor.fetchall()
+    """, (job_id,)).fetchall()
 
 def insert_communication(cursor, job_id, comm_type, message):
     cursor.execute("""
@@ -555,12 +1166,11 @@ def delete_communication(cursor, comm_id):
 # data_access/orders.py
 
 def get_orders(cursor, job_id):
-    cursor.execute("""
+    return _run_prepared(cursor, """
         SELECT PartID, OrderDate, Description, Quantity, TotalCost 
         FROM orders 
         WHERE JOBID = %s
-    """, (job_id,))
-    return cursor.fetchall()
+    """, (job_id,)).fetchall()
 
 def insert_order(cursor, job_id, description, quantity, total_cost):
     cursor.execute("""
@@ -573,11 +1183,12 @@ def delete_order(cursor, order_id):
 
 # data_access/job_details.py
 
+JOB_DETAILS_EXCLUDED_COLUMNS = {"JobID", "EndDate", "CustomerID", "Notes", "Technician", "Status"}
+
 def get_editable_columns(cursor):
     cursor.execute("SHOW COLUMNS FROM jobs")
     all_columns = [col[0] for col in cursor.fetchall()]
-    excluded = {"JobID", "EndDate", "CustomerID", "Notes", "Technician", "Status"}
-    return [col for col in all_columns if col not in excluded]
+    return [col for col in all_columns if col not in JOB_DETAILS_EXCLUDED_COLUMNS]
 
 def get_job_data(cursor, job_id, columns):
     cursor.execute(f"SELECT {', '.join(columns)} FROM jobs WHERE JOBID = %s", (job_id,))
@@ -587,3 +1198,81 @@ def update_job_data(cursor, job_id, columns, values):
     assignments = ', '.join(f"{col} = %s" for col in columns)
     query = f"UPDATE jobs SET {assignments} WHERE JOBID = %s"
     cursor.execute(query, (*values, job_id))
+
+
+# data_access/job_bundle.py
+
+PAYMENT_COLUMNS = ["PaymentID", "Amount", "PaymentType", "Date"]
+COMMUNICATION_COLUMNS = ["CommunicationID", "DateTime", "CommunicationType", "Note"]
+ORDER_COLUMNS = ["PartID", "OrderDate", "Description", "Quantity", "TotalCost"]
+CONTACT_COLUMNS = ["FirstName", "SurName", "Phone", "Email", "PostCode", "DoorNumber"]
+JOB_SUMMARY_COLUMNS = ["JobID", "FirstName", "SurName", "DeviceBrand", "DeviceType", "Status"]
+
+def get_job_summaries(cursor, job_ids):
+    """
+    One-line summaries (customer, device, status) of several jobs in a single
+    indexed query, for the recent-jobs list.
+
+    Returns:
+        dict: {job_id (str): {column: value}} for the jobs that exist.
+    """
+    job_ids = [str(job_id) for job_id in job_ids]
+    if not job_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(job_ids))
+    with managed_cursor(cursor, "dictionary") as summary_cursor:
+        summary_cursor.execute(f"""
+            SELECT j.JobID, c.FirstName, c.SurName, j.DeviceBrand, j.DeviceType, j.Status
+            FROM jobs j
+            LEFT JOIN customers c ON c.CustomerID = j.CustomerID
+            WHERE j.JobID IN ({placeholders})
+        """, tuple(job_ids))
+        return {str(row["JobID"]): row for row in summary_cursor.fetchall()}
+
+def get_job_bundle(cursor, job_id):
+    """
+    Prefetches everything the job dialogs show for one job in a single round-trip:
+    notes/status/technician, editable job details, customer contact, costs,
+    payments, communications and orders.
+
+    Returns None if the job does not exist, otherwise a dict of row lists
+    (plus the column lists needed to interpret costs and job details).
+    """
+    cost_columns = get_table_schema(cursor, "costs")["columns"]
+    detail_columns = [
+        col for col in get_table_schema(cursor, "jobs")["columns"]
+        if col not in JOB_DETAILS_EXCLUDED_COLUMNS
+    ]
+
+    arms = [
+        (f"SELECT {_json_array_of(['Notes', 'Status', 'Technician'], 'j')} AS row_json "
+         f"FROM jobs j WHERE j.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(detail_columns, 'j')} AS row_json "
+         f"FROM jobs j WHERE j.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(CONTACT_COLUMNS, 'c')} AS row_json "
+         f"FROM customers c JOIN jobs j ON c.CustomerID = j.CustomerID WHERE j.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(cost_columns, 't')} AS row_json "
+         f"FROM costs t WHERE t.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(PAYMENT_COLUMNS, 't')} AS row_json "
+         f"FROM payments t WHERE t.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(COMMUNICATION_COLUMNS, 't')} AS row_json "
+         f"FROM communications t WHERE t.JobID = %s", (job_id,)),
+        (f"SELECT {_json_array_of(ORDER_COLUMNS, 't')} AS row_json "
+         f"FROM orders t WHERE t.JobID = %s", (job_id,)),
+    ]
+
+    notes, details, contact, costs, payments, communications, orders = _fetch_json_union(cursor, arms)
+    if not notes:
+        return None
+
+    return {
+        "notes": notes[0],
+        "detail_columns": detail_columns,
+        "details": details[0],
+        "contact": contact[0] if contact else None,
+        "cost_columns": cost_columns,
+        "costs": costs,
+        "payments": payments,
+        "communications": communications,
+        "orders": orders,
+    }
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from DB.data_access import (
+    get_job_bundle,
+    insert_cost, delete_cost,
+    insert_payment, delete_payment,
+    insert_communication, delete_communication,
+    insert_order, delete_order,
+    update_job_notes, update_job_data,
+)
+
+# JobCache Class
+# ---------------------------
+# Holds everything the job dialogs (notes editor, costs, payments,
+# communications, orders, job details) show for a single job.
+#
+# All child data is prefetched in one round-trip when the job is opened
+# and the same instance is handed to every dialog, so switching between
+# a job's tabs doesn't touch the database. Inserts and deletes go to the
+# database and are then applied to the cached lists in place instead of
+# reloading them.
+
+
+class JobCache:
+    """ Per-job aggregate shared by the job dialogs. """
+
+    def __init__(self, job_id, cursor, conn):
+        self.job_id = job_id
+        self.cursor = cursor
+        self.conn = conn
+        self.exists = False
+        self.reload()
+
+    def reload(self):
+        """ (Re)fetches the whole job in a single batch. """
+        bundle = get_job_bundle(self.cursor, self.job_id)
+        self.exists = bundle is not None
+        bundle = bundle or {}
+
+        self.notes = bundle.get("notes")
+        self.detail_columns = bundle.get("detail_columns", [])
+        self.details = bundle.get("details")
+        self.contact = bundle.get("contact")
+        self.cost_columns = bundle.get("cost_columns", [])
+        self.costs = bundle.get("costs", [])
+        self.payments = bundle.get("payments", [])
+        self.communications = bundle.get("communications", [])
+        self.orders = bundle.get("orders", [])
+
+    @staticmethod
+    def _now():
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    #--------------------------------------------------------------------
+    # Job notes / details
+
+    def save_notes(self, notes, status, technician, end_date=None):
+        update_job_notes(self.cursor, self.job_id, notes, status, technician, end_date)
+        self.conn.commit()
+        self.notes = (notes, status, technician)
+
+    def save_details(self, values):
+        update_job_data(self.cursor, self.job_id, self.detail_columns, values)
+        self.conn.commit()
+        self.details = tuple(values)
+
+    #--------------------------------------------------------------------
+    # Costs
+
+    def add_cost(self, cost_type, amount, description):
+        insert_cost(self.cursor, self.job_id, cost_type, amount, description)
+        self.conn.commit()
+
+        known = {
+            "costid": self.cursor.lastrowid,
+            "jobid": self.job_id,
+            "costtype": cost_type,
+            "amount": amount,
+            "description": description,
+        }
+        row = tuple(
+            known.get(col.lower(), self._now() if "date" in col.lower() else None)
+            for col in self.cost_columns
+        )
+        self.costs.append(row)
+
+    def remove_cost(self, cost_id):
+        delete_cost(self.cursor, cost_id)
+        self.conn.commit()
+        self.costs = [row for row in self.costs if row[0] != cost_id]
+
+    #--------------------------------------------------------------------
+    # Payments
+
+    def add_payment(self, amount, payment_type, payment_date):
+        insert_payment(self.cursor, self.job_id, amount, payment_type, payment_date)
+        self.conn.commit()
+        self.payments.append((self.cursor.lastrowid, amount, payment_type, payment_date))
+
+    def remove_payment(self, payment_id):
+        delete_payment(self.cursor, payment_id)
+        self.conn.commit()
+        self.payments = [row for row in self.payments if row[0] != payment_id]
+
+    #--------------------------------------------------------------------
+    # Communications
+
+    def add_communication(self, comm_type, message):
+        insert_communication(self.cursor, self.job_id, comm_type, message)
+        self.conn.commit()
+        self.communications.append((self.cursor.lastrowid, self._now(), comm_type, message))
+
+    def remove_communication(self, comm_id):
+        delete_communication(self.cursor, comm_id)
+        self.conn.commit()
+        self.communications = [row for row in self.communications if row[0] != comm_id]
+
+    #--------------------------------------------------------------------
+    # Orders
+
+    def add_order(self, description, quantity, total_cost):
+        insert_order(self.cursor, self.job_id, description, quantity, total_cost)
+        self.conn.commit()
+        self.orders.append((self.cursor.lastrowid, self._now(), description, quantity, total_cost))
+
+    def remove_order(self, order_id):
+        delete_order(self.cursor, order_id)
+        self.conn.commit()
+        self.orders = [row for row in self.orders if row[0] != order_id]
@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from DB.data_access import connect_to_database, close_connection, fetch_table_page
+
+# PageCache Class
+# ---------------------------
+# Read-ahead cache for the table viewer. While the user looks at a page,
+# the next one is fetched in the background so "Next" renders straight
+# from memory; pages already seen stay cached so "Previous" is instant too.
+#
+#   - prefetching runs on one worker thread with its own connection, kept
+#     open for the whole session and shared by every table view (the GUI
+#     connection is never used off the GUI thread)
+#   - at most `max_pages` pages are kept, least recently used dropped first
+#   - pages older than `max_age` seconds are fetched again
+#   - invalidate() drops a table's pages after an edit, refresh or a change
+#     from another terminal; a prefetch still in flight at that moment is
+#     thrown away when it lands (generation counter)
+#
+# Keys are (table, offset, limit, view), where the view is the sort order
+# and column selection, so switching tables or sorting needs no reset. A
+# prefetch may be given a keyset bound (the last row of the page on screen)
+# so the next page is found by key instead of OFFSET.
+
+DEFAULT_CACHE_PAGES = 8
+PAGE_MAX_AGE_SECONDS = 30
+PREFETCH_WAIT_SECONDS = 2
+
+
+class PageCache:
+    """ LRU-bounded page cache with background read-ahead. """
+
+    def __init__(self, connection_params, max_pages=DEFAULT_CACHE_PAGES, max_age=PAGE_MAX_AGE_SECONDS):
+        self.connection_params = dict(connection_params)
+        self.max_pages = max(1, max_pages)
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+        self._pages = OrderedDict()  # key -> (fetched_at, page)
+        self._pending = {}  # key -> Future
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._conn = self._cursor = None  # only touched by the worker thread
+
+    #--------------------------------------------------------------------
+    # GUI thread
+
+    def get(self, table_name, offset, limit, view=None, wait=PREFETCH_WAIT_SECONDS):
+        """
+        Returns the cached page, waiting up to `wait` seconds if its prefetch is still running.
+
+        Args:
+            view (dict, optional): sort_column / descending / columns the page was read with.
+
+        Returns:
+            dict or None: The page (see fetch_table_page()), or None on a miss.
+        """
+        key = self._key(table_name, offset, limit, view)
+        with self._lock:
+            page = self._fresh(key)
+            future = self._pending.get(key) if page is None else None
+
+        if page is None and future is not None:
+            try:
+                future.result(timeout=wait)
+            except FutureTimeout:
+                print(f"⚠️ Prefetch of {table_name} @ {offset} still running; fetching directly.")
+            except Exception as e:
+                print(f"⚠️ Prefetch of {table_name} @ {offset} failed: {e}")
+            with self._lock:
+                page = self._fresh(key)
+
+        if page is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return page
+
+    def put(self, table_name, offset, limit, page, view=None):
+        """ Stores a page the GUI fetched itself, so going back to it later is free. """
+        with self._lock:
+            self._store(self._key(table_name, offset, limit, view), page)
+
+    def prefetch(self, table_name, offset, limit, view=None, seek=None):
+        """
+        Queues a background fetch of the page unless it is cached or already on its way.
+
+        Args:
+            seek (dict, optional): after= / before= keyset bound passed to fetch_table_page().
+        """
+        if offset < 0:
+            return
+        key = self._key(table_name, offset, limit, view)
+        fetch_args = {**(view or {}), **(seek or {})}
+        with self._lock:
+            if self._fresh(key, touch=False) is not None or key in self._pending:
+                return
+            generation = self._generation
+            self._pending[key] = self._pool.submit(self._fetch, key, generation, fetch_args)
+
+    def invalidate(self, table_name=None):
+        """ Drops every cached page of `table_name` (or of all tables). """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._pages if table_name is None or key[0] == table_name]:
+                del self._pages[key]
+
+    def close(self):
+        """ Stops the worker and closes its connection. """
+        self.invalidate()
+        self._pool.submit(self._disconnect)
+        self._pool.shutdown(wait=False)
+
+    #--------------------------------------------------------------------
+    # Internals (call with the lock held)
+
+    @staticmethod
+    def _key(table_name, offset, limit, view):
+        view = view or {}
+        columns = view.get("columns")
+        return (table_name, offset, limit, view.get("sort_column"), view.get("descending", True),
+                tuple(columns) if columns else None)
+
+    def _fresh(self, key, touch=True):
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        fetched_at, page = entry
+        if time.monotonic() - fetched_at > self.max_age:
+            del self._pages[key]
+            return None
+        if touch:
+            self._pages.move_to_end(key)
+        return page
+
+    def _store(self, key, page):
+        self._pages[key] = (time.monotonic(), page)
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+    #--------------------------------------------------------------------
+    # Worker thread
+
+    def _fetch(self, key, generation, fetch_args):
+        table_name, offset, limit = key[:3]
+        try:
+            if self._conn is None:
+                self._conn, self._cursor = connect_to_database(**self.connection_params)
+            page = fetch_table_page(self._cursor, table_name, limit, offset, count_mode=None, **fetch_args)
+        except Exception:
+            self._disconnect()  # reconnect on the next prefetch
+            with self._lock:
+                self._pending.pop(key, None)
+            raise
+
+        with self._lock:
+            self._pending.pop(key, None)
+            if generation == self._generation:
+                self._store(key, page)
+        return page
+
+    def _disconnect(self):
+        self._conn, self._cursor = close_connection(self._conn, self._cursor)
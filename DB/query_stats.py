@@ -0,0 +1,279 @@
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from logging.handlers import RotatingFileHandler
+
+# Query instrumentation
+# ---------------------------
+# connect_to_database() wraps the MariaDB connection in an
+# InstrumentedConnection, and every cursor it hands out is an
+# InstrumentedCursor. Both behave exactly like the real objects (anything
+# not overridden is passed straight through), but execute()/executemany()
+# are timed and recorded in QUERY_STATS:
+#
+#   - statements are grouped by fingerprint (literals and IN-lists
+#     replaced with ?, whitespace collapsed)
+#   - each fingerprint keeps call count, total/max latency, rows and a
+#     latency histogram, plus which app function issued it
+#   - anything slower than the slow-query threshold is also written to
+#     slow_queries.log (rotated at 1 MB, 3 files kept), as its fingerprint
+#     only, so no literal or parameter value ever reaches the file
+#
+# The Query Stats panel on the options page reads QUERY_STATS.snapshot().
+#
+# InstrumentedConnection also keeps a prepared-statement registry: the hot
+# parameterized statements (job notes, costs, payments, key checks, single
+# column updates) go through connection.execute_prepared(), which keeps one
+# prepared cursor per distinct statement text. The statement is parsed by
+# the server once per connection and later calls only send the parameters
+# (binary protocol). A reconnect (see DB/reconnect.py) resets the registry
+# and statements are re-prepared on first use.
+
+SLOW_QUERY_LOG = "slow_queries.log"
+DEFAULT_SLOW_QUERY_MS = 250
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+MAX_PREPARED_STATEMENTS = 64  # server-side statements held per connection
+REPREPARE_ERRORS = (1243, 1615)  # unknown statement handler, statement needs re-prepare
+
+_slow_logger = logging.getLogger("dbdoc.slow_queries")
+_slow_logger.propagate = False
+_slow_logger.setLevel(logging.WARNING)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w`])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement):
+    """ Normalises a statement so calls that differ only in values group together. """
+    text = _STRING_LITERAL.sub("?", str(statement))
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    return _WHITESPACE.sub(" ", text).strip().rstrip(";")
+
+def _find_caller():
+    """ Returns 'file.py:function' for the first frame outside this module. """
+    frame = sys._getframe(2)
+    this_file = __file__
+    while frame and frame.f_code.co_filename == this_file:
+        frame = frame.f_back
+    if not frame:
+        return "?"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}"
+
+
+class QueryStats:
+    """ Thread-safe aggregate of statement timings, grouped by fingerprint. """
+
+    def __init__(self, slow_query_ms=DEFAULT_SLOW_QUERY_MS, slow_log_path=SLOW_QUERY_LOG):
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_path = slow_log_path
+        self._lock = threading.Lock()
+        self._log_ready = False
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.entries = {}
+            self.started = time.time()
+
+    def _ensure_slow_log(self):
+        if self._log_ready:
+            return
+        self._log_ready = True
+        try:
+            handler = RotatingFileHandler(self.slow_log_path, maxBytes=1_000_000, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+            _slow_logger.addHandler(handler)
+        except OSError as e:
+            print(f"⚠️ Could not open slow query log: {e}")
+
+    def record(self, statement, elapsed_ms, rows, caller, params=None):
+        key = fingerprint(statement)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "histogram": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+                    "callers": Counter(),
+                }
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += max(rows or 0, 0)
+            entry["histogram"][self._bucket(elapsed_ms)] += 1
+            entry["callers"][caller] += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            self._ensure_slow_log()
+            # Fingerprint only: literals and parameter values (passwords, notes, customer data) stay off disk
+            _slow_logger.warning(
+                f"{elapsed_ms:.1f} ms | rows={rows} | {caller} | {key}"
+                + (f" | {len(params)} param(s)" if isinstance(params, (list, tuple, dict)) and params else "")
+            )
+
+    @staticmethod
+    def _bucket(elapsed_ms):
+        for idx, limit in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= limit:
+                return idx
+        return len(HISTOGRAM_BUCKETS_MS)
+
+    @staticmethod
+    def percentile(histogram, fraction):
+        """ Upper bound (ms) of the bucket holding the given percentile; None if above the last bucket. """
+        total = sum(histogram)
+        if not total:
+            return 0
+        threshold, running = total * fraction, 0
+        for idx, count in enumerate(histogram):
+            running += count
+            if running >= threshold:
+                return HISTOGRAM_BUCKETS_MS[idx] if idx < len(HISTOGRAM_BUCKETS_MS) else None
+        return None
+
+    def snapshot(self, order_by="total_ms"):
+        """
+        Returns a list of per-fingerprint dicts (copies), sorted descending by `order_by`.
+        Each has fingerprint, count, total_ms, avg_ms, max_ms, p95_ms, rows, histogram and top_caller.
+        """
+        with self._lock:
+            rows = []
+            for key, entry in self.entries.items():
+                rows.append({
+                    "fingerprint": key,
+                    "count": entry["count"],
+                    "total_ms": entry["total_ms"],
+                    "avg_ms": entry["total_ms"] / entry["count"],
+                    "max_ms": entry["max_ms"],
+                    "p95_ms": self.percentile(entry["histogram"], 0.95),
+                    "rows": entry["rows"],
+                    "histogram": list(entry["histogram"]),
+                    "top_caller": entry["callers"].most_common(1)[0][0],
+                })
+        return sorted(rows, key=lambda row: row[order_by], reverse=True)
+
+
+QUERY_STATS = QueryStats()
+
+
+class InstrumentedCursor:
+    """ Cursor proxy that times execute()/executemany() into QueryStats. """
+
+    def __init__(self, cursor, connection, stats=QUERY_STATS):
+        self._cursor = cursor
+        self._connection = connection
+        self._stats = stats
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def _timed(self, method, statement, params, **kwargs):
+        started = time.perf_counter()
+        try:
+            if params is None:
+                return method(statement, **kwargs)
+            return method(statement, params, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            try:
+                rows = self._cursor.rowcount
+            except Exception:
+                rows = -1
+            self._stats.record(statement, elapsed_ms, rows, _find_caller(), params)
+
+    def execute(self, statement, params=None, **kwargs):
+        return self._timed(self._cursor.execute, statement, params, **kwargs)
+
+    def executemany(self, statement, seq_of_params, **kwargs):
+        return self._timed(self._cursor.executemany, statement, seq_of_params, **kwargs)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    def __getattr__(self, attr):
+        return getattr(self._cursor, attr)
+
+
+class InstrumentedConnection:
+    """ Connection proxy whose cursors are InstrumentedCursors, with a prepared-statement registry. """
+
+    def __init__(self, conn, stats=QUERY_STATS, max_prepared=MAX_PREPARED_STATEMENTS):
+        self._conn = conn
+        self._stats = stats
+        self._prepared = OrderedDict()  # statement text -> prepared cursor, least recently used first
+        self.max_prepared = max_prepared
+        self.prepared_hits = 0
+        self.prepared_misses = 0
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs), self, self._stats)
+
+    def execute_prepared(self, statement, params=()):
+        """
+        Runs `statement` on the prepared cursor kept for it, preparing it on first use.
+        Results are buffered, so a partly read result never blocks the next statement.
+
+        Returns:
+            InstrumentedCursor: The cursor holding the result (fetch from it, don't close it).
+        """
+        cursor = self._prepared.pop(statement, None)
+        if cursor is None:
+            cursor = self.cursor(prepared=True, buffered=True)
+            self.prepared_misses += 1
+        else:
+            self.prepared_hits += 1
+        self._prepared[statement] = cursor
+
+        while len(self._prepared) > self.max_prepared:
+            _, evicted = self._prepared.popitem(last=False)
+            self._close_quietly(evicted)  # frees the server-side statement
+
+        try:
+            cursor.execute(statement, params)
+        except Exception as e:
+            self._close_quietly(self._prepared.pop(statement, None))
+            if getattr(e, "errno", None) not in REPREPARE_ERRORS:
+                raise
+            # The server dropped the statement (e.g. the table changed): prepare it again once
+            cursor = self._prepared[statement] = self.cursor(prepared=True, buffered=True)
+            cursor.execute(statement, params)
+        return cursor
+
+    def prepared_statement_count(self):
+        return len(self._prepared)
+
+    def close(self):
+        for cursor in self._prepared.values():
+            self._close_quietly(cursor)
+        self._prepared.clear()
+        self._conn.close()
+
+    @staticmethod
+    def _close_quietly(cursor):
+        if cursor is None:
+            return
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    def __getattr__(self, attr):
+        return getattr(self._conn, attr)
@@ -0,0 +1,104 @@
+import json
+import os
+from collections import OrderedDict
+
+from DB.data_access import get_job_summaries
+
+# RecentJobs Class
+# ---------------------------
+# Most-recently-used list of the jobs opened at the counter (notes editor,
+# customer lookup, jump-to-record in the jobs table), newest first.
+#
+# Each entry keeps a one-line summary (customer, device, status) so the
+# Job ID prompt can offer "12345 — Jane Doe · Apple Phone · In Progress"
+# without querying. The ids are saved to RECENT_JOBS_FILE; after login the
+# summaries of all of them are preloaded with one indexed query, and a job
+# opened from the list then costs only the job's own batch (JobCache).
+
+RECENT_JOBS_FILE = "recent_jobs.json"
+MAX_RECENT_JOBS = 15
+
+
+class RecentJobs:
+    """ Bounded MRU of job ids with cached summaries. """
+
+    def __init__(self, path=RECENT_JOBS_FILE, capacity=MAX_RECENT_JOBS):
+        self.path = path
+        self.capacity = capacity
+        self.jobs = OrderedDict()  # job_id (str) -> summary dict or None, newest first
+        self._load()
+
+    def touch(self, job_id, summary=None):
+        """ Moves a job to the front, keeping (or replacing) its summary. """
+        job_id = str(job_id)
+        known = self.jobs.pop(job_id, None)
+        self.jobs[job_id] = summary or known
+        self.jobs.move_to_end(job_id, last=False)
+        while len(self.jobs) > self.capacity:
+            self.jobs.popitem(last=True)
+        self._save()
+
+    def forget(self, job_id):
+        if self.jobs.pop(str(job_id), None) is not None:
+            self._save()
+
+    def preload(self, cursor, refresh=False):
+        """ Fetches the missing summaries (all of them with refresh=True) in one query; drops deleted jobs. """
+        wanted = [job_id for job_id, summary in self.jobs.items() if refresh or summary is None]
+        if not wanted:
+            return
+        try:
+            summaries = get_job_summaries(cursor, wanted)
+        except Exception as e:
+            print(f"⚠️ Could not load recent jobs: {e}")
+            return
+
+        for job_id in wanted:
+            if job_id in summaries:
+                self.jobs[job_id] = summaries[job_id]
+            else:
+                del self.jobs[job_id]  # deleted since
+        self._save()
+
+    def choices(self):
+        """ Labels for the Job ID prompt, newest first (each starts with the id). """
+        return [self.label(job_id) for job_id in self.jobs]
+
+    def label(self, job_id):
+        summary = self.jobs.get(str(job_id)) or {}
+        customer = " ".join(str(summary[col]) for col in ("FirstName", "SurName") if summary.get(col))
+        device = " ".join(str(summary[col]) for col in ("DeviceBrand", "DeviceType") if summary.get(col))
+        details = " · ".join(part for part in (customer, device, summary.get("Status")) if part)
+        return f"{job_id} — {details}" if details else str(job_id)
+
+    #--------------------------------------------------------------------
+    # Persistence (ids only: summaries are re-read after login)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as file:
+                for job_id in json.load(file)[:self.capacity]:
+                    self.jobs[str(job_id)] = None
+        except Exception as e:
+            print(f"⚠️ Failed to load recent jobs: {e}")
+
+    def _save(self):
+        try:
+            with open(self.path, "w") as file:
+                json.dump(list(self.jobs), file)
+        except Exception as e:
+            print(f"⚠️ Failed to save recent jobs: {e}")
+
+
+def summary_from_job_cache(job_cache):
+    """ Builds the recent-jobs summary from an open JobCache, so no query is needed. """
+    summary = {"JobID": job_cache.job_id}
+    if job_cache.details:
+        summary.update(zip(job_cache.detail_columns, job_cache.details))
+    if job_cache.contact:
+        summary.update(zip(("FirstName", "SurName"), job_cache.contact))
+    if job_cache.notes:
+        summary["Status"] = job_cache.notes[1]
+    return summary
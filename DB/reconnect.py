@@ -0,0 +1,303 @@
+import re
+import threading
+import time
+
+from DB.query_stats import InstrumentedConnection, InstrumentedCursor, QUERY_STATS, MAX_PREPARED_STATEMENTS
+
+# Resilient connection
+# ---------------------------
+# connect_to_database() returns a ResilientConnection: an
+# InstrumentedConnection that notices when the server connection has died
+# (server restart, network blip, idle timeout) and reconnects in place with
+# the parameters it was opened with. Every cursor handed out is re-created
+# on the new connection the next time it is used, so the app, open dialogs
+# and the dashboard keep their conn/cursor objects and carry on without a
+# re-login.
+#
+#   - every connect attempt gives up after CONNECT_TIMEOUT_SECONDS
+#   - worker threads (prefetch, change feed, backups) retry in place,
+#     sleeping RECONNECT_DELAYS between attempts
+#   - the GUI thread never sleeps: it makes one attempt, and when that
+#     fails the connection goes "disconnected" and calls fail fast with
+#     ConnectionLost until next_retry_seconds() has passed. The app drives
+#     the retries from a timer with try_reconnect(), backing off from
+#     RETRY_BASE_SECONDS up to RETRY_MAX_SECONDS
+#   - a read (SELECT / SHOW / DESCRIBE / EXPLAIN) that hit the drop is run
+#     again on the new connection, unless writes were pending in the
+#     transaction (they were lost with the connection)
+#   - a write that hit the drop is never replayed (it may or may not have
+#     reached the server): the connection is restored and ConnectionLost is
+#     raised so the caller reports that the change was not saved
+#   - the prepared-statement registry is reset; statements are prepared
+#     again on first use
+#   - session state is carried over: the last USE and every session SET
+#     (e.g. FOREIGN_KEY_CHECKS during a restore) run through a cursor are
+#     replayed on the new connection before anything else runs on it; when
+#     that fails the attempt counts as failed
+#   - state changes ("reconnecting", "connected", "disconnected") go to the
+#     listeners added with add_state_listener(), e.g. the main window's
+#     status bar
+#
+# After close() (logout) the connection never reconnects.
+
+CONNECT_TIMEOUT_SECONDS = 5
+RECONNECT_DELAYS = (0, 0.5, 1, 2, 4)  # seconds before each attempt, worker threads only
+RETRY_BASE_SECONDS = 2
+RETRY_MAX_SECONDS = 60
+
+CONNECTION_ERRORS = (
+    1927,  # connection killed
+    2002, 2003,  # can't connect
+    2006,  # server has gone away
+    2013,  # lost connection during query
+    2055,  # lost connection (system error)
+    4031,  # disconnected by the server (idle timeout)
+)
+_CONNECTION_MESSAGES = ("gone away", "lost connection", "not connected", "connection was killed", "broken pipe")
+_READ_STATEMENT = re.compile(r"^\s*(SELECT|SHOW|DESCRIBE|DESC|EXPLAIN)\b", re.IGNORECASE)
+_USE_STATEMENT = re.compile(r"^\s*USE\b", re.IGNORECASE)
+_SESSION_SET_STATEMENT = re.compile(  # SET PASSWORD / GLOBAL / TRANSACTION don't outlive the call or the session
+    r"^\s*SET\s+(?!PASSWORD\b|GLOBAL\b|TRANSACTION\b|@@GLOBAL\.)(?:SESSION\s+|LOCAL\s+|@@SESSION\.|@@LOCAL\.|@@)?(@?\w+)",
+    re.IGNORECASE,
+)
+
+
+class ConnectionLost(Exception):
+    """ The database connection dropped and the statement could not be completed. """
+
+
+def is_connection_error(error):
+    """ True when `error` means the connection itself is gone (not a bad statement). """
+    if isinstance(error, ConnectionLost):
+        return False
+    if getattr(error, "errno", None) in CONNECTION_ERRORS:
+        return True
+    message = str(error).lower()
+    return any(text in message for text in _CONNECTION_MESSAGES)
+
+def is_read_statement(statement):
+    return bool(_READ_STATEMENT.match(str(statement)))
+
+
+class ResilientCursor(InstrumentedCursor):
+    """ InstrumentedCursor that follows its connection across reconnects. """
+
+    def __init__(self, cursor, connection, stats, cursor_args=(), cursor_kwargs=None):
+        super().__init__(cursor, connection, stats)
+        self._cursor_args = cursor_args
+        self._cursor_kwargs = cursor_kwargs or {}
+        self._epoch = connection.epoch
+        self._closed = False
+
+    def execute(self, statement, params=None, **kwargs):
+        return self._run(super().execute, statement, params, is_read_statement(statement), **kwargs)
+
+    def executemany(self, statement, seq_of_params, **kwargs):
+        return self._run(super().executemany, statement, seq_of_params, False, **kwargs)
+
+    def close(self):
+        self._closed = True
+        if self._epoch == self._connection.epoch:
+            self._cursor.close()
+        # else: it belonged to the dropped connection, nothing to free
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self, method, statement, params, is_read, **kwargs):
+        self._sync()
+        try:
+            result = method(statement, params, **kwargs)
+        except Exception as e:
+            if not is_connection_error(e):
+                raise
+            connection = self._connection
+            retry = is_read and not connection.in_transaction
+            connection.reconnect(e)
+            self._sync()
+            if not retry:
+                what = "uncommitted changes were lost" if is_read else "the last change was not saved"
+                raise ConnectionLost(f"The database connection dropped and was restored, but {what}. Please try again.") from e
+            print(f"🔁 Retrying read after reconnect: {str(statement).strip()[:60]}")
+            result = method(statement, params, **kwargs)
+
+        if not is_read:
+            self._connection.in_transaction = True
+            self._connection.remember_session_statement(statement, params)
+        return result
+
+    def _sync(self):
+        """ Re-creates the underlying cursor if the connection was replaced since it was opened. """
+        if self._closed or self._epoch == self._connection.epoch:
+            return
+        self._cursor = self._connection.raw_connection.cursor(*self._cursor_args, **self._cursor_kwargs)
+        self._epoch = self._connection.epoch
+
+
+class ResilientConnection(InstrumentedConnection):
+    """ InstrumentedConnection that reconnects in place when the server connection dies. """
+
+    def __init__(self, conn, connect, stats=QUERY_STATS, max_prepared=MAX_PREPARED_STATEMENTS):
+        """
+        Args:
+            conn: The open MariaDB connection.
+            connect (callable): Opens a new MariaDB connection with the same parameters.
+        """
+        super().__init__(conn, stats, max_prepared)
+        self._connect = connect
+        self.epoch = 0  # bumped on every reconnect
+        self.state = "connected"
+        self.in_transaction = False  # writes since the last commit/rollback
+        self.reconnects = 0
+        self._closed = False
+        self._failures = 0  # failed attempts since the connection was last up
+        self._next_attempt_at = 0.0
+        self._listeners = []
+        self._use_statement = None  # last USE, replayed after a reconnect
+        self._session_settings = {}  # variable -> (SET statement, params), replayed after a reconnect
+
+    @property
+    def raw_connection(self):
+        return self._conn
+
+    def add_state_listener(self, callback):
+        """ callback(state, message) is called on every state change, on the thread that noticed it. """
+        self._listeners.append(callback)
+
+    def cursor(self, *args, **kwargs):
+        try:
+            cursor = self._conn.cursor(*args, **kwargs)
+        except Exception as e:
+            if not is_connection_error(e):
+                raise
+            self.reconnect(e)
+            cursor = self._conn.cursor(*args, **kwargs)
+        return ResilientCursor(cursor, self, self._stats, args, kwargs)
+
+    def execute_prepared(self, statement, params=()):
+        cursor = super().execute_prepared(statement, params)
+        self._prepared[statement] = cursor  # a reconnect during the call reset the registry
+        return cursor
+
+    def commit(self):
+        self._finish(self._conn.commit)
+
+    def rollback(self):
+        self._finish(self._conn.rollback)
+
+    def _finish(self, method):
+        try:
+            method()
+        except Exception as e:
+            if not is_connection_error(e):
+                raise
+            self.reconnect(e)
+            raise ConnectionLost("The database connection dropped and was restored, but the last change was not saved. Please try again.") from e
+        self.in_transaction = False
+
+    def reconnect(self, error=None):
+        """
+        Replaces the dead connection with a new one. Worker threads back off between
+        attempts; the GUI thread makes a single attempt (see try_reconnect()).
+
+        Raises:
+            ConnectionLost: When no attempt succeeded (or the connection was closed on purpose).
+        """
+        if self._closed:
+            raise ConnectionLost("Not connected to the database (logged out).")
+
+        if self.state == "connected":
+            print(f"🔌 Database connection lost: {error}")
+            self._close_quietly(self._conn)
+            self._prepared.clear()  # the statements died with the old connection
+            self.in_transaction = False
+
+        if threading.current_thread() is threading.main_thread():
+            if self.state == "disconnected" and time.monotonic() < self._next_attempt_at:
+                raise ConnectionLost("The database is unreachable; reconnecting in the background.")
+            delays = RECONNECT_DELAYS[:1]
+        else:
+            delays = RECONNECT_DELAYS
+
+        for attempt, delay in enumerate(delays, start=1):
+            time.sleep(delay)
+            if self._attempt(f"attempt {attempt}/{len(delays)}"):
+                return
+        raise ConnectionLost(f"Lost the connection to the database and could not reconnect: {error}")
+
+    def try_reconnect(self):
+        """
+        One reconnect attempt that never raises, for a timer retrying in the background.
+
+        Returns:
+            bool: True when the connection is up.
+        """
+        if self._closed:
+            return False
+        if self.state == "connected":
+            return True
+        return self._attempt(f"retry {self._failures + 1}")
+
+    def remember_session_statement(self, statement, params=None):
+        """ Records a USE or session SET so reconnect() can restore it. """
+        statement = str(statement)
+        if _USE_STATEMENT.match(statement):
+            self._use_statement = (statement, params)
+            return
+        match = _SESSION_SET_STATEMENT.match(statement)
+        if match:
+            self._session_settings[match.group(1).lower()] = (statement, params)
+
+    def _restore_session(self, conn):
+        """ Replays the recorded USE and SET statements on a new connection. """
+        statements = [self._use_statement] if self._use_statement else []
+        statements += self._session_settings.values()
+        if not statements:
+            return
+        cursor = conn.cursor()
+        try:
+            for statement, params in statements:
+                cursor.execute(statement, params)
+        finally:
+            cursor.close()
+
+    def next_retry_seconds(self):
+        """ Seconds until the next background attempt is due. """
+        return max(0.0, self._next_attempt_at - time.monotonic())
+
+    def _attempt(self, label):
+        self._set_state("reconnecting", f"🔌 Connection lost — reconnecting ({label})…")
+        try:
+            conn = self._connect()
+            try:
+                self._restore_session(conn)
+            except Exception:
+                self._close_quietly(conn)
+                raise
+            self._conn = conn
+        except Exception as e:
+            print(f"⚠️ Reconnect {label} failed: {e}")
+            self._failures += 1
+            delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (self._failures - 1))
+            self._next_attempt_at = time.monotonic() + delay
+            self._set_state("disconnected", f"❌ Database unreachable — retrying in {delay} s")
+            return False
+
+        self.epoch += 1
+        self.reconnects += 1
+        self._failures = 0
+        self._set_state("connected", "✅ Reconnected to the database")
+        return True
+
+    def close(self):
+        self._closed = True
+        super().close()
+
+    def _set_state(self, state, message):
+        self.state = state
+        print(message)
+        for callback in list(self._listeners):
+            try:
+                callback(state, message)
+            except Exception as e:
+                print(f"⚠️ Connection state listener failed: {e}")
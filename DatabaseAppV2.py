@@ -1,20 +1,23 @@
 # ─────────────────────────────────────────────────────────────────────────────
 # 📦 Standard Library
+import atexit
+import os
 import sys
 import threading
 from datetime import datetime
 
+# ⏱ Profiling has to be switched on before the heavy imports below to time them
+from UTILS import profiler
+if __name__ == "__main__":
+    profiler.enable_from_argv()
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 🛢 Database
 import mariadb
 
-# ─────────────────────────────────────────────────────────────────────────────
-# 📊 Data Handling & Visualization
-import pandas as pd
-
 # ─────────────────────────────────────────────────────────────────────────────
 # 🎨 PyQt5 Core & GUI
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPainter, QFont, QTextDocument
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog, QPrinterInfo
 from PyQt5.QtWidgets import (
@@ -27,19 +30,20 @@ from PyQt5.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
     QAbstractItemView,
+    QComboBox,
 )
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🧩 Project Modules
 
 # File operationsrootROOTroo
-from FILE_OPS.file_ops import load_schedule_on_startup, run_scheduled_backups
+from FILE_OPS.file_ops import load_schedule_on_startup, load_schedule_from_json, run_scheduled_backups, SCHEDULE_FILE_PATH
 from FILE_OPS.config import load_settings
+from FILE_OPS.backup_service import is_service_active
 
 # UI components
 from UI.splashscreen import SplashScreen
-from UI.initthread import InitializationThread
-from UI.tabbed_dashboard import TabbedDashboard
+from UI.initthread import InitializationThread, warm_imports, ping_database
 from UI.ui import (
     add_record_dialog,
     create_login_page,
@@ -55,12 +59,17 @@ from UI.ui import (
     refresh_page,
     save_settings,
     update_table_offset_ui,
+    format_page_label,
+    update_page_buttons,
     load_table,
     populate_table,
     confirm_deletion_bulk,
     confirm_deletion,
     show_info,
     create_customer_report_window,
+    bulk_edit_dialog,
+    choose_columns_dialog,
+    JOB_STATUSES,
 )
 from UI.ui_edit_notes import (
     JobDetailsDialog,
@@ -79,33 +88,40 @@ from DB.data_access import (
     connect_to_database,
     fetch_data,
     fetch_primary_key_column,
-    fetch_table_data_with_columns,
+    fetch_table_page,
+    page_row_bounds,
+    projected_columns,
+    locate_table_row,
     fetch_tables,
     insert_record,
-    update_auto_increment_if_needed,
+    note_key_change,
+    set_key_maintenance_policy,
     update_column,
     update_primary_key,
     update_status,
-    get_customer_id_by_job,
-    get_customer_info,
-    get_jobs_by_customer,
-    get_all_table_names,
-    get_table_data_for_customer,
+    get_customer_report,
+    get_table_schema,
+    search_table_rows,
+    update_column_bulk,
+    update_status_bulk,
     get_customer_contact,
-    get_job_notes,
-    update_job_notes,
 )
 
 # Error handling
 from UTILS.error_utils import handle_db_error, log_error
 
-# Dashboard (Tabbed)
-from UI.tabbed_dashboard import TabbedDashboard
+# Import-time reporting for the deferred modules
+from UTILS.lazy_import import print_import_report
 from UI.ui import confirm_deletion, show_info
 
 from UI.ui_edit_notes import JobDetailsDialog, JobNotesEditor, CommunicationsDialog, CostsDialog, PaymentsDialog, AddToOrdersDialog, OrdersDialog
 
-from DB.data_access import get_job_notes, update_job_notes
+from DB.job_cache import JobCache
+from DB.change_feed import current_session_id, is_change_feed_installed
+from DB.page_cache import PageCache, DEFAULT_CACHE_PAGES
+from DB.recent_jobs import RecentJobs, summary_from_job_cache
+from UI.infinite_scroll import InfiniteScroller, INITIAL_CHUNK_ROWS
+from UI.change_poller import ChangeFeedPoller, dispatch_changes
 
 from Templates.job_report_template import JOB_REPORT_TEMPLATE
 
@@ -120,16 +136,20 @@ class DatabaseApp(QMainWindow):
     SETTINGS_FILE = "settings.json"
     SCHEDULE_FILE_PATH = "backup_schedule.json"
     
-    def __init__(self): #MAIN
+    def __init__(self, startup_results=None): #MAIN
         super().__init__()
-        
+        startup_results = startup_results or {}
 
-        # ✅ Load and apply scheduled jobs
-        load_schedule_on_startup(self)
+        # ✅ Load and apply scheduled jobs (already read by the startup pipeline if available),
+        #    unless the standalone backup service is handling them
+        if is_service_active():
+            print("🛰 Backup service is running; in-app scheduled backups are disabled.")
+        else:
+            load_schedule_on_startup(self, startup_results.get("schedule"))
 
         self.is_refreshing = False
-        self.is_backup_running = False
         self.is_adding_new_record = False
+        self.recent_jobs = RecentJobs()  # 🕘 jobs opened at the counter, for the Job ID prompts
         
 
         self.setWindowTitle("DBDoc V2 - Database Management System")
@@ -140,16 +160,19 @@ class DatabaseApp(QMainWindow):
             QLineEdit { background-color: #2A2A2A; color: #FFFFFF; border: 1px solid #444; padding: 5px; border-radius: 5px; }
             QPushButton { background-color: #3A9EF5; color: #FFFFFF; border-radius: 5px; padding: 10px; }
             QPushButton:hover { background-color: #1D7DD7; }
+            QStatusBar { color: #CCCCCC; }
         """)
 
         # ✅ Load database settings
-        self.database_config = load_settings()
+        self.database_config = startup_results.get("settings") or load_settings()
+        set_key_maintenance_policy(self.database_config.get("key_maintenance"))
 
         # ✅ UI Page setup
         self.central_widget = QStackedWidget()
         self.setCentralWidget(self.central_widget)
 
-        self.login_page = create_login_page(self)
+        with profiler.span("create_login_page", "ui"):
+            self.login_page = create_login_page(self)
         self.settings_page, self.host_entry, self.database_entry, self.ssl_checkbox, self.ssl_path_entry = create_settings_page(
             self.database_config,
             lambda: save_settings(self.database_config, self.host_entry, self.database_entry, self.ssl_checkbox, self.ssl_path_entry, self.SETTINGS_FILE, self.central_widget, self.login_page, self),
@@ -179,8 +202,116 @@ class DatabaseApp(QMainWindow):
             connect_func=connect_to_database,
             on_success_callback=main_menu_page
         )
+        if getattr(self, "conn", None):
+            if hasattr(self.conn, "add_state_listener"):
+                self.conn.add_state_listener(self.on_connection_state)
+            self.start_change_feed()
+            self.recent_jobs.preload(self.cursor, refresh=True)  # one query for every recent job's summary
     def logout(self): #MAIN
         handle_logout(self)
+        if not getattr(self, "conn", None):
+            self.stop_change_feed()
+            self.close_page_cache()
+
+    def on_connection_state(self, state, message): #MAIN
+        """
+        Shows reconnects of the GUI connection in the status bar and drives the
+        background retries while the database is unreachable (see DB/reconnect.py).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self.statusBar().showMessage(message, 10000 if state == "connected" else 0)
+        self.statusBar().repaint()  # a reconnect attempt may still be running on this thread
+        if getattr(self, "dialog", None) and self.dialog.isVisible():
+            self._update_status(message)
+            self.status_bar.repaint()
+
+        if state == "disconnected" and not getattr(self, "reconnect_pending", False):
+            self.reconnect_pending = True
+            QTimer.singleShot(int(self.conn.next_retry_seconds() * 1000), self.retry_connection)
+        elif state == "connected":
+            QTimer.singleShot(0, self.refresh_own_session)  # not from inside the statement that hit the drop
+
+    def retry_connection(self): #MAIN
+        """ Timer slot: one reconnect attempt; a failure schedules the next one via on_connection_state. """
+        self.reconnect_pending = False
+        conn = getattr(self, "conn", None)
+        if conn is not None and hasattr(conn, "try_reconnect"):
+            conn.try_reconnect()
+
+    def refresh_own_session(self): #MAIN
+        """ After a reconnect the GUI has a new CONNECTION_ID(): its own edits must not come back as live updates. """
+        poller = getattr(self, "change_poller", None)
+        if not poller or not getattr(self, "conn", None):
+            return
+        try:
+            poller.ignore_session(current_session_id(self.cursor))
+        except Exception as e:
+            print(f"⚠️ Could not refresh the live updates session: {e}")
+
+    def start_change_feed(self): #MAIN
+        """ Starts polling for other terminals' changes if live updates are enabled for this database. """
+        self.stop_change_feed()
+        params = getattr(self, "connection_params", None)
+        try:
+            if not params or not is_change_feed_installed(self.cursor):
+                return
+            own_session = current_session_id(self.cursor)
+        except Exception as e:
+            print(f"⚠️ Live updates unavailable: {e}")
+            return
+
+        self.change_poller = ChangeFeedPoller(params, ignore_sessions=[own_session], parent=self)
+        self.change_poller.changed.connect(self.handle_data_changes)
+        self.change_poller.state.connect(lambda state: print(f"🔔 Live updates: {state}"))
+        self.change_poller.start()
+
+    def stop_change_feed(self): #MAIN
+        poller = getattr(self, "change_poller", None)
+        if poller:
+            poller.stop()
+            self.change_poller = None
+
+    def handle_data_changes(self, changes): #MAIN
+        """ Runs on the GUI thread for every ChangeSet the poller emits. """
+        cache = getattr(self, "page_cache", None)
+        if cache:
+            for table_name in changes.tables:
+                cache.invalidate(table_name)
+        try:
+            self.on_data_changed(changes)
+        except RuntimeError as e:  # the table view's widgets were already deleted
+            print(f"⚠️ Table view not updated: {e}")
+        dispatch_changes(changes, skip=self)
+
+    def on_data_changed(self, changes): #MAIN
+        """ Refreshes the open table view if its table changed, unless a cell is being edited. """
+        table_widget = getattr(self, "table_widget", None)
+        dialog = getattr(self, "dialog", None)
+        if not table_widget or not dialog or not dialog.isVisible():
+            return
+        if not changes.touches(self.current_table_name):
+            return
+        if self.is_refreshing or table_widget.state() == QAbstractItemView.EditingState:
+            QTimer.singleShot(1000, lambda: self.handle_data_changes_retry(changes))  # try again after the edit
+            return
+
+        self.refresh_table(suppress_status=True)
+        now = datetime.now().strftime("%H:%M:%S")
+        self.status_bar.setText(
+            f"🔔 {len(changes.keys(self.current_table_name))} row(s) changed on another terminal ({now})"
+        )
+
+    def handle_data_changes_retry(self, changes): #MAIN
+        try:
+            self.on_data_changed(changes)
+        except RuntimeError:
+            pass  # view closed in the meantime
+
+    def closeEvent(self, event): #MAIN
+        self.stop_change_feed()
+        self.close_page_cache()
+        super().closeEvent(event)
 
 #---------------------------------------------------------------------------------
    
@@ -189,6 +320,8 @@ class DatabaseApp(QMainWindow):
     #============================================
     
     def dashboard_page(self): #MAIN
+            from UI.tabbed_dashboard import TabbedDashboard  # pulls in matplotlib; deferred until first use
+
             dlg = TabbedDashboard(parent=self, cursor=self.cursor)
             dlg.exec_()
     def Customer_report(self, job_id=None):  # MAIN
@@ -198,19 +331,16 @@ class DatabaseApp(QMainWindow):
                 return
             job_id = job_id.strip()
 
-        customer_id = get_customer_id_by_job(self.cursor, job_id)
-        if not customer_id:
+        report = get_customer_report(self.cursor, job_id)
+        if not report:
             QMessageBox.critical(self, "Job Not Found", f"No job found with ID {job_id}.")
             return
 
-        customer_columns, customer_info = get_customer_info(self.cursor, customer_id)
-        job_columns, jobs_data = get_jobs_by_customer(self.cursor, customer_id)
-
-        tables = get_all_table_names(self.cursor, exclude_tables=["customers", "jobs", "walkins"])
-        related_tables_data = {
-            table: get_table_data_for_customer(self.cursor, table, customer_id)
-            for table in tables
-        }
+        customer_id, customer_columns, customer_info, job_columns, jobs_data, related_tables_data = report
+        job_row = next((row for row in jobs_data if str(row[job_columns.index("JobID")]) == str(job_id)), None)
+        summary = dict(zip(customer_columns, customer_info))
+        summary.update(zip(job_columns, job_row or ()))
+        self.recent_jobs.touch(job_id, summary)
 
         window = create_customer_report_window(
             self, customer_id, customer_info, customer_columns,
@@ -228,17 +358,21 @@ class DatabaseApp(QMainWindow):
             QMessageBox.warning(None, "⚠ Invalid Input", "Job ID must be a number.")
             return
 
-        result = get_job_notes(self.cursor, job_id)
-        if not result:
+        # ✅ One batch for the job and all of its related tabs
+        job_cache = JobCache(job_id, self.cursor, self.conn)
+        if not job_cache.exists:
             QMessageBox.critical(None, "❌ Job Not Found", f"No job found with ID {job_id}.")
+            self.recent_jobs.forget(job_id)
             return
+        self.recent_jobs.touch(job_id, summary_from_job_cache(job_cache))
 
         dialog = JobNotesEditor(
                                     job_id,
-                                    result,
-                                    save_callback=lambda *args: update_job_notes(self.cursor, *args),
+                                    job_cache.notes,
+                                    save_callback=lambda _job_id, *args: job_cache.save_notes(*args),
                                     cursor=self.cursor,
-                                    conn=self.conn
+                                    conn=self.conn,
+                                    job_cache=job_cache
                                 )
 
 
@@ -269,7 +403,7 @@ class DatabaseApp(QMainWindow):
 
     def view_tables(self): #MAIN
         try:
-            tables = fetch_tables(self.cursor)
+            tables = fetch_tables(self.cursor)  # without the change feed log
             display_tables_ui(tables, self.view_table_data)
         except Exception as e:
             QMessageBox.critical(None, "Error", str(e))
@@ -278,16 +412,31 @@ class DatabaseApp(QMainWindow):
         self.table_name = table_name
         self.current_table_name = table_name
         self.table_offset = 0
-        self.table_limit = 50
+        self.table_limit = self.database_config.get("page_size", 50)
+        scroll_mode = self.database_config.get("table_view_mode") == "scroll"
+        self.scroller = None
+        # Sort order and visible columns are remembered per table for the session
+        if not hasattr(self, "table_views"):
+            self.table_views = {}
+        self.table_view = self.table_views.setdefault(
+            table_name, {"sort_column": None, "descending": True, "columns": None}
+        )
 
         try:
-            data, columns = fetch_table_data_with_columns(
+            # ✅ One call: rows, columns, primary key and the total for "page X of Y"
+            page = fetch_table_page(
                 self.cursor,
                 table_name,
-                limit=self.table_limit,
-                offset=self.table_offset
+                limit=INITIAL_CHUNK_ROWS if scroll_mode else self.table_limit,
+                offset=self.table_offset,
+                count_mode=self.database_config.get("row_count"),
+                **self.table_view
             )
-            self.columns = columns
+            columns = page["columns"]
+            self.columns = (get_table_schema(self.cursor, table_name) or {}).get("columns") or columns
+            self.table_page = page
+            self.table_total_rows = page["total_rows"]
+            self.table_total_exact = page["total_exact"]
 
 
             self.table_widget = QTableWidget()
@@ -296,6 +445,11 @@ class DatabaseApp(QMainWindow):
             self.table_widget.setColumnCount(len(columns))
             self.table_widget.setHorizontalHeaderLabels(columns)
             self.table_widget.setAlternatingRowColors(True)
+
+            # ✅ Header clicks sort in SQL, not just the rows on screen
+            self.table_widget.setSortingEnabled(False)
+            self.table_widget.horizontalHeader().setSectionsClickable(True)
+            self.table_widget.horizontalHeader().sectionClicked.connect(self.sort_table_by)
             
 
             # ✅ Load table data
@@ -306,17 +460,23 @@ class DatabaseApp(QMainWindow):
                 update_status_callback=self.update_status_and_database,
                 table_offset=self.table_offset,
                 limit=self.table_limit,
-                event_filter=self
+                event_filter=self,
+                page=page
             )
+            scroll_mode = scroll_mode and bool(page["primary_key"])
+            if not scroll_mode:
+                self.cache_page(self.table_offset, page)
+                self.prefetch_neighbours()
 
             self.pagination_label = QLabel()
-            current_page = (self.table_offset // self.table_limit) + 1
-            self.pagination_label.setText(f"Page {current_page}")
+            self.pagination_label.setText(format_page_label(
+                self.table_offset, self.table_limit, self.table_total_rows, self.table_total_exact
+            ))
 
             # ✅ Create the dialog UI (next step)
             self.dialog, prev_btn, next_btn, self.refresh_button, self.status_bar = create_table_view_dialog(
             table_name=table_name,
-            columns=columns,
+            columns=self.columns,
             table_widget=self.table_widget,
             pagination_label=self.pagination_label,
             refresh_handler=self.refresh_table,
@@ -342,11 +502,32 @@ class DatabaseApp(QMainWindow):
 
             edit_handler=lambda: edit_selected_job(self),
             delete_handler=lambda: self.handle_delete_record(table_name, self.table_widget, columns[0]),
+            bulk_edit_handler=lambda: self.handle_bulk_edit(table_name, self.table_widget),
             print_handler=lambda: self.handle_print_record(table_name, self.table_widget, columns[0]),
-            close_handler=lambda: self.dialog.close()
+            close_handler=lambda: self.dialog.close(),
+            columns_handler=self.choose_visible_columns,
+            jump_handler=self.jump_to_record if page["primary_key"] else None
         )
+            self.page_buttons = (prev_btn, next_btn)
+            self.show_sort_indicator()
             self.table_widget.itemChanged.connect(self.update_database)
 
+            if scroll_mode:
+                # 📜 Chunks load as the grid scrolls; no Prev/Next
+                prev_btn.hide()
+                next_btn.hide()
+            else:
+                self.sync_page_buttons()
+                self.scroller = InfiniteScroller(
+                    table_widget=self.table_widget,
+                    cursor=self.cursor,
+                    table_name=table_name,
+                    page=page,
+                    update_status_callback=self.update_status_and_database,
+                    event_filter=self,
+                    status_callback=self.pagination_label.setText,
+                    view=self.table_view
+                )
 
             self.dialog.exec_()
 
@@ -361,25 +542,235 @@ class DatabaseApp(QMainWindow):
             return {col[0]: col[1] for col in self.cursor.fetchall()}
     def update_table_offset(self, change, prev_button, next_button): #MAIN
         # ✅ Compute new offset safely
-        new_offset = max(0, self.table_offset + change)
-        self.table_offset = new_offset  # ✅ Store for future pages
+        previous_offset = self.table_offset
+        self.table_offset = max(0, self.table_offset + change)  # ✅ Store for future pages
+        seek = self.page_seek(self.table_offset - previous_offset)
 
         print(f"🔄 Current offset is now: {self.table_offset}")  # Debug log
 
-        # ✅ Refresh the table with the correct offset
-        update_table_offset_ui(
+        # ✅ One page query per click; the total is only recounted on refresh
+        page = update_table_offset_ui(
             table_widget=self.table_widget,
             pagination_label=self.pagination_label,
             prev_button=prev_button,
             next_button=next_button,
-            fetch_function=self.fetch_data,  # Must reflect the new offset!
-            table_name=self.table_name,
+            fetch_function=lambda offset: self.fetch_page(offset, seek),
             current_offset=self.table_offset,
             limit=self.table_limit,
-            change=0,  # We've already applied it
-            refresh_callback=lambda: refresh_page(self),
-            parent=self
+            render_callback=lambda page: refresh_page(self, page=page),
+            total_rows=self.table_total_rows,
+            total_exact=self.table_total_exact
+        )
+        if page is None:
+            self.table_offset = previous_offset  # stayed on the last page
+        else:
+            self.table_page = page
+            self.prefetch_neighbours()
+
+    def sync_page_buttons(self): #MAIN
+        """ Enables Prev/Next for the page on screen from the offset and the table total. """
+        prev_button, next_button = self.page_buttons
+        update_page_buttons(
+            prev_button, next_button, self.table_offset, self.table_limit,
+            self.table_total_rows, self.table_total_exact
+        )
+
+    def page_seek(self, step): #MAIN
+        """
+        Keyset bound for moving one page from the page on screen: the next page starts
+        after its last row, the previous one ends before its first row. {} otherwise (OFFSET).
+        """
+        bounds = page_row_bounds(getattr(self, "table_page", None) or {})
+        if not bounds:
+            return {}
+        if step == self.table_limit:
+            return {"after": bounds[-1]}
+        if step == -self.table_limit:
+            return {"before": bounds[0]}
+        return {}
+
+    def get_page_cache(self): #MAIN
+        """ The session's read-ahead page cache (None when disabled with "page_cache_pages": 0). """
+        cache = getattr(self, "page_cache", None)
+        params = getattr(self, "connection_params", None)
+        if cache is None and params:
+            pages = self.database_config.get("page_cache_pages", DEFAULT_CACHE_PAGES)
+            if pages:
+                cache = self.page_cache = PageCache(params, max_pages=pages)
+        return cache
+
+    def close_page_cache(self): #MAIN
+        cache = getattr(self, "page_cache", None)
+        if cache:
+            print(f"📄 Page cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+            cache.close()
+            self.page_cache = None
+
+    def fetch_page(self, offset, seek=None): #MAIN
+        """ Page at `offset` of the open table, from the read-ahead cache when it's there. """
+        cache = self.get_page_cache()
+        page = cache.get(self.table_name, offset, self.table_limit, self.table_view) if cache else None
+        if page is None:
+            page = fetch_table_page(
+                self.cursor, self.table_name, self.table_limit, offset, count_mode=None,
+                **self.table_view, **(seek or {})
+            )
+            self.cache_page(offset, page)
+        return page
+
+    def cache_page(self, offset, page): #MAIN
+        cache = self.get_page_cache()
+        if cache and page:
+            cache.put(self.table_name, offset, self.table_limit, page, self.table_view)
+
+    def prefetch_neighbours(self): #MAIN
+        """ Starts loading the next page (and the previous one, if it isn't cached) in the background. """
+        cache = self.get_page_cache()
+        if not cache:
+            return
+        next_offset = self.table_offset + self.table_limit
+        if self.table_total_rows is None or not self.table_total_exact or next_offset < self.table_total_rows:
+            cache.prefetch(self.table_name, next_offset, self.table_limit,
+                           self.table_view, self.page_seek(self.table_limit))
+        if self.table_offset > 0:
+            cache.prefetch(self.table_name, max(0, self.table_offset - self.table_limit), self.table_limit,
+                           self.table_view, self.page_seek(-self.table_limit))
+
+    #--------------------------------------------------------------------
+    # Sorting and visible columns (both pushed down to the SELECT)
+
+    def sort_table_by(self, index): #MAIN
+        """ Header click: sort by that column in SQL; clicking it again flips the direction. """
+        column = self.table_widget.horizontalHeaderItem(index).text()
+        view = self.table_view
+        current = view["sort_column"] or self.table_page.get("primary_key")
+        if column == current:
+            view["descending"] = not view["descending"]
+        else:
+            view["sort_column"], view["descending"] = column, False
+        self.reload_table_view()
+
+    def choose_visible_columns(self): #MAIN
+        primary_key = self.table_page.get("primary_key")
+        chosen = choose_columns_dialog(
+            self.dialog, self.columns, self.table_view["columns"], required=(primary_key,) if primary_key else ()
+        )
+        if chosen is None:
+            return
+        view = self.table_view
+        view["columns"] = None if len(chosen) == len(self.columns) else chosen
+        if view["sort_column"] and view["sort_column"] not in chosen:
+            view["sort_column"], view["descending"] = None, True  # sorted column was hidden
+        self.reload_table_view()
+
+    def reload_table_view(self): #MAIN
+        """ Re-reads the first page (or chunk) after the sort order or column selection changed. """
+        view = self.table_view
+        columns = projected_columns(self.cursor, self.current_table_name, view["columns"], view["sort_column"])
+        self.table_offset = 0
+
+        self.table_widget.blockSignals(True)
+        try:
+            self.table_widget.setRowCount(0)  # other columns: nothing on screen can be reused
+            if columns:
+                self.table_widget.setColumnCount(len(columns))
+                self.table_widget.setHorizontalHeaderLabels(columns)
+        finally:
+            self.table_widget.blockSignals(False)
+
+        try:
+            if self.scroller:
+                self.scroller.set_view(view)
+            else:
+                page = self.fetch_page(0)
+                refresh_page(self, page=page)
+                self.table_page = page
+                self.pagination_label.setText(format_page_label(
+                    0, self.table_limit, self.table_total_rows, self.table_total_exact
+                ))
+                self.sync_page_buttons()
+                self.prefetch_neighbours()
+        except Exception as e:
+            print(f"❌ ERROR: Failed to reload {self.current_table_name}: {e}")
+            self._update_status(f"❌ Could not sort or filter columns: {e}")
+            return
+
+        self.show_sort_indicator()
+        sort_column = view["sort_column"] or self.table_page.get("primary_key")
+        self._update_status(
+            f"↕️ Sorted by {sort_column} {'descending' if view['descending'] else 'ascending'}, "
+            f"{self.table_widget.columnCount()} of {len(self.columns)} column(s) shown"
         )
+
+    def jump_to_record(self, key=None): #MAIN
+        """ Seeks to the page (or chunk) holding the row with primary key `key` and selects it. """
+        primary_key = self.table_page.get("primary_key")
+        if key is None:
+            if self.current_table_name.lower() == "jobs" and self.recent_jobs.jobs:
+                key, ok = QInputDialog.getItem(
+                    self.dialog, "🎯 Go to Record", f"{primary_key}:", self.recent_job_choices(), 0, True
+                )
+                key = key.split("—")[0]
+            else:
+                key, ok = QInputDialog.getText(self.dialog, "🎯 Go to Record", f"{primary_key}:")
+            if not ok or not key.strip():
+                return
+            key = key.strip()
+
+        limit = self.scroller.chunk_size if self.scroller else self.table_limit
+        try:
+            page = locate_table_row(self.cursor, self.current_table_name, key, limit, **self.table_view)
+        except Exception as e:
+            print(f"❌ ERROR: Jump to {key} failed: {e}")
+            self._update_status(f"❌ Could not find {primary_key} {key}: {e}")
+            return
+        if page is None:
+            self._update_status(f"⚠ No {primary_key} {key} in '{self.current_table_name}'")
+            return
+
+        if self.scroller:
+            self.scroller.show_chunk(page, first_row=page["offset"])
+        else:
+            self.table_offset = page["offset"]
+            refresh_page(self, page=page)
+            self.table_page = page
+            self.pagination_label.setText(format_page_label(
+                self.table_offset, self.table_limit, self.table_total_rows, self.table_total_exact
+            ))
+            self.sync_page_buttons()
+            self.prefetch_neighbours()
+
+        # ✅ Highlight it and bring it into view
+        row = page["row_index"]
+        self.table_widget.selectRow(row)
+        item = self.table_widget.item(row, 0)
+        if item:
+            self.table_widget.scrollToItem(item, QAbstractItemView.PositionAtCenter)
+        if self.current_table_name.lower() == "jobs":
+            self.recent_jobs.touch(key)
+        self._update_status(f"🎯 {primary_key} {key} is row {page['offset'] + row + 1}")
+
+    def recent_job_choices(self): #MAIN
+        """ Labels for the Job ID prompts; summaries not loaded yet are fetched in one query. """
+        if getattr(self, "cursor", None):
+            self.recent_jobs.preload(self.cursor)
+        return self.recent_jobs.choices()
+
+    def show_sort_indicator(self): #MAIN
+        header = self.table_widget.horizontalHeader()
+        sort_column = self.table_view["sort_column"] or self.table_page.get("primary_key")
+        labels = [self.table_widget.horizontalHeaderItem(i).text() for i in range(self.table_widget.columnCount())]
+        if sort_column in labels:
+            header.setSortIndicatorShown(True)
+            header.setSortIndicator(
+                labels.index(sort_column), Qt.DescendingOrder if self.table_view["descending"] else Qt.AscendingOrder
+            )
+
+    def invalidate_pages(self, table_name=None): #MAIN
+        """ Drops the cached pages of `table_name` (default: the open table) after it was edited here or elsewhere. """
+        cache = getattr(self, "page_cache", None)
+        if cache:
+            cache.invalidate(table_name or getattr(self, "current_table_name", None))
     def refresh_table(self, suppress_status=False): #MAIN
         """UI logic to refresh the table."""
         if self.is_refreshing:
@@ -394,22 +785,41 @@ class DatabaseApp(QMainWindow):
 
         try:
             self.table_widget.itemChanged.disconnect(self.update_database)
-            self.table_widget.setRowCount(0)
+            self.invalidate_pages()
 
-            load_table(
-                table_widget=self.table_widget,
-                cursor=self.cursor,
-                table_name=self.current_table_name,
-                update_status_callback=self.update_status_and_database,
-                table_offset=self.table_offset,
-                limit=50,
-                event_filter=self
-            )
+            # ✅ Only rows that changed are touched; scroll position and selection stay
+            if getattr(self, "scroller", None):
+                page = {"changes": self.scroller.refresh()}  # re-reads just the loaded key range
+            else:
+                page = load_table(
+                    table_widget=self.table_widget,
+                    cursor=self.cursor,
+                    table_name=self.current_table_name,
+                    update_status_callback=self.update_status_and_database,
+                    table_offset=self.table_offset,
+                    limit=self.table_limit,
+                    event_filter=self,
+                    count_mode=self.database_config.get("row_count"),
+                    view=self.table_view
+                )
+            if page and "rows" in page:
+                self.table_page = page
+                self.table_total_rows = page["total_rows"]
+                self.table_total_exact = page["total_exact"]
+                self.pagination_label.setText(format_page_label(
+                    self.table_offset, self.table_limit, self.table_total_rows, self.table_total_exact
+                ))
+                self.sync_page_buttons()
+                self.cache_page(self.table_offset, page)
+                self.prefetch_neighbours()
 
             print(f"✅ Table {self.current_table_name} refreshed successfully.")
             if not suppress_status:
                 now = datetime.now().strftime("%H:%M:%S")
-                self.status_bar.setText(f"✅ Refreshed '{self.current_table_name}' at {now}")
+                changes = (page or {}).get("changes") or {}
+                changed = changes.get("inserted", 0) + changes.get("updated", 0) + changes.get("deleted", 0)
+                detail = "" if changes.get("rebuilt") else f" ({changed} row(s) changed)"
+                self.status_bar.setText(f"✅ Refreshed '{self.current_table_name}' at {now}{detail}")
 
 
         except Exception as e:
@@ -429,30 +839,17 @@ class DatabaseApp(QMainWindow):
             return
 
         try:
-            tokens = [word.strip() for word in search_text.strip().split() if word.strip()]
-            if not tokens:
+            if not search_text.split():
                 self.status_bar.setText("ℹ️ No valid keywords entered.")
                 return
 
             now = datetime.now().strftime("%H:%M:%S")
-
-            # Build WHERE clause: each token must match at least one column
-            conditions = []
-            params = []
-
-            for token in tokens:
-                token_conditions = [f"`{col}` LIKE %s" for col in selected_columns]
-                conditions.append(f"({' OR '.join(token_conditions)})")
-                params.extend([f"%{token}%"] * len(selected_columns))
-
-            where_clause = " AND ".join(conditions)
-            query = f"""
-                SELECT * FROM `{self.current_table_name}`
-                WHERE {where_clause};
-            """
-
-            self.cursor.execute(query, tuple(params))
-            results = self.cursor.fetchall()
+            shown_columns = [
+                self.table_widget.horizontalHeaderItem(i).text() for i in range(self.table_widget.columnCount())
+            ]
+            results = search_table_rows(
+                self.cursor, self.current_table_name, selected_columns, search_text, select_columns=shown_columns
+            )
 
             if not results:
                 self.table_widget.setRowCount(0)
@@ -464,6 +861,8 @@ class DatabaseApp(QMainWindow):
                 self.status_bar.setText(
                     f"🔍 {len(results)} result(s) for '{search_text.strip()}' in {', '.join(selected_columns)} at {now}"
                 )
+            if getattr(self, "scroller", None):
+                self.scroller.paused = True  # search results, not chunks; refresh resumes scrolling
 
         except mariadb.Error as e:
             QMessageBox.critical(self, "Database Error", f"❌ Database Error: {e}")
@@ -518,6 +917,7 @@ class DatabaseApp(QMainWindow):
                 return
 
             now = datetime.now().strftime("%H:%M:%S")
+            self.invalidate_pages()  # cached pages would show the old value
 
             if column == pk_index:
                 # Updating PK
@@ -528,6 +928,7 @@ class DatabaseApp(QMainWindow):
                     return
 
                 update_primary_key(self.cursor, self.conn, self.current_table_name, pk_column, db_old_pk, new_value)
+                note_key_change(self.cursor, self.conn, self.current_table_name, pk_column)
                 pk_item.setData(Qt.UserRole, new_value)
                 pk_item.setText(str(new_value))
                 print(f"✅ ID updated from {db_old_pk} → {new_value}")
@@ -539,8 +940,6 @@ class DatabaseApp(QMainWindow):
                 self._update_status(f"✅ Updated '{col_name}' to '{new_value}' for ID {db_old_pk}")
 
 
-            update_auto_increment_if_needed(self.cursor, self.conn, self.current_table_name, pk_column)
-
         except Exception as e:
             print(f"❌ ERROR updating database: {e}")
             if column == pk_index:
@@ -576,14 +975,21 @@ class DatabaseApp(QMainWindow):
             )
 
             if success:
+                self.invalidate_pages()
                 print(f"✅ Status updated to '{new_status}' for {pk_column} = {pk_value}")
                 self._update_status(f"✅ Status updated to '{new_status}' for {pk_value}")
                 if new_status == "Completed":
                     end_date = datetime.now().strftime(
                 "%Y-%m-%d %H:%M:%S")
                     print(end_date)
-                    end_date_col = 13
-                    self.table_widget.setItem(row_idx, end_date_col, QTableWidgetItem(end_date))
+                    # Find EndDate by name: hidden columns shift the positions
+                    end_date_col = next(
+                        (i for i in range(self.table_widget.columnCount())
+                         if self.table_widget.horizontalHeaderItem(i).text().lower() == "enddate"),
+                        None
+                    )
+                    if end_date_col is not None:
+                        self.table_widget.setItem(row_idx, end_date_col, QTableWidgetItem(end_date))
                     self._update_status(f"✅ Status updated to '{new_status}' for {pk_value}")
                     
                 #self.refresh_table(suppress_status=True)
@@ -649,6 +1055,79 @@ class DatabaseApp(QMainWindow):
         except Exception as e:
             handle_db_error(e, f"Failed to delete record(s) from {table_name}")
             show_info(table_widget, f"❌ Error: {e}", title="Error") 
+    def handle_bulk_edit(self, table_name, table_widget): #MAIN
+        """Sets one column for every selected row in a single UPDATE ... IN (...) transaction."""
+        selected_rows = sorted(set(index.row() for index in table_widget.selectionModel().selectedRows()))
+        if not selected_rows:
+            selected_rows = sorted(set(item.row() for item in table_widget.selectedItems()))
+
+        if not selected_rows:
+            show_info(table_widget, "⚠ No rows selected.", title="Warning")
+            return
+
+        pk_column = (get_table_schema(self.cursor, table_name) or {}).get("primary_key")
+        if not pk_column:
+            show_info(table_widget, "❌ No primary key found.", title="Error")
+            return
+
+        headers = [table_widget.horizontalHeaderItem(i).text() for i in range(table_widget.columnCount())]
+        pk_index = headers.index(pk_column) if pk_column in headers else 0
+
+        rows_and_keys = []
+        for row in selected_rows:
+            pk_item = table_widget.item(row, pk_index)
+            if pk_item:
+                rows_and_keys.append((row, pk_item.data(Qt.UserRole) or pk_item.text().strip()))
+
+        choice = bulk_edit_dialog(
+            table_widget,
+            [col for col in headers if col != pk_column],
+            len(rows_and_keys),
+            JOB_STATUSES
+        )
+        if not choice:
+            return
+        column_name, new_value = choice
+        pk_values = [pk for _, pk in rows_and_keys]
+        end_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # written and shown, so both match
+
+        if column_name.lower() == "status":
+            updated, error = update_status_bulk(
+                self.cursor, self.conn, table_name, pk_column, pk_values, new_value, end_date=end_date
+            )
+        else:
+            updated, error = update_column_bulk(
+                self.cursor, self.conn, table_name, column_name, new_value, pk_column, pk_values
+            )
+
+        if error:
+            show_info(table_widget, f"❌ Bulk update failed: {error}", title="Update Failed")
+            self._update_status("❌ Bulk update failed")
+            return
+
+        self.invalidate_pages()
+
+        # ✅ Patch the visible rows in place instead of reloading the page
+        column_index = headers.index(column_name)
+        end_date_index = next((i for i, h in enumerate(headers) if h.lower() == "enddate"), None)
+
+        table_widget.blockSignals(True)
+        try:
+            for row, _ in rows_and_keys:
+                combo = table_widget.cellWidget(row, column_index)
+                if isinstance(combo, QComboBox):
+                    combo.blockSignals(True)
+                    combo.setCurrentText(new_value)
+                    combo.blockSignals(False)
+                else:
+                    table_widget.setItem(row, column_index, QTableWidgetItem("" if new_value is None else str(new_value)))
+
+                if column_name.lower() == "status" and new_value == "Completed" and end_date_index is not None:
+                    table_widget.setItem(row, end_date_index, QTableWidgetItem(end_date))
+        finally:
+            table_widget.blockSignals(False)
+
+        self._update_status(f"✏️ Set '{column_name}' on {updated} record(s)")
     def handle_print_record(self, table_name, table_widget, primary_key_column, cursor=None):
         selected_items = table_widget.selectedItems()
         cursor = self.cursor  # Use the cursor from the class instance if not passed
@@ -793,10 +1272,23 @@ class DatabaseApp(QMainWindow):
 
 #---------------------------------------------------------------------------------  
 
+# Modules warmed on the splash thread instead of on first use
+STARTUP_MODULES = (
+    "schedule",
+)
+
 if __name__ == "__main__":
     try:
         app = QApplication(sys.argv)
 
+        # ⏱ Time every data access call when profiling
+        if profiler.is_enabled():
+            profiler.instrument_module(sys.modules["DB.data_access"], "db")
+
+        # 📦 DBDOC_IMPORT_REPORT=1 prints how long each deferred import took on exit
+        if os.environ.get("DBDOC_IMPORT_REPORT"):
+            atexit.register(print_import_report)
+
         # ✅ Global StyleSheet
         app.setStyleSheet("""
             QMessageBox { background-color: #2A2A2A; }
@@ -809,14 +1301,27 @@ if __name__ == "__main__":
         splashscreen.show()
         app.processEvents()
 
-        loading_thread = InitializationThread()
+        # ✅ Real startup work runs in the background and drives the splash bar
+        loading_thread = InitializationThread([
+            ("settings", "Loading settings...", 1, load_settings),
+            ("schedule", "Loading backup schedule...", 1, lambda: load_schedule_from_json(SCHEDULE_FILE_PATH)),
+            ("imports", "Loading modules...", 3, lambda: warm_imports(STARTUP_MODULES)),
+            ("db_reachable", "Checking database host...", 2,
+             lambda: ping_database(loading_thread.results.get("settings", {}).get("host"))),
+        ])
+        startup = loading_thread.results
         loading_thread.progress.connect(splashscreen.update_progress)
+        loading_thread.status.connect(splashscreen.set_status_message)
 
         def start_main_app():
             splashscreen.close()
             app.processEvents()
-            window = DatabaseApp()
+            if startup.get("db_reachable") is False:
+                print(f"⚠️ Database host '{startup['settings']['host']}' is not reachable.")
+            with profiler.span("DatabaseApp.__init__", "ui"):
+                window = DatabaseApp(startup_results=startup)
             window.show()
+            QTimer.singleShot(0, lambda: profiler.mark("first_paint", "ui"))
 
         loading_thread.finished.connect(start_main_app)
         loading_thread.start()
@@ -0,0 +1,338 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from UTILS.backup_archive import collect_garbage, is_archive
+
+# Backup job manager
+# ---------------------------
+# Every automatic backup (in-app schedule or the standalone service) goes
+# through run_backup_job(), which:
+#
+#   1. checks there is enough free disk space (the last backup's size plus
+#      headroom, or MIN_FREE_BYTES when there is no history yet)
+#   2. runs the backup
+#   3. prunes old backups in that directory with the retention policy
+#      (keep the newest backup of each of the last N hours, M days and
+#      K weeks; the newest backup is always kept)
+#   4. appends one line per run to backup_history.jsonl
+#   5. optionally restores the new backup into a scratch database and
+#      checks it (FILE_OPS.backup_verify), recorded as a "verify" entry
+#
+# BackupJobManager puts a single worker thread and a queue in front of
+# that. A trigger for a directory that is already waiting in the queue is
+# coalesced into the waiting job instead of queuing a second dump, so a
+# short interval can never pile up overlapping backups.
+
+BACKUP_HISTORY_FILE = "backup_history.jsonl"
+BACKUP_FILE_PATTERN = re.compile(r"^database_backup_(\d{8}_\d{6})\.(?:sql|dbarc)$")  # not .part / .tmp files still being written
+DEFAULT_RETENTION = {"hourly": 24, "daily": 7, "weekly": 4}
+MIN_FREE_BYTES = 50 * 1024 * 1024
+SPACE_HEADROOM = 1.5
+
+
+#--------------------------------------------------------------------
+# History
+
+def append_backup_history(entry, history_path=BACKUP_HISTORY_FILE):
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, default=str) + "\n")
+
+def read_backup_history(limit=None, history_path=BACKUP_HISTORY_FILE):
+    """ Returns history entries oldest first (the last `limit` if given). """
+    if not os.path.exists(history_path):
+        return []
+    entries = []
+    with open(history_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # skip a line cut short by a crash
+    return entries[-limit:] if limit else entries
+
+def describe_backup_history(limit=5, history_path=BACKUP_HISTORY_FILE):
+    """ A few lines for the GUI listing the most recent backup runs. """
+    entries = read_backup_history(limit, history_path)
+    if not entries:
+        return "📜 No backups recorded yet."
+
+    lines = ["📜 Recent backups:"]
+    for entry in reversed(entries):
+        if entry.get("kind") == "verify":
+            detail = (f"verified {os.path.basename(entry.get('file') or '')} in {entry.get('duration_s')}s"
+                      if entry.get("ok") else f"verification failed: {entry.get('error')}")
+            lines.append(f"{'🔎' if entry.get('ok') else '❌'} {entry.get('started')}: {detail}")
+            continue
+        if entry.get("ok"):
+            size_mb = (entry.get("size_bytes") or 0) / 2**20
+            detail = f"{size_mb:.1f} MB in {entry.get('duration_s')}s"
+            if entry.get("pruned"):
+                detail += f", pruned {len(entry['pruned'])}"
+        else:
+            detail = entry.get("error") or "failed"
+        lines.append(f"{'✅' if entry.get('ok') else '❌'} {entry.get('started')}: {detail}")
+    return "\n".join(lines)
+
+
+#--------------------------------------------------------------------
+# Retention
+
+def list_backups(directory):
+    """ Returns [(timestamp, path)] for the backups in `directory`, newest first. """
+    backups = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    for name in names:
+        match = BACKUP_FILE_PATTERN.match(name)
+        if not match:
+            continue
+        try:
+            stamp = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+        except ValueError:
+            continue
+        backups.append((stamp, os.path.join(directory, name)))
+    return sorted(backups, reverse=True)
+
+def select_backups_to_keep(backups, retention=None):
+    """
+    Grandfather-father-son selection.
+
+    Args:
+        backups (list): (timestamp, path) newest first.
+        retention (dict): {"hourly": N, "daily": M, "weekly": K}.
+
+    Returns:
+        set: Paths to keep.
+    """
+    retention = {**DEFAULT_RETENTION, **(retention or {})}
+    if not backups:
+        return set()
+
+    keep = {backups[0][1]}  # never delete the newest backup
+    buckets = {
+        "hourly": lambda stamp: stamp.strftime("%Y%m%d%H"),
+        "daily": lambda stamp: stamp.strftime("%Y%m%d"),
+        "weekly": lambda stamp: "%d-%02d" % stamp.isocalendar()[:2],
+    }
+
+    for tier, bucket_of in buckets.items():
+        limit = int(retention.get(tier) or 0)
+        seen = []
+        for stamp, path in backups:
+            bucket = bucket_of(stamp)
+            if bucket in seen:
+                continue
+            if len(seen) >= limit:
+                break
+            seen.append(bucket)
+            keep.add(path)  # newest backup in this bucket
+
+    return keep
+
+def prune_backups(directory, retention=None):
+    """
+    Deletes backups the retention policy doesn't keep.
+
+    Returns:
+        list: Paths that were deleted.
+    """
+    backups = list_backups(directory)
+    keep = select_backups_to_keep(backups, retention)
+    pruned = []
+    for _, path in backups:
+        if path in keep:
+            continue
+        try:
+            os.remove(path)
+            pruned.append(path)
+        except OSError as e:
+            print(f"⚠️ Could not remove old backup {path}: {e}")
+
+    if any(is_archive(path) for path in pruned):
+        removed = collect_garbage(directory)
+        if removed:
+            print(f"🧹 Removed {removed} archive chunks no backup uses any more.")
+    return pruned
+
+
+#--------------------------------------------------------------------
+# Running a job
+
+def check_disk_space(directory, history_path=BACKUP_HISTORY_FILE):
+    """
+    Returns (ok, free_bytes, needed_bytes). The estimate is the last successful
+    backup's size times SPACE_HEADROOM, with MIN_FREE_BYTES as a floor.
+    """
+    last_size = next(
+        (entry.get("size_bytes") or 0 for entry in reversed(read_backup_history(history_path=history_path))
+         if entry.get("ok") and entry.get("kind", "backup") == "backup" and entry.get("directory") == directory),
+        0
+    )
+    needed = max(int(last_size * SPACE_HEADROOM), MIN_FREE_BYTES)
+    free = shutil.disk_usage(directory).free
+    return free >= needed, free, needed
+
+def run_backup_job(directory, backup_func, retention=None, reason="scheduled",
+                   coalesced=0, history_path=BACKUP_HISTORY_FILE, verify_func=None):
+    """
+    Preflight, backup, prune and record one run.
+
+    Args:
+        backup_func (callable): directory -> path of the file written; raises on failure.
+        coalesced (int): Number of extra triggers folded into this run.
+        verify_func (callable, optional): backup file -> verify entry (see FILE_OPS.backup_verify),
+                                          run after a successful backup and recorded separately.
+
+    Returns:
+        dict: The history entry that was recorded.
+    """
+    started = time.perf_counter()
+    entry = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "directory": directory,
+        "reason": reason,
+        "coalesced": coalesced,
+        "ok": False,
+        "file": None,
+        "size_bytes": None,
+        "error": None,
+        "pruned": [],
+    }
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        ok, free, needed = check_disk_space(directory, history_path)
+        if not ok:
+            raise OSError(f"Not enough free disk space: {free // 2**20} MB free, {needed // 2**20} MB needed.")
+
+        backup_file = backup_func(directory)
+        if not backup_file:
+            raise RuntimeError("Backup did not produce a file.")
+
+        entry.update(ok=True, file=backup_file, size_bytes=os.path.getsize(backup_file))
+        entry["pruned"] = prune_backups(directory, retention)
+    except Exception as e:
+        entry["error"] = str(e)
+        print(f"❌ Backup job failed: {e}")
+
+    entry["finished"] = datetime.now().isoformat(timespec="seconds")
+    entry["duration_s"] = round(time.perf_counter() - started, 2)
+
+    try:
+        append_backup_history(entry, history_path)
+    except OSError as e:
+        print(f"⚠️ Could not write backup history: {e}")
+
+    if entry["ok"] and verify_func:
+        try:
+            entry["verified"] = verify_func(entry["file"]).get("ok")
+        except Exception as e:
+            print(f"❌ Backup verification failed: {e}")
+            entry["verified"] = False
+    return entry
+
+
+#--------------------------------------------------------------------
+# Queue
+
+class BackupJobManager:
+    """ Single-worker backup queue that coalesces overlapping triggers per directory. """
+
+    def __init__(self, retention=None, history_path=BACKUP_HISTORY_FILE):
+        self.retention = retention
+        self.history_path = history_path
+        self._queue = deque()      # directories, in trigger order
+        self._pending = {}         # directory -> {"backup_func", "verify_func", "reason", "coalesced"}
+        self._running = None
+        self._condition = threading.Condition()
+        self._worker = None
+        self.last_result = None
+
+    def submit(self, directory, backup_func, reason="scheduled", verify_func=None):
+        """
+        Queues a backup of `directory`.
+
+        Returns:
+            bool: True if a new job was queued, False if it was coalesced into a waiting one.
+        """
+        with self._condition:
+            waiting = self._pending.get(directory)
+            if waiting:
+                waiting["coalesced"] += 1
+                print(f"⏳ Backup of {directory} already queued; trigger coalesced.")
+                return False
+
+            self._pending[directory] = {
+                "backup_func": backup_func, "verify_func": verify_func, "reason": reason, "coalesced": 0
+            }
+            self._queue.append(directory)
+            self._ensure_worker()
+            self._condition.notify()
+            return True
+
+    @property
+    def busy(self):
+        with self._condition:
+            return self._running is not None or bool(self._queue)
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, name="backup-jobs", daemon=True)
+            self._worker.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    if not self._condition.wait(timeout=60):
+                        self._worker = None  # idle: let the thread end, submit() restarts it
+                        return
+                directory = self._queue.popleft()
+                job = self._pending.pop(directory)
+                self._running = directory
+
+            try:
+                self.last_result = run_backup_job(
+                    directory, job["backup_func"], self.retention, job["reason"],
+                    job["coalesced"], self.history_path, job["verify_func"]
+                )
+            finally:
+                with self._condition:
+                    self._running = None
+                    self._condition.notify_all()
+
+    def wait_idle(self, timeout=None):
+        """ Blocks until the queue is empty and nothing is running. """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._running is not None or self._queue:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_backup_manager(retention=None):
+    """ Returns the process-wide BackupJobManager, creating it on first use. """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = BackupJobManager(retention)
+        elif retention is not None:
+            _manager.retention = retention
+        return _manager
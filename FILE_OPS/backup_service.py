@@ -0,0 +1,271 @@
+"""
+Standalone backup scheduler.
+
+Runs scheduled backups in its own process with its own database
+connection, so backups happen whether or not anyone has the app open and
+never compete with the UI for its cursor. It reads the same
+backup_schedule.json the GUI writes and reports back through
+backup_status.json, which the GUI shows under "View Current Schedule".
+
+    python -m FILE_OPS.backup_service --user backup_user
+    python -m FILE_OPS.backup_service --user backup_user --once
+
+The password is read from DBDOC_BACKUP_PASSWORD, or prompted for.
+Host, database and SSL settings come from settings.json.
+"""
+import argparse
+import getpass
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+from DB.data_access import connect_to_database, close_connection
+from FILE_OPS.backup_jobs import run_backup_job
+from FILE_OPS.config import load_settings
+from FILE_OPS.file_ops import load_schedule_from_json, SCHEDULE_FILE_PATH
+from UTILS.db_utils import backup_database
+
+
+BACKUP_STATUS_FILE = "backup_status.json"
+PASSWORD_ENV = "DBDOC_BACKUP_PASSWORD"
+
+# The service wakes at least this often to pick up schedule changes and
+# refresh its heartbeat, even when the next backup is hours away.
+SCHEDULE_RECHECK_SECONDS = 300
+
+
+#--------------------------------------------------------------------
+# Schedule
+
+def normalise_schedule(schedule_data):
+    """
+    Turns backup_schedule.json into (period, time_of_day, directory).
+
+    period is "daily" or a timedelta; directory may be stored as a string or a
+    one-element list depending on which dialog saved it.
+
+    Returns:
+        tuple or None: None if the schedule is missing or unusable.
+    """
+    if not schedule_data:
+        return None
+
+    directory = schedule_data.get("backup_directory")
+    if isinstance(directory, (list, tuple)):
+        directory = directory[0] if directory else None
+    if not directory:
+        return None
+
+    interval = str(schedule_data.get("interval", "")).strip().lower()
+    if interval == "daily":
+        return "daily", schedule_data.get("time_of_day") or "00:00", directory
+    if interval == "hourly":
+        return timedelta(hours=1), None, directory
+    if interval.startswith("every"):
+        try:
+            minutes = int(interval.split()[1])
+        except (IndexError, ValueError):
+            return None
+        return (timedelta(minutes=minutes), None, directory) if minutes > 0 else None
+    return None
+
+def next_run_time(period, time_of_day, last_run=None, now=None):
+    """ Returns the datetime the next backup is due. """
+    now = now or datetime.now()
+
+    if period == "daily":
+        hour, minute = (int(part) for part in time_of_day.split(":")[:2])
+        due = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return due if due > now else due + timedelta(days=1)
+
+    if last_run is None:
+        return now + period
+    return max(last_run + period, now)
+
+
+#--------------------------------------------------------------------
+# Status file
+
+def read_backup_status(status_path=BACKUP_STATUS_FILE):
+    """ Returns the status dict written by the service, or {} if there is none. """
+    try:
+        with open(status_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_backup_status(status, status_path=BACKUP_STATUS_FILE):
+    """ Writes the status atomically so the GUI never reads a half-written file. """
+    tmp_path = f"{status_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f, indent=4, default=str)
+    os.replace(tmp_path, status_path)
+
+def is_service_active(status=None, status_path=BACKUP_STATUS_FILE):
+    """ True if a backup service has refreshed its heartbeat recently. """
+    status = status if status is not None else read_backup_status(status_path)
+    if status.get("state") not in ("idle", "running"):
+        return False
+    try:
+        heartbeat = datetime.fromisoformat(status["heartbeat"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return datetime.now() - heartbeat < timedelta(seconds=SCHEDULE_RECHECK_SECONDS * 2)
+
+def describe_backup_status(status_path=BACKUP_STATUS_FILE):
+    """ One or two lines for the GUI summarising the service and its last run. """
+    status = read_backup_status(status_path)
+    if not status:
+        return "🛰 Backup service: not running (backups run inside the app)"
+
+    lines = [
+        f"🛰 Backup service: {'active' if is_service_active(status) else 'not running'}"
+        + (f", next run {status['next_run']}" if status.get("next_run") else "")
+    ]
+    last = status.get("last_run")
+    if last:
+        outcome = "✅" if last.get("ok") else "❌"
+        lines.append(f"{outcome} Last backup {last.get('finished')}: {last.get('file') or last.get('error')}")
+    return "\n".join(lines)
+
+
+#--------------------------------------------------------------------
+# Service loop
+
+def run_backup_once(credentials, directory):
+    """
+    Opens a dedicated connection, writes one backup and closes it again.
+
+    The run goes through the backup job manager's run_backup_job(), so the
+    service gets the same disk-space check, pruning, history and (with
+    "verify_backups" on) verification as the app.
+
+    Returns:
+        dict: started, finished, duration_s, ok, file, size_bytes, error, pruned.
+    """
+    def backup(target_directory):
+        conn = cursor = None
+        try:
+            conn, cursor = connect_to_database(**credentials)
+            return backup_database(cursor, target_directory, interactive=False, raise_errors=True)
+        finally:
+            close_connection(conn, cursor)
+
+    settings = load_settings()
+    verify = None
+    if settings.get("verify_backups"):
+        from FILE_OPS.backup_verify import verify_backup
+        verify = lambda backup_file: verify_backup(credentials, backup_file)
+
+    return run_backup_job(directory, backup, settings.get("backup_retention"), reason="service", verify_func=verify)
+
+def run_service(credentials, schedule_path=SCHEDULE_FILE_PATH, status_path=BACKUP_STATUS_FILE,
+                once=False, stop_event=None, backup_func=run_backup_once):
+    """
+    Sleeps until the next scheduled backup, runs it, and repeats.
+
+    Args:
+        credentials (dict): Keyword arguments for connect_to_database().
+        once (bool): Run one backup immediately and exit.
+        stop_event (threading.Event, optional): Set it to stop the loop.
+        backup_func (callable): (credentials, directory) -> result dict.
+    """
+    stop_event = stop_event or threading.Event()
+    status = read_backup_status(status_path)
+    status.update(pid=os.getpid(), service_started=datetime.now().isoformat(timespec="seconds"))
+    last_run = None
+    planned = None  # (schedule, due) so periodic wake-ups don't push the due time back
+
+    def save(**fields):
+        status.update(fields, heartbeat=datetime.now().isoformat(timespec="seconds"))
+        write_backup_status(status, status_path)
+
+    try:
+        while not stop_event.is_set():
+            schedule = normalise_schedule(load_schedule_from_json(schedule_path))
+            if schedule is None:
+                if once:
+                    print("❌ No usable backup schedule found.")
+                    return status
+                save(state="idle", next_run=None)
+                stop_event.wait(SCHEDULE_RECHECK_SECONDS)
+                continue
+
+            period, time_of_day, directory = schedule
+            if once:
+                due = datetime.now()
+            elif planned and planned[0] == schedule:
+                due = planned[1]
+            else:
+                due = next_run_time(period, time_of_day, last_run)
+            planned = (schedule, due)
+            save(state="idle", next_run=due.isoformat(timespec="seconds"), backup_directory=directory)
+
+            remaining = (due - datetime.now()).total_seconds()
+            if remaining > 0:
+                # Sleep until due, but wake periodically to notice schedule changes
+                stop_event.wait(min(remaining, SCHEDULE_RECHECK_SECONDS))
+                if remaining > SCHEDULE_RECHECK_SECONDS:
+                    continue
+                if stop_event.is_set():
+                    break
+
+            save(state="running")
+            print(f"💾 Backing up to {directory}...")
+            result = backup_func(credentials, directory)
+            last_run = datetime.now()
+            planned = None
+            print(("✅ Backup saved to " + str(result.get("file"))) if result.get("ok")
+                  else f"❌ Backup failed: {result.get('error')}")
+            save(state="idle", last_run=result)
+
+            if once:
+                break
+    finally:
+        save(state="stopped", next_run=None)
+
+    return status
+
+
+#--------------------------------------------------------------------
+# CLI
+
+def build_credentials(username, password=None):
+    """ connect_to_database() keyword arguments from settings.json plus a user and password. """
+    settings = load_settings()
+    password = password or os.environ.get(PASSWORD_ENV) or getpass.getpass(f"Password for {username}: ")
+    ssl_config = settings.get("ssl", {})
+    return {
+        "username": username,
+        "password": password,
+        "host": settings.get("host", "localhost"),
+        "database": settings.get("database", ""),
+        "ssl_enabled": ssl_config.get("enabled", False),
+        "ssl_path": ssl_config.get("cert_path", "").strip() or None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scheduled database backups outside the GUI.")
+    parser.add_argument("--user", required=True, help="Database user for the backup connection.")
+    parser.add_argument("--schedule", default=SCHEDULE_FILE_PATH, help="Schedule file written by the GUI.")
+    parser.add_argument("--status", default=BACKUP_STATUS_FILE, help="Status file read by the GUI.")
+    parser.add_argument("--once", action="store_true", help="Run one backup now and exit.")
+    args = parser.parse_args(argv)
+
+    credentials = build_credentials(args.user)
+
+    print(f"🛰 Backup service started for '{credentials['database']}' on {credentials['host']}")
+    try:
+        status = run_service(credentials, args.schedule, args.status, once=args.once)
+    except KeyboardInterrupt:
+        print("👋 Backup service stopped.")
+        return 0
+
+    last = status.get("last_run") or {}
+    return 0 if not args.once or last.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Backup verification.
+
+Restores a backup into a throwaway database, loading tables in parallel
+(one connection per loader), then checks each restored table's row count
+and checksum against the ones recorded in the backup: the manifest of an
+archive, the digest lines at the end of a .sql backup (older .sql backups
+without them are checked by row count, one INSERT per row). The live
+tables keep changing while and after the backup is taken, so they are not
+compared. The outcome and timings are appended to backup_history.jsonl as
+a "verify" entry and the scratch database is dropped again.
+
+    python -m FILE_OPS.backup_verify --user backup_user --directory D:/Backups
+    python -m FILE_OPS.backup_verify --user backup_user --file D:/Backups/database_backup_20250101_020000.sql
+
+The password is read from DBDOC_BACKUP_PASSWORD, or prompted for, as in
+FILE_OPS.backup_service.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import mariadb
+
+from DB.data_access import connect_to_database, close_connection, fetch_tables
+from FILE_OPS.backup_jobs import BACKUP_HISTORY_FILE, append_backup_history, list_backups
+from FILE_OPS.backup_service import build_credentials
+from UTILS.backup_archive import is_archive, load_archive_table, load_manifest, read_sql_digests, table_digest
+
+
+DEFAULT_WORKERS = 4
+TABLE_PATTERN = re.compile(r"^(?:CREATE TABLE|INSERT INTO)\s+`?([^`\s(]+)`?", re.IGNORECASE)
+
+
+#--------------------------------------------------------------------
+# Loading
+
+def split_sql_backup(backup_file):
+    """
+    Groups the statements of a .sql backup by table, in file order.
+    Splits on ";" exactly like restore_database_from_file() so both see the same statements.
+
+    Returns:
+        dict: table -> [statements].
+    """
+    with open(backup_file, "r", encoding="utf-8") as f:
+        sql_commands = f.read()
+
+    statements = {}
+    for command in sql_commands.split(";"):
+        command = command.strip()
+        match = TABLE_PATTERN.match(command)
+        if match:
+            statements.setdefault(match.group(1), []).append(command)
+    return statements
+
+def sql_row_counts(statements):
+    """ Rows a .sql backup holds per table: it writes one INSERT per row. """
+    return {
+        table: sum(1 for command in commands if command[:6].upper() == "INSERT")
+        for table, commands in statements.items()
+    }
+
+def _load_sql_table(cursor, commands):
+    failed = 0
+    for command in commands:
+        try:
+            cursor.execute(command)
+        except mariadb.Error:
+            failed += 1
+    return failed
+
+def _load_archive_table(cursor, backup_file, table, manifest):
+    load_archive_table(cursor, backup_file, table, manifest)
+    return 0  # archive inserts either all succeed or raise
+
+def _verify_table(credentials, scratch_database, table, load, expected):
+    """
+    Worker: loads one table into the scratch database on its own connection,
+    digests the restored copy and compares it with `expected` (rows, checksum
+    or None) recorded in the backup.
+    """
+    rows_expected, checksum_expected = expected
+    result = {"table": table, "rows_expected": rows_expected, "checksum_expected": checksum_expected}
+    scratch_conn = scratch_cursor = None
+    try:
+        started = time.perf_counter()
+        scratch_conn, scratch_cursor = connect_to_database(**{**credentials, "database": scratch_database})
+        scratch_cursor.execute("SET FOREIGN_KEY_CHECKS = 0;")
+        result["failed_statements"] = load(scratch_cursor) or 0
+        scratch_conn.commit()
+        result["load_s"] = round(time.perf_counter() - started, 3)
+
+        result["rows_restored"], result["checksum_restored"] = table_digest(scratch_cursor, table)
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        close_connection(scratch_conn, scratch_cursor)
+
+    result["matches_backup"] = (
+        "error" not in result
+        and result["rows_restored"] == rows_expected
+        and checksum_expected in (None, result["checksum_restored"])  # None: .sql backup without digests
+    )
+    return result
+
+
+#--------------------------------------------------------------------
+# Verification
+
+def verify_backup(credentials, backup_file, workers=DEFAULT_WORKERS,
+                  history_path=BACKUP_HISTORY_FILE, record=True):
+    """
+    Restores `backup_file` into a scratch database and checks every table against the backup.
+
+    Args:
+        credentials (dict): Keyword arguments for connect_to_database() (the source database).
+        workers (int): Tables loaded in parallel.
+        record (bool): Append the result to the backup history.
+
+    Returns:
+        dict: The "verify" history entry; `ok` is True only if every table matched the
+              backup and every table of the source database is in it.
+    """
+    started = time.perf_counter()
+    source_database = credentials["database"]
+    scratch_database = f"{source_database}_verify_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    entry = {
+        "kind": "verify",
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "directory": os.path.dirname(os.path.abspath(backup_file)),
+        "file": backup_file,
+        "scratch_database": scratch_database,
+        "workers": workers,
+        "ok": False,
+        "error": None,
+        "tables": {},
+    }
+
+    conn = cursor = None
+    try:
+        if is_archive(backup_file):
+            manifest = load_manifest(backup_file)
+            expected = {table: (info["rows"], info["checksum"]) for table, info in manifest["tables"].items()}
+            loaders = {
+                table: (lambda cursor, table=table: _load_archive_table(cursor, backup_file, table, manifest))
+                for table in manifest["tables"]
+            }
+        else:
+            statements = split_sql_backup(backup_file)
+            expected = {table: (rows, None) for table, rows in sql_row_counts(statements).items()}
+            expected.update(read_sql_digests(backup_file))
+            loaders = {
+                table: (lambda cursor, commands=commands: _load_sql_table(cursor, commands))
+                for table, commands in statements.items()
+            }
+
+        conn, cursor = connect_to_database(**credentials)
+        source_tables = fetch_tables(cursor)
+        cursor.execute(f"CREATE DATABASE `{scratch_database}`")
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="verify") as pool:
+            results = list(pool.map(
+                lambda table: _verify_table(credentials, scratch_database, table, loaders[table], expected[table]),
+                loaders
+            ))
+
+        mismatches = []
+        for result in results:
+            table = result.pop("table")
+            if not result["matches_backup"] or result.get("failed_statements"):
+                mismatches.append(table)
+            entry["tables"][table] = result
+
+        missing = sorted(set(source_tables) - set(loaders))
+        if missing:
+            entry["missing_tables"] = missing
+        entry["ok"] = not mismatches and not missing
+        if not entry["ok"]:
+            entry["error"] = "; ".join(filter(None, [
+                f"mismatched: {', '.join(mismatches)}" if mismatches else "",
+                f"not in backup: {', '.join(missing)}" if missing else "",
+            ]))
+
+    except Exception as e:
+        entry["error"] = str(e)
+    finally:
+        if cursor:
+            try:
+                cursor.execute(f"DROP DATABASE IF EXISTS `{scratch_database}`")
+            except Exception as e:
+                print(f"⚠️ Could not drop scratch database {scratch_database}: {e}")
+        close_connection(conn, cursor)
+
+    entry["finished"] = datetime.now().isoformat(timespec="seconds")
+    entry["duration_s"] = round(time.perf_counter() - started, 2)
+    print(("🔎 Backup verified: " if entry["ok"] else "❌ Backup verification failed: ")
+          + (os.path.basename(backup_file) if entry["ok"] else str(entry["error"])))
+
+    if record:
+        try:
+            append_backup_history(entry, history_path)
+        except OSError as e:
+            print(f"⚠️ Could not write backup history: {e}")
+    return entry
+
+def latest_backup(directory):
+    backups = list_backups(directory)
+    return backups[0][1] if backups else None
+
+
+#--------------------------------------------------------------------
+# CLI
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Restore a backup into a scratch database and check it against the backup.")
+    parser.add_argument("--user", required=True, help="Database user (needs CREATE/DROP DATABASE).")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--file", help="Backup file (.sql or .dbarc) to verify.")
+    target.add_argument("--directory", help="Verify the newest backup in this directory.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Tables restored in parallel.")
+    args = parser.parse_args(argv)
+
+    backup_file = args.file or latest_backup(args.directory)
+    if not backup_file:
+        print(f"❌ No backups found in {args.directory}")
+        return 1
+
+    credentials = build_credentials(args.user)
+    result = verify_backup(credentials, backup_file, workers=args.workers)
+    for table, info in sorted(result["tables"].items()):
+        mark = "✅" if info.get("matches_backup") and not info.get("failed_statements") else "❌"
+        print(f"  {mark} {table}: {info.get('rows_restored')} restored / {info.get('rows_expected')} in backup"
+              f"{' - ' + info['error'] if info.get('error') else ''}")
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,14 @@ def load_settings():
     default_config = {
         "host": "localhost",
         "database": "",
+        "key_maintenance": "deferred",
+        "backup_retention": {"hourly": 24, "daily": 7, "weekly": 4},
+        "backup_format": "sql",
+        "verify_backups": False,
+        "row_count": "auto",
+        "page_cache_pages": 8,
+        "page_size": 50,
+        "table_view_mode": "pages",
         "ssl": {
             "enabled": False,
             "cert_path": ""
@@ -22,6 +30,14 @@ def load_settings():
                 # Update top-level fields
                 default_config["host"] = loaded_config.get("host", "localhost")
                 default_config["database"] = loaded_config.get("database", "")
+                default_config["key_maintenance"] = loaded_config.get("key_maintenance", "deferred")
+                default_config["backup_retention"].update(loaded_config.get("backup_retention", {}))
+                default_config["backup_format"] = loaded_config.get("backup_format", "sql")
+                default_config["verify_backups"] = loaded_config.get("verify_backups", False)
+                default_config["row_count"] = loaded_config.get("row_count", "auto")
+                default_config["page_cache_pages"] = loaded_config.get("page_cache_pages", 8)
+                default_config["page_size"] = loaded_config.get("page_size", 50)
+                default_config["table_view_mode"] = loaded_config.get("table_view_mode", "pages")
                 
 
                 # Update nested SSL config
@@ -0,0 +1,291 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# 📦 Standard Library
+import csv
+import os
+import re
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 🧩 Project Modules
+from DB.data_access import get_table_schema, insert_records_bulk
+
+
+DEFAULT_BATCH_SIZE = 5000
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%Y-%m-%dT%H:%M:%S")
+TRUE_VALUES = {"1", "true", "yes", "y"}
+FALSE_VALUES = {"0", "false", "no", "n"}
+
+
+#--------------------------------------------------------------------
+#--------------------------------------------------------------------
+# Reading source files
+
+def iter_source_rows(file_path):
+    """
+    Streams rows from a CSV or Excel file without loading it into memory.
+
+    Args:
+        file_path (str): Path to a .csv, .xlsx or .xlsm file.
+
+    Yields:
+        tuple: The header row first, then each data row.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                yield row
+        finally:
+            workbook.close()
+    else:
+        with open(file_path, "r", newline="", encoding="utf-8-sig") as f:
+            for row in csv.reader(f):
+                yield tuple(row)
+
+def _normalise_header(name):
+    return re.sub(r"[\s_\-]+", "", str(name or "")).lower()
+
+def map_columns(headers, table_columns):
+    """
+    Matches source headers to table columns, ignoring case, spaces, dashes and underscores.
+
+    Returns:
+        tuple: (mapping, unmapped) where mapping is a list of (source_index, column_name)
+               and unmapped is a list of source headers with no matching column.
+    """
+    lookup = {_normalise_header(col): col for col in table_columns}
+    mapping, unmapped, used = [], [], set()
+
+    for idx, header in enumerate(headers):
+        column = lookup.get(_normalise_header(header))
+        if column and column not in used:
+            mapping.append((idx, column))
+            used.add(column)
+        elif header not in (None, ""):
+            unmapped.append(header)
+
+    return mapping, unmapped
+
+
+#--------------------------------------------------------------------
+#--------------------------------------------------------------------
+# Type validation
+
+def _parse_datetime(value, formats):
+    if isinstance(value, datetime):
+        return value
+    text = str(value).strip()
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"unrecognised date '{text}'")
+
+def build_converter(column_type):
+    """
+    Returns a function that converts a raw cell value into the Python value
+    the column expects, raising ValueError when the value doesn't fit.
+    """
+    original_type = column_type or ""
+    column_type = original_type.lower()
+    base = column_type.split("(")[0].strip()
+    length = re.search(r"\((\d+)\)", column_type)
+    length = int(length.group(1)) if length else None
+
+    if column_type.startswith("tinyint(1)"):
+        def convert(value):
+            text = str(value).strip().lower()
+            if text in TRUE_VALUES:
+                return 1
+            if text in FALSE_VALUES:
+                return 0
+            raise ValueError(f"expected yes/no, got '{value}'")
+        return convert
+
+    if base in ("tinyint", "smallint", "mediumint", "int", "integer", "bigint"):
+        def convert(value):
+            try:
+                return int(str(value).strip())
+            except ValueError:
+                pass
+            try:
+                number = float(value)  # Excel hands whole numbers over as floats
+            except ValueError:
+                raise ValueError(f"expected a whole number, got '{value}'")
+            if not number.is_integer():
+                raise ValueError(f"expected a whole number, got '{value}'")
+            return int(number)
+        return convert
+
+    if base in ("decimal", "numeric", "float", "double", "real"):
+        def convert(value):
+            try:
+                return Decimal(str(value).replace("£", "").replace(",", "").strip())
+            except InvalidOperation:
+                raise ValueError(f"expected a number, got '{value}'")
+        return convert
+
+    if base == "date":
+        return lambda value: _parse_datetime(value, DATE_FORMATS + DATETIME_FORMATS).date()
+
+    if base in ("datetime", "timestamp"):
+        return lambda value: _parse_datetime(value, DATETIME_FORMATS + DATE_FORMATS)
+
+    if base in ("enum", "set"):
+        options = re.findall(r"'((?:[^']|'')*)'", original_type)
+        def convert(value):
+            text = str(value).strip()
+            if text not in options:
+                raise ValueError(f"'{text}' is not one of {', '.join(options)}")
+            return text
+        return convert
+
+    def convert(value):
+        text = value if isinstance(value, str) else str(value)
+        if length and base in ("char", "varchar") and len(text) > length:
+            raise ValueError(f"longer than {length} characters")
+        return text
+    return convert
+
+def validate_rows(numbered_rows, mapping, converters):
+    """
+    Converts a batch of source rows into insertable tuples.
+
+    Args:
+        numbered_rows (list): (line_number, raw_row) pairs; line numbers are used in the error report.
+        mapping (list): (source_index, column_name) pairs from map_columns().
+        converters (dict): column_name -> converter from build_converter().
+
+    Returns:
+        tuple: (valid_rows, valid_lines, errors) where errors is a list of
+               (line_number, column, value, message).
+    """
+    valid_rows, valid_lines, errors = [], [], []
+
+    for line, row in numbered_rows:
+        values, row_ok = [], True
+
+        for source_idx, column in mapping:
+            raw = row[source_idx] if source_idx < len(row) else None
+            if raw is None or (isinstance(raw, str) and not raw.strip()):
+                values.append(None)
+                continue
+            try:
+                values.append(converters[column](raw))
+            except (ValueError, TypeError) as e:
+                errors.append((line, column, raw, str(e)))
+                row_ok = False
+
+        if row_ok:
+            valid_rows.append(tuple(values))
+            valid_lines.append(line)
+
+    return valid_rows, valid_lines, errors
+
+
+#--------------------------------------------------------------------
+#--------------------------------------------------------------------
+# Import pipeline
+
+def import_file(cursor, conn, file_path, table_name, batch_size=DEFAULT_BATCH_SIZE,
+                dry_run=False, progress_callback=None):
+    """
+    Streams a CSV/Excel file into a table using batched executemany() transactions.
+
+    Args:
+        cursor, conn: Database cursor and connection.
+        file_path (str): Source file.
+        table_name (str): Target table; columns are matched against the cached schema.
+        batch_size (int): Rows per executemany() / commit.
+        dry_run (bool): Validate everything but insert nothing.
+        progress_callback (callable, optional): Called with the number of rows read so far.
+
+    Returns:
+        dict: Summary with rows_read, rows_valid, rows_inserted, errors, mapped/unmapped columns,
+              elapsed seconds and rows_per_second.
+    """
+    table = get_table_schema(cursor, table_name)
+    if not table:
+        raise ValueError(f"Unknown table '{table_name}'.")
+
+    rows = iter_source_rows(file_path)
+    headers = next(rows, None)
+    if not headers:
+        raise ValueError("The file is empty.")
+
+    mapping, unmapped = map_columns(headers, table["columns"])
+    if not mapping:
+        raise ValueError("None of the file's columns match the table.")
+
+    columns = [column for _, column in mapping]
+    converters = {column: build_converter(table["types"].get(column)) for column in columns}
+
+    result = {
+        "table": table_name,
+        "dry_run": dry_run,
+        "mapped_columns": columns,
+        "unmapped_headers": unmapped,
+        "rows_read": 0,
+        "rows_valid": 0,
+        "rows_inserted": 0,
+        "errors": [],
+    }
+    started = time.perf_counter()
+
+    def flush(batch):
+        valid, lines, errors = validate_rows(batch, mapping, converters)
+        result["rows_valid"] += len(valid)
+        result["errors"].extend(errors)
+
+        if dry_run or not valid:
+            return
+
+        inserted, failures = insert_records_bulk(cursor, conn, table_name, columns, valid)
+        result["rows_inserted"] += inserted
+        for idx, message in failures:
+            result["errors"].append((lines[idx], "", "", message))
+
+    batch = []
+    for line, row in enumerate(rows, start=2):
+        if not any(cell not in (None, "") for cell in row):
+            continue  # skip blank lines
+        batch.append((line, row))
+        result["rows_read"] += 1
+
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+            if progress_callback:
+                progress_callback(result["rows_read"])
+
+    flush(batch)
+    if progress_callback:
+        progress_callback(result["rows_read"])
+
+    result["elapsed"] = time.perf_counter() - started
+    result["rows_per_second"] = result["rows_read"] / result["elapsed"] if result["elapsed"] else 0.0
+    return result
+
+def write_error_report(result, report_path):
+    """
+    Writes the per-row errors from import_file() to a CSV file.
+
+    Returns:
+        str: The report path, or None if there were no errors.
+    """
+    if not result["errors"]:
+        return None
+
+    with open(report_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Line", "Column", "Value", "Error"])
+        writer.writerows(result["errors"])
+    return report_path
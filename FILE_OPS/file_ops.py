@@ -5,8 +5,10 @@ import os
 import time
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 📊 Data Handling
-import pandas as pd
+# 📊 Data Handling (loaded on first export)
+from UTILS.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🔁 Scheduling
@@ -18,6 +20,9 @@ from PyQt5.QtWidgets import QMessageBox, QFileDialog
 
 
 from UTILS.db_utils import backup_database
+from DB.data_access import connect_to_database, close_connection, fetch_tables
+from DB.cursors import stream_rows
+from FILE_OPS.config import load_settings
 
 
 
@@ -55,41 +60,58 @@ def export_database_to_excel(parent, cursor):
         return
 
     try:
-        if not file_path.endswith(".xlsx"):
-            file_path += ".xlsx"
-
-        # Get all table names
-        cursor.execute("SHOW TABLES;")
-        tables = [table[0] for table in cursor.fetchall()]
-
-        # Export each table to its own Excel sheet
-        with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-            for table in tables:
-                cursor.execute(f"SELECT * FROM {table};")
-                data = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-                df = pd.DataFrame(data, columns=columns)
-                df.to_excel(writer, sheet_name=table, index=False)
-
+        file_path = export_tables_to_excel(cursor, file_path)
         QMessageBox.information(parent, "✅ Success", f"Database exported successfully to:\n{file_path}")
     
     except Exception as e:
         QMessageBox.critical(parent, "❌ Error", f"Failed to export database:\n{e}")
 
-def load_schedule_on_startup(parent):
+def export_tables_to_excel(cursor, file_path):
+    """
+    Writes every table to its own sheet of an .xlsx file (no dialogs).
+
+    Returns:
+        str: The path written (".xlsx" is appended if missing).
+    """
+    if not file_path.endswith(".xlsx"):
+        file_path += ".xlsx"
+
+    # Get all table names (without the change feed log)
+    tables = fetch_tables(cursor)
+
+    # Export each table to its own Excel sheet
+    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+        for table in tables:
+            # Streamed (unbuffered) and written one batch at a time, so no list or DataFrame
+            # of the whole table is built; openpyxl still keeps the sheet until the file is saved
+            next_row = 0
+            for columns, rows in stream_rows(cursor, f"SELECT * FROM {table};"):
+                pd.DataFrame(rows, columns=columns).to_excel(
+                    writer, sheet_name=table, index=False, header=next_row == 0, startrow=next_row
+                )
+                next_row += len(rows) + (1 if next_row == 0 else 0)  # the header sits above the first batch
+
+    return file_path
+
+def load_schedule_on_startup(parent, schedule_data=None):
     """
     Load the backup schedule from a JSON file and apply it during app startup.
 
     Args:
         parent: The main app/controller, must implement `load_schedule_from_json()` and `schedule_backup(...)`.
+        schedule_data (dict, optional): Schedule already read by the startup pipeline;
+                                        the JSON file is only read when this is None.
     """
-    schedule_data = load_schedule_from_json(SCHEDULE_FILE_PATH)
+    if schedule_data is None:
+        schedule_data = load_schedule_from_json(SCHEDULE_FILE_PATH)
     if not schedule_data:
         return  # Nothing to load
 
     interval = schedule_data.get("interval")
     time_of_day = schedule_data.get("time_of_day")
     backup_directory = schedule_data.get("backup_directory")
+    if isinstance(backup_directory, str):
+        backup_directory = [backup_directory]  # the schedule dialog saves a plain string
 
     if interval == "Daily":
         # Apply the schedule using file_ops version
@@ -244,13 +266,18 @@ def view_current_schedule(parent):
     Args:
         parent: The main window or controller. Must have `load_schedule_from_json()`.
     """
+    from FILE_OPS.backup_service import describe_backup_status
+    from FILE_OPS.backup_jobs import describe_backup_history
+
     schedule_data = load_schedule_from_json(SCHEDULE_FILE_PATH)
 
     if schedule_data:
         schedule_details = (
             f"📅 Interval: {schedule_data.get('interval', 'N/A')}\n"
             f"⏰ Time of Day: {schedule_data.get('time_of_day', 'N/A')}\n"
-            f"📂 Backup Directory: {schedule_data.get('backup_directory', 'N/A')}"
+            f"📂 Backup Directory: {schedule_data.get('backup_directory', 'N/A')}\n\n"
+            f"{describe_backup_status()}\n\n"
+            f"{describe_backup_history()}"
         )
         QMessageBox.information(parent, "🗓 Current Backup Schedule", schedule_details)
     else:
@@ -269,27 +296,56 @@ def run_scheduled_backups(stop_event):
 
 def trigger_backup(app_instance, backup_directory):
     """
-    Triggers the backup process at the scheduled time.
+    Queues a backup with the backup job manager at the scheduled time.
+
+    The manager runs one backup at a time, folds a trigger into an already
+    queued backup of the same directory, checks free space first, prunes old
+    backups afterwards and records the run in backup_history.jsonl. With
+    "verify_backups" on, each new backup is also restored into a scratch
+    database and checked.
+
+    The backup runs on the job manager's thread, so it opens its own
+    connection from the login parameters: tables are streamed through an
+    unbuffered cursor, which would tie up the GUI's connection for the
+    whole read.
 
     Args:
-        app_instance: The main application instance (must have a `cursor` and an `is_backup_running` attribute).
+        app_instance: The main application instance (`connection_params` holds the
+                      login parameters used for the backup and verification).
         backup_directory (str): The directory to save the backup to.
     """
     if not backup_directory:
         print("❌ Backup directory is not provided.")
         return
 
-    if getattr(app_instance, "is_backup_running", False):
-        print("⏳ Backup is already running. Please wait for it to finish.")
+    credentials = getattr(app_instance, "connection_params", None)
+    if not credentials:
+        print("⚠️ Not logged in; scheduled backup skipped.")
         return
 
-    app_instance.is_backup_running = True
+    from FILE_OPS.backup_service import is_service_active
+    if is_service_active():
+        print("🛰 Backup service is running; leaving scheduled backups to it.")
+        return
 
-    try:
-        # Run in non-interactive mode to avoid GUI crashes
-        backup_database(app_instance.cursor, backup_directory, interactive=False)
-        print(f"✅ Backup successfully triggered for directory: {backup_directory}")
-    except Exception as e:
-        print(f"❌ Backup trigger failed: {e}")
-    finally:
-        app_instance.is_backup_running = False
+    from FILE_OPS.backup_jobs import get_backup_manager
+    settings = load_settings()
+    manager = get_backup_manager(settings.get("backup_retention"))
+
+    def backup(directory):
+        conn = cursor = None
+        try:
+            conn, cursor = connect_to_database(**credentials)
+            # Run in non-interactive mode to avoid GUI crashes
+            return backup_database(cursor, directory, interactive=False, raise_errors=True)
+        finally:
+            close_connection(conn, cursor)
+
+    # Verification restores on its own connections too
+    verify = None
+    if settings.get("verify_backups"):
+        from FILE_OPS.backup_verify import verify_backup
+        verify = lambda backup_file: verify_backup(credentials, backup_file)
+
+    if manager.submit(backup_directory, backup, verify_func=verify):
+        print(f"✅ Backup queued for directory: {backup_directory}")
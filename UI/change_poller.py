@@ -0,0 +1,102 @@
+import time
+from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from DB.data_access import connect_to_database, close_connection
+from DB.change_feed import ChangePosition, fetch_changes, latest_change_id, prune_changes
+
+# ChangeFeedPoller Class
+# ---------------------------
+# Polls the change log (DB/change_feed.py) on its own connection every
+# `interval_ms` and emits a ChangeSet through the 'changed' signal
+# whenever another terminal inserted, updated or deleted rows. Changes
+# made by `ignore_sessions` (normally the app's own connection) are left
+# out so a terminal doesn't refresh because of its own edits.
+#
+# dispatch_changes() runs on the GUI thread and hands the ChangeSet to
+# every visible window that implements on_data_changed(changes), so the
+# table viewer, job dialogs and dashboard each decide what to reload.
+#
+# A lost connection is retried with exponential backoff; 'state' reports
+# "live", "reconnecting" or "stopped" for the status bar.
+
+DEFAULT_POLL_INTERVAL_MS = 2000
+MAX_BACKOFF_SECONDS = 60
+PRUNE_EVERY_SECONDS = 3600
+
+
+class ChangeFeedPoller(QThread): #UI
+    """ Background poller for the change log. """
+    changed = pyqtSignal(object)
+    state = pyqtSignal(str)
+
+    def __init__(self, connection_params, ignore_sessions=(), interval_ms=DEFAULT_POLL_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.connection_params = dict(connection_params)
+        self.ignore_sessions = set(ignore_sessions)
+        self.interval_ms = interval_ms
+        self.position = None
+        self._running = True
+
+    def ignore_session(self, session_id):
+        """ Also skips changes made by `session_id` (e.g. the app's connection after a reconnect). """
+        self.ignore_sessions = self.ignore_sessions | {session_id}  # swapped whole: run() reads it on its thread
+
+    def stop(self):
+        self._running = False
+        self.wait(self.interval_ms + 1000)
+
+    def _sleep(self, seconds):
+        """ Sleeps in short steps so stop() returns promptly. """
+        deadline = time.monotonic() + seconds
+        while self._running and time.monotonic() < deadline:
+            self.msleep(100)
+
+    def run(self):
+        conn = cursor = None
+        backoff = 1
+        last_prune = 0
+
+        while self._running:
+            try:
+                if conn is None:
+                    conn, cursor = connect_to_database(**self.connection_params)
+                    if self.position is None:
+                        self.position = ChangePosition(latest_change_id(cursor))  # only report changes from now on
+                    self.state.emit("live")
+                    backoff = 1
+
+                conn.commit()  # new snapshot, so the poll sees rows committed since the last one
+                changes = fetch_changes(cursor, self.position, self.ignore_sessions)
+                if changes:
+                    self.changed.emit(changes)
+
+                if time.monotonic() - last_prune > PRUNE_EVERY_SECONDS:
+                    prune_changes(cursor, conn)
+                    last_prune = time.monotonic()
+
+                self._sleep(self.interval_ms / 1000)
+
+            except Exception as e:
+                print(f"⚠️ Change feed poll failed: {e}")
+                close_connection(conn, cursor)
+                conn = cursor = None
+                self.state.emit("reconnecting")
+                self._sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+        close_connection(conn, cursor)
+        self.state.emit("stopped")
+
+
+def dispatch_changes(changes, skip=None):
+    """ Calls on_data_changed(changes) on every visible window that has it (except `skip`). """
+    for widget in QApplication.topLevelWidgets():
+        if widget is skip:
+            continue
+        handler = getattr(widget, "on_data_changed", None)
+        if handler and widget.isVisible():
+            try:
+                handler(changes)
+            except Exception as e:
+                print(f"⚠️ {type(widget).__name__} failed to apply changes: {e}")
@@ -1,4 +1,6 @@
-import matplotlib.pyplot as plt
+from UTILS.lazy_import import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 
 # 🎨 Centralized Color Palette
@@ -0,0 +1,243 @@
+import time
+from collections import deque
+from PyQt5.QtWidgets import QAbstractItemView
+
+from DB.data_access import fetch_table_chunk, page_row_bounds
+from UI.ui import apply_table_page, insert_table_rows
+
+# InfiniteScroller Class
+# ---------------------------
+# Drives the table viewer in "scroll" mode ("table_view_mode" in
+# settings.json): instead of Prev/Next pages, the grid reads the next
+# keyset chunk (rows after the last (sort value, primary key) shown)
+# whenever the scrollbar gets within a screen of the bottom, and the
+# previous chunk when the user scrolls back to the top of what is loaded.
+# The bound of every loaded row is kept alongside the grid, so chunks
+# continue from exact values rather than the text shown in the cells.
+#
+#   - chunk size adapts after every read: it aims for TARGET_CHUNK_SECONDS
+#     of query time and at most MAX_CHUNK_BYTES per chunk, so narrow tables
+#     load big chunks and wide ones (long notes) small ones
+#   - at most MAX_LOADED_BYTES worth of rows stay in the grid; rows furthest
+#     from the viewport are dropped and read again if the user comes back
+#   - refresh() re-reads only the range that is loaded and diffs it in,
+#     so edits and changes from other terminals keep the scroll position
+
+INITIAL_CHUNK_ROWS = 100
+MIN_CHUNK_ROWS = 25
+MAX_CHUNK_ROWS = 1000
+TARGET_CHUNK_SECONDS = 0.15
+MAX_CHUNK_BYTES = 256 * 1024
+MAX_LOADED_BYTES = 4 * 1024 * 1024
+MIN_LOADED_ROWS = 300
+MAX_LOADED_ROWS = 5000
+
+
+def _clamp(value, low, high):
+    return int(max(low, min(high, value)))
+
+
+class InfiniteScroller: #UI
+    """ Loads and evicts keyset chunks of one table as the grid scrolls. """
+
+    def __init__(self, table_widget, cursor, table_name, page, update_status_callback,
+                 event_filter=None, status_callback=None, chunk_size=INITIAL_CHUNK_ROWS, view=None):
+        """
+        Args:
+            page (dict): The first chunk, already on screen (see fetch_table_page()).
+            view (dict, optional): sort_column / descending / columns for every read.
+        """
+        self.table_widget = table_widget
+        self.cursor = cursor
+        self.table_name = table_name
+        self.primary_key = page["primary_key"]
+        self.update_status_callback = update_status_callback
+        self.event_filter = event_filter
+        self.status_callback = status_callback
+        self.view = dict(view or {})
+
+        self.chunk_size = chunk_size
+        self.max_rows = MAX_LOADED_ROWS
+        self.bounds = deque(page_row_bounds(page))  # (sort value, key) per grid row
+        self.first_row = 0  # number of rows evicted above the grid
+        self.at_end = len(self.bounds) < chunk_size
+        self.paused = False  # e.g. while search results are shown
+        self.loading = False
+
+        # Rows are scrolled one item at a time, so scrollbar values count rows
+        table_widget.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
+        table_widget.verticalScrollBar().valueChanged.connect(self.on_scroll)
+        self._report()
+
+    #--------------------------------------------------------------------
+    # Scrolling
+
+    def on_scroll(self, value):
+        if self.loading or self.paused:
+            return
+        scrollbar = self.table_widget.verticalScrollBar()
+        if value >= scrollbar.maximum() - scrollbar.pageStep() and not self.at_end:
+            self.load_older()
+        elif value <= scrollbar.pageStep() and self.first_row > 0:
+            self.load_newer()
+
+    def load_older(self):
+        """ Appends the chunk after the last loaded row. """
+        if not self.bounds:
+            return
+        limit = self.chunk_size
+        page = self._read(after=self.bounds[-1], limit=limit)
+        if page is None:
+            return
+        if len(page["rows"]) < limit:
+            self.at_end = True
+        if not page["rows"]:
+            return
+
+        self._with_signals_blocked(lambda: self._append(page))
+
+    def load_newer(self):
+        """ Reads back the chunk before the first loaded row (dropped earlier to save memory). """
+        if not self.bounds:
+            return
+        limit = self.chunk_size
+        page = self._read(before=self.bounds[0], limit=limit)
+        if page is None:
+            return
+        if page["rows"]:
+            self._with_signals_blocked(lambda: self._prepend(page))
+        if len(page["rows"]) < limit:
+            self.first_row = 0  # back at the first row
+            self._report()
+
+    def refresh(self):
+        """ Re-reads the loaded range (from the top, when nothing was dropped there) and diffs it in. """
+        if self.paused or not self.bounds:
+            # Search results on screen, or nothing loaded: start over from the top
+            page = fetch_table_chunk(
+                self.cursor, self.table_name, limit=self.chunk_size, refresh_snapshot=True, **self.view
+            )
+            self.first_row = 0
+            self.at_end = len(page["rows"]) < self.chunk_size
+        else:
+            page = fetch_table_chunk(
+                self.cursor, self.table_name,
+                after=self.bounds[0] if self.first_row > 0 else None,
+                before=self.bounds[-1],
+                inclusive=True, refresh_snapshot=True, **self.view
+            )
+            self.at_end = False
+        self.paused = False
+
+        changes = {}
+        def apply():
+            changes.update(apply_table_page(
+                self.table_widget, self.table_name, page, self.update_status_callback, self.event_filter
+            ))
+        self._with_signals_blocked(apply)
+        self.bounds = deque(page_row_bounds(page))
+        self._report()
+        return changes
+
+    def show_chunk(self, page, first_row):
+        """ Replaces what is loaded with `page` (e.g. the rows around a record jumped to). """
+        def apply():
+            self.table_widget.setRowCount(0)
+            apply_table_page(self.table_widget, self.table_name, page, self.update_status_callback, self.event_filter)
+        self._with_signals_blocked(apply)
+        self.bounds = deque(page_row_bounds(page))
+        self.first_row = first_row
+        self.at_end = False
+        self.paused = False
+        self._report()
+
+    def set_view(self, view):
+        """ New sort order or columns: the grid (already emptied by the caller) starts over from the top. """
+        self.view = dict(view or {})
+        self.bounds.clear()
+        self.refresh()
+
+    #--------------------------------------------------------------------
+    # Internals
+
+    def _read(self, **bounds):
+        """ Reads one chunk, timing it to size the next one. Returns None on failure. """
+        self.loading = True
+        started = time.perf_counter()
+        try:
+            page = fetch_table_chunk(self.cursor, self.table_name, **bounds, **self.view)
+        except Exception as e:
+            print(f"❌ ERROR loading rows of {self.table_name}: {e}")
+            if self.status_callback:
+                self.status_callback(f"❌ Could not load more rows: {e}")
+            return None
+        finally:
+            self.loading = False
+
+        self._adapt(page["rows"], time.perf_counter() - started)
+        return page
+
+    def _adapt(self, rows, seconds):
+        """ Picks the next chunk size and the loaded-rows budget from this read. """
+        if not rows:
+            return
+        row_bytes = max(1, sum(len(str(value)) for row in rows for value in row if value is not None) // len(rows))
+        rows_per_second = len(rows) / max(seconds, 0.001)
+
+        target = min(rows_per_second * TARGET_CHUNK_SECONDS, MAX_CHUNK_BYTES / row_bytes)
+        self.chunk_size = _clamp((self.chunk_size + target) / 2, MIN_CHUNK_ROWS, MAX_CHUNK_ROWS)
+        self.max_rows = _clamp(MAX_LOADED_BYTES / row_bytes, MIN_LOADED_ROWS, MAX_LOADED_ROWS)
+
+    def _append(self, page):
+        scrollbar = self.table_widget.verticalScrollBar()
+        insert_table_rows(self.table_widget, self.table_name, self.table_widget.rowCount(), page["rows"],
+                          self.primary_key, self.update_status_callback, self.event_filter)
+        self.bounds.extend(page_row_bounds(page))
+
+        # Drop the rows furthest above the viewport
+        excess = self.table_widget.rowCount() - self.max_rows
+        if excess > 0:
+            value = scrollbar.value()
+            for _ in range(excess):
+                self.table_widget.removeRow(0)
+                self.bounds.popleft()
+            self.first_row += excess
+            scrollbar.setValue(max(0, value - excess))
+        self._report()
+
+    def _prepend(self, page):
+        rows = page["rows"]
+        scrollbar = self.table_widget.verticalScrollBar()
+        value = scrollbar.value()
+        insert_table_rows(self.table_widget, self.table_name, 0, rows,
+                          self.primary_key, self.update_status_callback, self.event_filter)
+        self.bounds.extendleft(reversed(page_row_bounds(page)))
+        self.first_row = max(0, self.first_row - len(rows))
+        scrollbar.setValue(value + len(rows))
+
+        # Drop the rows furthest below the viewport
+        excess = self.table_widget.rowCount() - self.max_rows
+        if excess > 0:
+            for _ in range(excess):
+                self.table_widget.removeRow(self.table_widget.rowCount() - 1)
+                self.bounds.pop()
+            self.at_end = False
+        self._report()
+
+    def _with_signals_blocked(self, action):
+        """ Grid changes here aren't user edits: keep itemChanged and on_scroll quiet. """
+        self.loading = True
+        self.table_widget.blockSignals(True)
+        try:
+            action()
+        finally:
+            self.table_widget.blockSignals(False)
+            self.loading = False
+
+    def _report(self):
+        if self.status_callback:
+            loaded = self.table_widget.rowCount()
+            self.status_callback(
+                f"📜 Rows {self.first_row + 1 if loaded else 0}–{self.first_row + loaded}"
+                f"{'' if self.at_end else ' …'} (next chunk: {self.chunk_size} rows)"
+            )
@@ -1,29 +1,100 @@
+import importlib
+import socket
+import sys
 import time
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from UTILS import profiler
+
 # InitializationThread Class
 # ---------------------------
-# This class simulates the initialization process of an application
-# using a background thread. It extends QThread to run the loading
-# process in a separate thread, so the main UI remains responsive.
-#
-# The run() method simulates a task by emitting progress values from
-# 0 to 100, with a small delay (0.05 seconds) between each value 
-# to mimic work being done (such as loading or initializing resources).
+# This class runs the application's startup pipeline in a background
+# thread so the splash screen stays responsive while real work is done.
 #
-# The progress values are emitted through the 'progress' signal 
-# (pyqtSignal), which can be connected to a UI element such as a 
-# progress bar to show the user the current loading status.
+# The pipeline is a list of stages, each a tuple of
+# (name, splash message, weight, callable). Stages run in order; the
+# return value of each one is stored in `results[name]` and the time it
+# took in `timings`. A failing stage is recorded in `errors` and the
+# pipeline carries on, so a missing settings file or an unreachable
+# host never blocks the login screen.
 #
-# The InitializationThread class is useful for showing loading 
-# progress without freezing the main user interface.
+# Progress is emitted through the 'progress' signal as the share of the
+# total stage weight completed so far (0-100), and the current stage's
+# message through the 'status' signal, so both can be wired straight
+# to SplashScreen.update_progress / set_status_message.
+
+DEFAULT_DB_PORT = 3306
+
 
 class InitializationThread(QThread): #UI
-    """ Simulates application initialization with a progress signal. """
+    """ Runs the startup stages and reports genuine progress. """
     progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+
+    def __init__(self, stages=None, parent=None):
+        super().__init__(parent)
+        self.stages = list(stages or [])
+        self.results = {}
+        self.timings = []
+        self.errors = []
 
     def run(self):
-        """ Simulates the application startup process """
-        for i in range(101):  # Simulating a loading process
-            time.sleep(0.05)  # Simulate work being done
-            self.progress.emit(i)  # Emit progress value
+        """ Runs every stage in order, emitting progress after each one. """
+        total = sum(weight for _, _, weight, _ in self.stages) or 1
+        done = 0
+
+        for name, message, weight, func in self.stages:
+            self.status.emit(message)
+            started = time.perf_counter()
+            try:
+                with profiler.span(name, "startup"):
+                    self.results[name] = func()
+            except Exception as e:
+                print(f"⚠️ Startup stage '{name}' failed: {e}")
+                self.errors.append((name, str(e)))
+            self.timings.append((name, time.perf_counter() - started))
+
+            done += weight
+            self.progress.emit(int(done * 100 / total))
+
+        self.progress.emit(100)
+
+
+#--------------------------------------------------------------------
+# Stage helpers
+
+def warm_imports(module_names):
+    """
+    Imports modules that aren't loaded yet so the GUI thread finds them in sys.modules.
+
+    Returns:
+        list: The modules that were actually imported by this call.
+    """
+    loaded = []
+    for name in module_names:
+        if name in sys.modules:
+            continue
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except ImportError as e:
+            print(f"⚠️ Could not pre-import {name}: {e}")
+    return loaded
+
+def ping_database(host, port=DEFAULT_DB_PORT, timeout=0.5):
+    """
+    Checks that the database host accepts TCP connections.
+
+    Credentials are only known after login, so this is a reachability check
+    rather than a real connection; it lets the login page warn early.
+
+    Returns:
+        bool: True if the port answered within `timeout` seconds.
+    """
+    if not host:
+        return False
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
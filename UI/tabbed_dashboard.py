@@ -2,7 +2,8 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QTabWidget,
     QPushButton
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+import time
 
 from UI.ui import (
     create_scrollable_area,
@@ -35,6 +36,11 @@ from UI.charts import (
 )
 
 
+# Tables whose changes (reported by the change feed) make the charts stale
+DASHBOARD_TABLES = ("jobs", "customers", "walkins", "howheard")
+DASHBOARD_REFRESH_SECONDS = 60
+
+
 class TabbedDashboard(QDialog):
     def __init__(self, parent=None, cursor=None):
         super().__init__(parent)
@@ -52,12 +58,23 @@ class TabbedDashboard(QDialog):
         layout = QVBoxLayout()
         self.tabs = QTabWidget()
 
-        self.tabs.addTab(self.build_summary_tab(), "Summary")
-        self.tabs.addTab(self.build_customers_tab(), "Customers")
-        self.tabs.addTab(self.build_devices_tab(), "Devices")
-        self.tabs.addTab(self.build_technicians_tab(), "Technicians")
-        self.tabs.addTab(self.build_timing_tab(), "Timing")
-        self.tabs.addTab(self.build_walkins_tab(), "Walk-Ins")
+        self.tab_builders = [
+            (self.build_summary_tab, "Summary"),
+            (self.build_customers_tab, "Customers"),
+            (self.build_devices_tab, "Devices"),
+            (self.build_technicians_tab, "Technicians"),
+            (self.build_timing_tab, "Timing"),
+            (self.build_walkins_tab, "Walk-Ins"),
+        ]
+        for build, label in self.tab_builders:
+            self.tabs.addTab(build(), label)
+
+        # 🔔 Live updates: tabs go stale when their data changes elsewhere and
+        #    are rebuilt when shown, at most once per DASHBOARD_REFRESH_SECONDS
+        self.stale_tabs = set()
+        self.last_refresh = time.monotonic()
+        self.refresh_pending = False
+        self.tabs.currentChanged.connect(self.rebuild_if_stale)
 
         layout.addWidget(self.tabs)
 
@@ -81,6 +98,38 @@ class TabbedDashboard(QDialog):
         layout.addWidget(exit_button, alignment=Qt.AlignRight)
         self.setLayout(layout)
 
+    def on_data_changed(self, changes):
+        """ Marks every tab stale when dashboard tables change, then refreshes the visible one. """
+        if not any(changes.touches(table) for table in DASHBOARD_TABLES):
+            return
+        self.stale_tabs.update(range(self.tabs.count()))
+
+        wait = DASHBOARD_REFRESH_SECONDS - (time.monotonic() - self.last_refresh)
+        if wait <= 0:
+            self.rebuild_if_stale(self.tabs.currentIndex())
+        elif not self.refresh_pending:
+            self.refresh_pending = True
+            QTimer.singleShot(int(wait * 1000), lambda: self.rebuild_if_stale(self.tabs.currentIndex()))
+
+    def rebuild_if_stale(self, index):
+        self.refresh_pending = False
+        if index not in self.stale_tabs or not self.isVisible():
+            return
+        self.stale_tabs.discard(index)
+        self.last_refresh = time.monotonic()
+
+        if hasattr(self.cursor, "connection"):
+            self.cursor.connection.commit()  # new snapshot so the charts see other terminals' commits
+
+        build, label = self.tab_builders[index]
+        self.tabs.blockSignals(True)
+        old = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        old.deleteLater()  # removeTab() only detaches the page; free it and its charts
+        self.tabs.insertTab(index, build(), label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+
     def build_tab(self, chart_blocks):
         scroll_area, layout = create_scrollable_area()
 
@@ -7,7 +7,7 @@ from datetime import datetime
 # ─────────────────────────────────────────────────────────────────────────────
 # 🎨 PyQt5 - Core
 from PyQt5.QtCore import (
-    Qt, QEvent, QPropertyAnimation, QEasingCurve
+    Qt, QEvent, QPropertyAnimation, QEasingCurve, QTimer
 )
 
 # 🎨 PyQt5 - GUI Elements
@@ -17,7 +17,7 @@ from PyQt5.QtGui import (
 
 # 🧱 PyQt5 - Widgets
 from PyQt5.QtWidgets import (
-    QAction, QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout, QFrame,
+    QApplication, QAction, QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout, QFrame,
     QGroupBox, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget,
     QListWidgetItem, QMessageBox, QPushButton, QScrollArea, QSizePolicy,
     QStyle, QTableWidget, QTableWidgetItem, QTabWidget, QTextEdit,
@@ -26,24 +26,29 @@ from PyQt5.QtWidgets import (
 )
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 📊 Matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+# 📊 Matplotlib / pandas (deferred until a chart, report or export needs them)
+from UTILS.lazy_import import lazy_import, prewarm
+from UTILS import profiler
+
+plt = lazy_import("matplotlib.pyplot")
+qt_backend = lazy_import("matplotlib.backends.backend_qt5agg")
+pd = lazy_import("pandas")
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🧩 Project Modules
 from DB.data_access import (
-    close_connection, fetch_table_data, fetch_primary_key_column,
-    execute_sql_query, export_query_results_to_excel
+    close_connection, clear_schema_cache, get_schema, fetch_table_page,
+    execute_sql_query, export_query_results_to_excel,
+    compact_auto_increment, get_pending_key_maintenance, get_key_maintenance_policy
 )
 from FILE_OPS.file_ops import (
     view_current_schedule, clear_current_schedule,
     save_backup_schedule, export_database_to_excel, save_database_config
 )
 from UTILS.db_utils import restore_database, change_db_password, backup_database
-
-# 🧾 Data Handling
-import pandas as pd
+from DB.query_stats import QUERY_STATS, HISTOGRAM_BUCKETS_MS
+from DB.change_feed import install_change_feed
+from FILE_OPS.data_import import import_file, write_error_report, DEFAULT_BATCH_SIZE
 
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QHBoxLayout, QLineEdit, QPushButton, QListWidget, QAbstractItemView, QScrollArea, QFrame, QTableWidget, QAction, QStyle, QTableWidgetItem
 from PyQt5.QtCore import Qt
@@ -509,9 +514,9 @@ def main_menu_page(parent, username ="User"):
 
     button_data = [
         ("📁  Tables", parent.view_tables),
-        ("📝  Add Job Notes", lambda: ask_for_job_id(parent, parent.view_notes)),
+        ("📝  Add Job Notes", lambda: ask_for_job_id(parent, parent.view_notes, parent.recent_job_choices())),
         ("🔍  Query", lambda: run_query(parent.cursor, parent.conn, parent)),
-        ("📑  Customer Lookup", lambda: ask_for_job_id(parent, parent.Customer_report)),
+        ("📑  Customer Lookup", lambda: ask_for_job_id(parent, parent.Customer_report, parent.recent_job_choices())),
         ("📊  Dashboard", parent.dashboard_page),
         ("⚙️  Settings", lambda: options_page(parent))
     ]
@@ -617,6 +622,10 @@ def options_page(parent):
     export_button.clicked.connect(lambda: export_database_to_excel(parent, parent.cursor))
     group_layout.addWidget(export_button)
 
+    import_button = QPushButton("📤 Import Data from CSV / Excel")
+    import_button.clicked.connect(lambda: open_import_dialog(parent))
+    group_layout.addWidget(import_button)
+
     backup_button = QPushButton("💾 Backup Database")
     backup_button.clicked.connect(lambda: backup_database(parent.cursor))
     group_layout.addWidget(backup_button)
@@ -635,6 +644,18 @@ def options_page(parent):
     )
     group_layout.addWidget(change_password_button)
 
+    query_stats_button = QPushButton("📈 Query Stats")
+    query_stats_button.clicked.connect(lambda: open_query_stats_dialog(parent))
+    group_layout.addWidget(query_stats_button)
+
+    compact_button = QPushButton("🧹 Compact ID Counters")
+    compact_button.clicked.connect(lambda: run_key_compaction(parent))
+    group_layout.addWidget(compact_button)
+
+    live_updates_button = QPushButton("🔔 Enable Live Updates")
+    live_updates_button.clicked.connect(lambda: enable_live_updates(parent))
+    group_layout.addWidget(live_updates_button)
+
     action_group.setLayout(group_layout)
     layout.addWidget(action_group)
 
@@ -901,10 +922,9 @@ def create_customer_report_window(parent, customer_id, customer_info, customer_c
 
 
 #Navigation
-def refresh_page(parent, offset=None):
+def refresh_page(parent, offset=None, page=None):
     parent.table_widget.blockSignals(True)
-    parent.table_widget.setRowCount(0)
-    
+
     load_table(
         table_widget=parent.table_widget,
         cursor=parent.cursor,
@@ -912,7 +932,8 @@ def refresh_page(parent, offset=None):
         update_status_callback=parent.update_status_and_database,
         table_offset=offset if offset is not None else parent.table_offset,
         limit=parent.table_limit,
-        event_filter=parent
+        event_filter=parent,
+        page=page
     )
 
     parent.table_widget.blockSignals(False)
@@ -944,16 +965,33 @@ def handle_logout(ui_instance):
     if confirm != QMessageBox.Yes:
         return
 
+    # 🧹 Flush deferred AUTO_INCREMENT maintenance while we still have a connection
+    if get_pending_key_maintenance() and getattr(ui_instance, "cursor", None):
+        try:
+            compact_auto_increment(ui_instance.cursor, ui_instance.conn)
+        except Exception as e:
+            print(f"⚠️ Deferred key maintenance failed: {e}")
+
     # ✅ Close connection using your helper
+    clear_schema_cache()
     ui_instance.conn, ui_instance.cursor = close_connection(
         conn=getattr(ui_instance, "conn", None),
         cursor=getattr(ui_instance, "cursor", None)
     )
+    ui_instance.connection_params = None
 
     QMessageBox.information(ui_instance, "Logged Out", "✅ Returning to Login...")
 
     # ✅ Navigate back to login
     ui_instance.central_widget.setCurrentWidget(ui_instance.login_page)
+POST_LOGIN_MODULES = (
+    "pandas",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_qt5agg",
+    "openpyxl",
+    "UI.tabbed_dashboard",
+)
+
 def handle_login(ui_instance, database_config, connect_func, on_success_callback):
     """
     Handles login interaction, connection attempt, and page transition.
@@ -978,15 +1016,27 @@ def handle_login(ui_instance, database_config, connect_func, on_success_callback
         return
 
     try:
-        conn, cursor = connect_func(
-            username, password, host, database, ssl_enabled, ssl_cert_path
-        )
+        # ⏱ Only the connect and schema warm-up are timed, not the dialogs below
+        with profiler.span("handle_login", "db"):
+            conn, cursor = connect_func(
+                username, password, host, database, ssl_enabled, ssl_cert_path
+            )
+
+            # Store connection info
+            ui_instance.conn = conn
+            ui_instance.cursor = cursor
+            ui_instance.username = username
+            ui_instance.connection_params = {
+                "username": username, "password": password, "host": host, "database": database,
+                "ssl_enabled": ssl_enabled, "ssl_path": ssl_cert_path,
+            }
+            ui_instance.role = "Technician"  # Swap for actual role lookup if available
 
-        # Store connection info
-        ui_instance.conn = conn
-        ui_instance.cursor = cursor
-        ui_instance.username = username
-        ui_instance.role = "Technician"  # Swap for actual role lookup if available
+            # Warm the schema cache now so the first table / import dialog doesn't pay for it
+            try:
+                get_schema(cursor)
+            except Exception as e:
+                print(f"⚠️ Schema warm-up failed: {e}")
 
         # Success feedback
         success_msg = QMessageBox(ui_instance)
@@ -1003,6 +1053,9 @@ def handle_login(ui_instance, database_config, connect_func, on_success_callback
         # Cleanup
         ui_instance.password_entry.clear()
 
+        # 🔥 Load the charting / export stack in the background while the menu is shown
+        prewarm(POST_LOGIN_MODULES)
+
         # Redirect to main app view
         on_success_callback(ui_instance)
 
@@ -1163,6 +1216,153 @@ def confirm_deletion_bulk(parent_widget, count):
 
     msg_box.exec_()
     return msg_box.clickedButton() == yes_btn
+def bulk_edit_dialog(parent_widget, columns, row_count, status_options):
+    """
+    Asks which column to change and the new value for a multi-row selection.
+
+    Args:
+        parent_widget: Dialog owner.
+        columns (list): Editable column names (primary key excluded).
+        row_count (int): Number of selected rows, shown in the title.
+        status_options (list): Choices offered when the Status column is picked.
+
+    Returns:
+        tuple or None: (column_name, new_value) or None if cancelled.
+    """
+    dialog = QDialog(parent_widget)
+    dialog.setWindowTitle(f"✏️ Bulk Edit {row_count} Record(s)")
+    dialog.setMinimumWidth(380)
+    dialog.setStyleSheet("""
+        QDialog {
+            background-color: #2E2E2E;
+            color: white;
+            font-size: 15px;
+        }
+        QLabel {
+            color: #3A9EF5;
+            font-weight: bold;
+        }
+        QLineEdit, QComboBox {
+            background-color: #383838;
+            color: white;
+            border: 1px solid #3A9EF5;
+            border-radius: 6px;
+            padding: 6px;
+        }
+        QPushButton {
+            background-color: #3A9EF5;
+            color: white;
+            padding: 6px 14px;
+            font-weight: bold;
+            border-radius: 6px;
+        }
+        QPushButton:hover {
+            background-color: #1E7BCC;
+        }
+    """)
+
+    layout = QVBoxLayout(dialog)
+
+    layout.addWidget(QLabel("Column:"))
+    column_box = QComboBox()
+    column_box.addItems(columns)
+    layout.addWidget(column_box)
+
+    layout.addWidget(QLabel("New value (leave empty for NULL):"))
+    value_entry = QLineEdit()
+    status_box = QComboBox()
+    status_box.addItems(status_options)
+    layout.addWidget(value_entry)
+    layout.addWidget(status_box)
+
+    def on_column_changed(column):
+        is_status = column.lower() == "status"
+        status_box.setVisible(is_status)
+        value_entry.setVisible(not is_status)
+
+    column_box.currentTextChanged.connect(on_column_changed)
+    on_column_changed(column_box.currentText())
+
+    button_row = QHBoxLayout()
+    apply_button = QPushButton("✅ Apply")
+    cancel_button = QPushButton("❌ Cancel")
+    apply_button.clicked.connect(dialog.accept)
+    cancel_button.clicked.connect(dialog.reject)
+    button_row.addWidget(apply_button)
+    button_row.addWidget(cancel_button)
+    layout.addLayout(button_row)
+
+    if dialog.exec_() != QDialog.Accepted:
+        return None
+
+    column = column_box.currentText()
+    if column.lower() == "status":
+        return column, status_box.currentText()
+    return column, value_entry.text().strip() or None
+def choose_columns_dialog(parent_widget, columns, visible, required=()):
+    """
+    Asks which columns the table viewer should show (and select from the database).
+
+    Args:
+        columns (list): Every column of the table, in table order.
+        visible (list or None): Columns shown now; None means all.
+        required (tuple): Columns that can't be hidden (the primary key).
+
+    Returns:
+        list or None: Columns to show (None if cancelled), in table order.
+    """
+    dialog = QDialog(parent_widget)
+    dialog.setWindowTitle("🧩 Visible Columns")
+    dialog.setMinimumWidth(320)
+    dialog.setStyleSheet("""
+        QDialog, QListWidget {
+            background-color: #2E2E2E;
+            color: white;
+            font-size: 14px;
+        }
+        QPushButton {
+            background-color: #3A9EF5;
+            color: white;
+            padding: 6px 14px;
+            font-weight: bold;
+            border-radius: 6px;
+        }
+        QPushButton:hover {
+            background-color: #1E7BCC;
+        }
+    """)
+
+    layout = QVBoxLayout(dialog)
+    layout.addWidget(QLabel("Hidden columns aren't fetched, so wide ones (notes) make the grid faster to load."))
+
+    column_list = QListWidget()
+    for column in columns:
+        item = QListWidgetItem(column)
+        if column in required:
+            item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
+            item.setCheckState(Qt.Checked)
+        else:
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if visible is None or column in visible else Qt.Unchecked)
+        column_list.addItem(item)
+    layout.addWidget(column_list)
+
+    button_row = QHBoxLayout()
+    apply_button = QPushButton("✅ Apply")
+    cancel_button = QPushButton("❌ Cancel")
+    apply_button.clicked.connect(dialog.accept)
+    cancel_button.clicked.connect(dialog.reject)
+    button_row.addWidget(apply_button)
+    button_row.addWidget(cancel_button)
+    layout.addLayout(button_row)
+
+    if dialog.exec_() != QDialog.Accepted:
+        return None
+
+    return [
+        column_list.item(i).text() for i in range(column_list.count())
+        if column_list.item(i).checkState() == Qt.Checked
+    ]
 def _custom_messagebox_stylesheet():
     return """
         QMessageBox {
@@ -1211,7 +1411,7 @@ def keyPressEvent(parent, event):
     #               Job_Editor
     #============================================
 
-def ask_for_job_id(parent, on_valid_input):
+def ask_for_job_id(parent, on_valid_input, recent=None):
     """
     Prompts the user for a Job ID with validation and modern dark-themed styling.
     If valid, it calls the provided on_valid_input(job_id) function.
@@ -1219,6 +1419,8 @@ def ask_for_job_id(parent, on_valid_input):
     Args:
         parent: The parent QWidget (for dialog positioning and ownership).
         on_valid_input (function): A function to call with the valid job_id string.
+        recent (list, optional): Recent job labels ("12345 — Jane Doe · ...") offered
+                                 in an editable drop-down; typing an ID still works.
     """
 
     # --- Custom Input Dialog ---
@@ -1226,7 +1428,11 @@ def ask_for_job_id(parent, on_valid_input):
     input_dialog.setWindowTitle("🔍 Search Job")
     input_dialog.setLabelText("Enter Job ID:")
     input_dialog.setInputMode(QInputDialog.TextInput)
-    input_dialog.setFixedSize(400, 150)
+    if recent:
+        input_dialog.setComboBoxItems(recent)
+        input_dialog.setComboBoxEditable(True)
+        input_dialog.setTextValue("")
+    input_dialog.setFixedSize(400 if not recent else 520, 150)
     input_dialog.setOkButtonText("Search")
     input_dialog.setCancelButtonText("Cancel")
 
@@ -1281,6 +1487,8 @@ def ask_for_job_id(parent, on_valid_input):
 
     if input_dialog.exec_() == QInputDialog.Accepted:
         job_id = input_dialog.textValue().strip()
+        if recent:
+            job_id = job_id.split("—")[0].strip()  # a picked recent job: keep just the ID
 
         if not job_id.isdigit():
             # --- Custom Styled Warning Box ---
@@ -1308,7 +1516,7 @@ def ask_for_job_id(parent, on_valid_input):
                 }
             """)
             msg.exec_()
-            return ask_for_job_id(parent, on_valid_input)  # Re-prompt recursively
+            return ask_for_job_id(parent, on_valid_input, recent)  # Re-prompt recursively
         else:
             on_valid_input(job_id)
 def edit_selected_job(parent):
@@ -1408,7 +1616,7 @@ def wrap_in_card(widget):
 # 🪄 Add a chart to the layout with title and card wrap
 def add_chart_to_layout(fig, layout, title=""):
     fig.suptitle(title, fontsize=14, fontweight='bold')
-    canvas = FigureCanvas(fig)
+    canvas = qt_backend.FigureCanvasQTAgg(fig)
     canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
     canvas.setFixedHeight(400)
 
@@ -1678,6 +1886,318 @@ def open_scheduling_options_dialog(parent):
 
     scheduling_dialog.setLayout(layout)
     scheduling_dialog.exec_() 
+def open_import_dialog(parent):
+    """
+    Opens the bulk import dialog: pick a CSV/Excel file and a target table,
+    optionally dry-run, then stream the rows in with batched inserts.
+
+    Args:
+        parent: The main window, must have `cursor` and `conn`.
+    """
+    dialog = QDialog(parent)
+    dialog.setWindowTitle("📤 Import Data")
+    dialog.setMinimumSize(560, 520)
+    dialog.setStyleSheet("""
+        QDialog {
+            background-color: #1E1E1E;
+            color: white;
+        }
+        QLabel {
+            font-size: 14px;
+            font-weight: bold;
+            color: #3A9EF5;
+        }
+        QLineEdit, QComboBox, QTextEdit {
+            background-color: #2A2A2A;
+            color: white;
+            border: 1px solid #3A9EF5;
+            border-radius: 5px;
+            padding: 6px;
+        }
+        QCheckBox {
+            color: white;
+        }
+        QPushButton {
+            background-color: #3A9EF5;
+            color: white;
+            font-weight: bold;
+            padding: 8px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #1D7DD7;
+        }
+    """)
+
+    layout = QVBoxLayout()
+
+    # 📄 Source file
+    layout.addWidget(QLabel("📄 Source File (.csv / .xlsx):"))
+    file_row = QHBoxLayout()
+    file_entry = QLineEdit()
+    file_entry.setPlaceholderText("Choose a file to import")
+    browse_button = QPushButton("📁 Browse")
+    file_row.addWidget(file_entry)
+    file_row.addWidget(browse_button)
+    layout.addLayout(file_row)
+
+    def browse_file():
+        path, _ = QFileDialog.getOpenFileName(
+            dialog, "Select Import File", "", "Data Files (*.csv *.xlsx *.xlsm);;All Files (*)"
+        )
+        if path:
+            file_entry.setText(path)
+
+    browse_button.clicked.connect(browse_file)
+
+    # 🗄 Target table
+    layout.addWidget(QLabel("🗄 Target Table:"))
+    table_box = QComboBox()
+    try:
+        table_box.addItems(sorted(get_schema(parent.cursor).keys()))
+    except Exception as e:
+        QMessageBox.critical(parent, "❌ Error", f"Could not read tables:\n{e}")
+        return
+    layout.addWidget(table_box)
+
+    # ⚙ Options
+    options_row = QHBoxLayout()
+    dry_run_checkbox = QCheckBox("🧪 Dry run (validate only)")
+    dry_run_checkbox.setChecked(True)
+    batch_entry = QLineEdit(str(DEFAULT_BATCH_SIZE))
+    batch_entry.setFixedWidth(90)
+    options_row.addWidget(dry_run_checkbox)
+    options_row.addStretch(1)
+    options_row.addWidget(QLabel("Batch size:"))
+    options_row.addWidget(batch_entry)
+    layout.addLayout(options_row)
+
+    # 📋 Results
+    results_box = QTextEdit()
+    results_box.setReadOnly(True)
+    layout.addWidget(results_box)
+
+    run_button = QPushButton("🚀 Run Import")
+    layout.addWidget(run_button)
+
+    def run_import():
+        file_path = file_entry.text().strip()
+        if not file_path or not os.path.isfile(file_path):
+            QMessageBox.warning(dialog, "⚠ Input Error", "Please choose an existing file.")
+            return
+
+        try:
+            batch_size = max(1, int(batch_entry.text().strip()))
+        except ValueError:
+            QMessageBox.warning(dialog, "⚠ Input Error", "Batch size must be a number.")
+            return
+
+        dry_run = dry_run_checkbox.isChecked()
+        run_button.setEnabled(False)
+        results_box.setPlainText("⏳ Importing...")
+
+        def on_progress(rows_read):
+            results_box.setPlainText(f"⏳ {rows_read} rows processed...")
+            QApplication.processEvents()
+
+        try:
+            result = import_file(
+                parent.cursor, parent.conn, file_path, table_box.currentText(),
+                batch_size=batch_size, dry_run=dry_run, progress_callback=on_progress
+            )
+        except Exception as e:
+            results_box.setPlainText(f"❌ Import failed: {e}")
+            run_button.setEnabled(True)
+            return
+        finally:
+            # Batches committed before a failure count too: cached pages of the table are stale
+            if not dry_run and hasattr(parent, "invalidate_pages"):
+                parent.invalidate_pages(table_box.currentText())
+
+        lines = [
+            f"{'🧪 Dry run' if dry_run else '✅ Import'} into '{result['table']}' finished "
+            f"in {result['elapsed']:.2f}s ({result['rows_per_second']:.0f} rows/s)",
+            f"📥 Rows read: {result['rows_read']}",
+            f"✔ Rows valid: {result['rows_valid']}",
+            f"💾 Rows inserted: {result['rows_inserted']}",
+            f"🔗 Mapped columns: {', '.join(result['mapped_columns'])}",
+        ]
+        if result["unmapped_headers"]:
+            lines.append(f"⚠ Ignored headers: {', '.join(str(h) for h in result['unmapped_headers'])}")
+
+        if result["errors"]:
+            report_path = write_error_report(result, os.path.splitext(file_path)[0] + "_import_errors.csv")
+            lines.append(f"❌ {len(result['errors'])} error(s), report saved to:\n{report_path}")
+            lines.extend(
+                f"   Line {line}: {column} = {value!r} → {message}"
+                for line, column, value, message in result["errors"][:20]
+            )
+
+        results_box.setPlainText("\n".join(lines))
+        run_button.setEnabled(True)
+
+    run_button.clicked.connect(run_import)
+
+    close_button = QPushButton("❌ Close")
+    close_button.clicked.connect(dialog.close)
+    layout.addWidget(close_button)
+
+    dialog.setLayout(layout)
+    dialog.exec_()
+def run_key_compaction(parent):
+    """
+    Runs the batched AUTO_INCREMENT compaction. Queued tables are compacted
+    first; with nothing queued, every table in the database is checked.
+    """
+    pending = get_pending_key_maintenance()
+    tables = list(pending) if pending else list(get_schema(parent.cursor))
+
+    try:
+        altered = compact_auto_increment(parent.cursor, parent.conn, tables)
+    except Exception as e:
+        QMessageBox.critical(parent, "❌ Compaction Failed", f"Could not compact ID counters:\n{e}")
+        return
+
+    if altered:
+        details = "\n".join(f"• {table}: {old} → {new}" for table, old, new in altered)
+        message = f"✅ Reset {len(altered)} ID counter(s):\n\n{details}"
+    else:
+        message = f"✅ All ID counters are already up to date ({len(tables)} table(s) checked)."
+
+    QMessageBox.information(
+        parent, "🧹 Compact ID Counters",
+        f"{message}\n\nPolicy: {get_key_maintenance_policy()}"
+    )
+def enable_live_updates(parent):
+    """
+    Installs the change feed triggers for this database (every terminal then
+    sees each other's edits without refreshing) and starts polling here.
+    """
+    confirm = QMessageBox.question(
+        parent, "🔔 Enable Live Updates",
+        "This adds a change log table and insert/update/delete triggers to every table "
+        "(needs the TRIGGER privilege). Continue?",
+        QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+    )
+    if confirm != QMessageBox.Yes:
+        return
+
+    try:
+        tracked = install_change_feed(parent.cursor, parent.conn)
+    except Exception as e:
+        QMessageBox.critical(parent, "❌ Live Updates", f"Could not install the change feed:\n{e}")
+        return
+
+    parent.start_change_feed()
+    QMessageBox.information(
+        parent, "🔔 Live Updates",
+        f"✅ Tracking changes to {len(tracked)} table(s):\n\n{', '.join(sorted(tracked))}"
+    )
+def open_query_stats_dialog(parent, refresh_ms=2000):
+    """
+    Shows live per-statement timings from QUERY_STATS, grouped by fingerprint.
+    The table refreshes every `refresh_ms` while the dialog is open.
+    """
+    dialog = QDialog(parent)
+    dialog.setWindowTitle("📈 Query Stats")
+    dialog.setMinimumSize(980, 560)
+    dialog.setStyleSheet("""
+        QDialog {
+            background-color: #1E1E1E;
+            color: white;
+        }
+        QLabel {
+            font-size: 14px;
+            font-weight: bold;
+            color: #3A9EF5;
+        }
+        QTableWidget {
+            background-color: #242424;
+            color: white;
+            gridline-color: #3A3A3A;
+        }
+        QHeaderView::section {
+            background-color: #3A9EF5;
+            color: white;
+            font-weight: bold;
+            padding: 4px;
+        }
+        QPushButton {
+            background-color: #3A9EF5;
+            color: white;
+            font-weight: bold;
+            padding: 8px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #1D7DD7;
+        }
+    """)
+
+    layout = QVBoxLayout()
+    summary_label = QLabel()
+    layout.addWidget(summary_label)
+
+    headers = ["Statement", "Calls", "Total ms", "Avg ms", "p95 ms", "Max ms", "Rows", "Top Caller"]
+    table = QTableWidget(0, len(headers))
+    table.setHorizontalHeaderLabels(headers)
+    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table.setSelectionBehavior(QAbstractItemView.SelectRows)
+    table.verticalHeader().setVisible(False)
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+    layout.addWidget(table)
+
+    def refresh():
+        stats = QUERY_STATS.snapshot()
+        total_calls = sum(row["count"] for row in stats)
+        total_ms = sum(row["total_ms"] for row in stats)
+        conn = getattr(parent, "conn", None)
+        prepared = ""
+        if hasattr(conn, "prepared_statement_count"):
+            prepared = f" — {conn.prepared_statement_count()} prepared statement(s), {conn.prepared_hits} reuse(s)"
+        summary_label.setText(
+            f"⏱ {total_calls} statement(s), {total_ms:,.0f} ms total across {len(stats)} fingerprint(s) "
+            f"— slow threshold {QUERY_STATS.slow_query_ms} ms{prepared}"
+        )
+
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(stats))
+        for row_idx, row in enumerate(stats):
+            p95 = row["p95_ms"]
+            values = [
+                row["fingerprint"],
+                str(row["count"]),
+                f"{row['total_ms']:.1f}",
+                f"{row['avg_ms']:.2f}",
+                f"≤ {p95}" if p95 is not None else f"> {HISTOGRAM_BUCKETS_MS[-1]}",
+                f"{row['max_ms']:.1f}",
+                str(row["rows"]),
+                row["top_caller"],
+            ]
+            for col_idx, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if col_idx == 0:
+                    item.setToolTip(row["fingerprint"])
+                table.setItem(row_idx, col_idx, item)
+        table.setUpdatesEnabled(True)
+
+    button_row = QHBoxLayout()
+    reset_button = QPushButton("🔄 Reset")
+    reset_button.clicked.connect(lambda: (QUERY_STATS.reset(), refresh()))
+    close_button = QPushButton("❌ Close")
+    close_button.clicked.connect(dialog.close)
+    button_row.addWidget(reset_button)
+    button_row.addWidget(close_button)
+    layout.addLayout(button_row)
+
+    timer = QTimer(dialog)
+    timer.timeout.connect(refresh)
+    timer.start(refresh_ms)
+    refresh()
+
+    dialog.setLayout(layout)
+    dialog.exec_()
+    timer.stop()
 def show_save_feedback(result, parent_window, central_widget, login_page):
     """Display success or error message based on result content."""
     msg_box = QMessageBox(parent_window)
@@ -1718,6 +2238,8 @@ def show_save_feedback(result, parent_window, central_widget, login_page):
     #               Table Management
     #============================================
 
+JOB_STATUSES = ["Waiting for Parts", "In Progress", "Completed", "Picked Up", "Cancelled"]
+
 def display_tables_ui(tables, on_table_select_callback):
     """
     Displays a modern searchable UI listing the tables.
@@ -1855,101 +2377,237 @@ def display_tables_ui(tables, on_table_select_callback):
     animation.start()
 
     dialog.exec_()
-def load_table(table_widget, cursor, table_name, update_status_callback, table_offset=0, limit=50, event_filter=None):
-
-        # ✅ Refresh the connection
-    if hasattr(cursor, "connection"):
-        cursor.connection.commit()  # Pull latest committed data
-        cursor = cursor.connection.cursor()  # Create a fresh cursor
+def load_table(table_widget, cursor, table_name, update_status_callback, table_offset=0, limit=50, event_filter=None,
+               page=None, count_mode=None, view=None):
+    """
+    Shows one page of `table_name` in the grid (see apply_table_page()).
 
-    data = fetch_table_data(cursor, table_name, limit, table_offset)
-    total_rows = len(data)
+    Args:
+        page (dict, optional): A page already fetched with fetch_table_page(); when
+                               given, no query is run.
+        count_mode (str, optional): Passed to fetch_table_page() when fetching here;
+                                    None keeps paging to the single page query.
+        view (dict, optional): sort_column / descending / columns for fetch_table_page().
 
-    primary_key_column = fetch_primary_key_column(cursor, table_name)
-    data = fetch_table_data(cursor, table_name, limit, table_offset, order_by=primary_key_column)
+    Returns:
+        dict or None: The page that was shown (rows, columns, primary_key, total_rows,
+                      total_exact, changes), or None if the table has no primary key.
+    """
+    if page is None:
+        page = fetch_table_page(cursor, table_name, limit, table_offset, count_mode=count_mode, **(view or {}))
 
-    if not primary_key_column:
+    if not page["primary_key"]:
         print(f"❌ ERROR: No primary key found for table {table_name}.")
-        return
+        return None
 
-    # Determine primary key column index
-    primary_key_index = next(
+    page["changes"] = apply_table_page(table_widget, table_name, page, update_status_callback, event_filter)
+    return page
+
+#--------------------------------------------------------------------
+# Incremental grid updates
+#
+# Each row's primary key item carries the key (Qt.UserRole) and a hash of
+# the row's values (ROW_HASH_ROLE). A refresh compares the fetched page
+# with what is on screen by key and only inserts, updates or removes the
+# rows that differ, so scroll position, selection and untouched status
+# combos survive. When most of the page is new (paging), the grid is
+# rebuilt in one go instead.
+
+ROW_HASH_ROLE = Qt.UserRole + 1
+
+def _row_hash(row_data):
+    return hash(tuple("" if value is None else str(value) for value in row_data))
+
+def _status_column_index(table_widget, table_name):
+    if table_name != "jobs":
+        return None
+    return next(
         (i for i in range(table_widget.columnCount())
-         if table_widget.horizontalHeaderItem(i).text() == primary_key_column),
+         if table_widget.horizontalHeaderItem(i).text().lower() == "status"),
         None
     )
 
-    table_widget.clearContents()
-    table_widget.setRowCount(total_rows)
-
-    # Optional: handle 'jobs' specific logic
-    status_column_index = None
-    if table_name == "jobs":
-        status_column_index = next(
-            (i for i in range(table_widget.columnCount())
-             if table_widget.horizontalHeaderItem(i).text().lower() == "status"),
-            None
-        )
-
-    for row_idx, row_data in enumerate(data):
-        for col_idx, value in enumerate(row_data):
-            if col_idx == status_column_index:
+def _set_row(table_widget, row_idx, row_data, primary_key_index, status_column_index,
+             update_status_callback, event_filter):
+    """ Writes one row, reusing the items and status combo already in the row. """
+    for col_idx, value in enumerate(row_data):
+        if col_idx == status_column_index:
+            combo = table_widget.cellWidget(row_idx, col_idx)
+            if combo is None:
                 combo = QComboBox()
-                combo.addItems(["Waiting for Parts", "In Progress", "Completed", "Picked Up", "Cancelled"])
-                options = [combo.itemText(i) for i in range(combo.count())]
-                combo.setCurrentText(value if value in options else "In Progress")
+                combo.addItems(JOB_STATUSES)
                 combo.setEditable(False)
                 combo.wheelEvent = lambda event: None  # ✅ disables scroll from changing value
 
                 if event_filter:
                     combo.installEventFilter(event_filter)
-                combo.currentTextChanged.connect(lambda text, row=row_idx: update_status_callback(row, text))
+                # Resolve the row when the signal fires: rows move as others are inserted/removed
+                combo.currentTextChanged.connect(
+                    lambda text, combo=combo: update_status_callback(
+                        table_widget.indexAt(combo.pos()).row(), text
+                    )
+                )
                 table_widget.setCellWidget(row_idx, col_idx, combo)
-            else:
-                item = QTableWidgetItem(str(value) if value is not None else "")
-                if col_idx == primary_key_index:
-                    item.setData(Qt.UserRole, str(value))
+
+            combo.blockSignals(True)
+            combo.setCurrentText(value if value in JOB_STATUSES else "In Progress")
+            combo.blockSignals(False)
+        else:
+            text = str(value) if value is not None else ""
+            item = table_widget.item(row_idx, col_idx)
+            if item is None:
+                item = QTableWidgetItem(text)
                 table_widget.setItem(row_idx, col_idx, item)
+            elif item.text() != text:
+                item.setText(text)
+            if col_idx == primary_key_index:
+                item.setData(Qt.UserRole, str(value))
+                item.setData(ROW_HASH_ROLE, _row_hash(row_data))
+
+def apply_table_page(table_widget, table_name, page, update_status_callback, event_filter=None):
+    """
+    Makes the grid show `page`, touching only rows whose values changed.
+
+    Returns:
+        dict: inserted, updated, deleted row counts ("rebuilt" True if the grid was redrawn).
+    """
+    rows = page["rows"]
+    primary_key_index = next(
+        (i for i in range(table_widget.columnCount())
+         if table_widget.horizontalHeaderItem(i).text() == page["primary_key"]),
+        None
+    )
+    status_column_index = _status_column_index(table_widget, table_name)
+
+    def set_row(row_idx, row_data):
+        _set_row(table_widget, row_idx, row_data, primary_key_index, status_column_index,
+                 update_status_callback, event_filter)
+
+    # What's on screen: key -> hash
+    shown = {}
+    if primary_key_index is not None:
+        for row_idx in range(table_widget.rowCount()):
+            item = table_widget.item(row_idx, primary_key_index)
+            if item is not None and item.data(Qt.UserRole) is not None:
+                shown[item.data(Qt.UserRole)] = item.data(ROW_HASH_ROLE)
+
+    target_keys = [str(row[primary_key_index]) for row in rows] if primary_key_index is not None else []
+    overlap = len(shown.keys() & set(target_keys))
+
+    if primary_key_index is None or overlap * 2 < len(rows):
+        # Mostly a different page: one rebuild is cheaper than many inserts
+        table_widget.clearContents()
+        table_widget.setRowCount(len(rows))
+        for row_idx, row_data in enumerate(rows):
+            set_row(row_idx, row_data)
+        table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_widget.verticalHeader().setVisible(False)
+        return {"inserted": len(rows), "updated": 0, "deleted": len(shown), "rebuilt": True}
+
+    def key_at(row_idx):
+        item = table_widget.item(row_idx, primary_key_index)
+        return item.data(Qt.UserRole) if item is not None else None
+
+    counts = {"inserted": 0, "updated": 0, "deleted": 0, "rebuilt": False}
+
+    # 1. Remove rows that are no longer on this page (bottom-up keeps indexes valid)
+    wanted = set(target_keys)
+    for row_idx in reversed(range(table_widget.rowCount())):
+        if key_at(row_idx) not in wanted:
+            table_widget.removeRow(row_idx)
+            counts["deleted"] += 1
+
+    # 2. Walk the page in order: update in place, or insert where a row is new
+    for row_idx, (key, row_data) in enumerate(zip(target_keys, rows)):
+        if row_idx < table_widget.rowCount() and key_at(row_idx) == key:
+            if shown.get(key) != _row_hash(row_data):
+                set_row(row_idx, row_data)
+                counts["updated"] += 1
+            continue
+
+        existing = next((i for i in range(row_idx + 1, table_widget.rowCount()) if key_at(i) == key), None)
+        if existing is not None:
+            table_widget.removeRow(existing)  # moved: re-insert at its new position
+        else:
+            counts["inserted"] += 1
+        table_widget.insertRow(row_idx)
+        set_row(row_idx, row_data)
+
+    # 3. Anything left past the end of the page
+    while table_widget.rowCount() > len(rows):
+        table_widget.removeRow(table_widget.rowCount() - 1)
+        counts["deleted"] += 1
+
+    return counts
+
+def insert_table_rows(table_widget, table_name, position, rows, primary_key, update_status_callback,
+                      event_filter=None):
+    """ Inserts `rows` into the grid starting at row `position` (used by the infinite-scroll viewer). """
+    primary_key_index = next(
+        (i for i in range(table_widget.columnCount())
+         if table_widget.horizontalHeaderItem(i).text() == primary_key),
+        None
+    )
+    status_column_index = _status_column_index(table_widget, table_name)
+
+    for offset, row_data in enumerate(rows):
+        table_widget.insertRow(position + offset)
+        _set_row(table_widget, position + offset, row_data, primary_key_index, status_column_index,
+                 update_status_callback, event_filter)
+
+def format_page_label(offset, limit, total_rows=None, total_exact=True):
+    """ "Page 3 of 12", "Page 3 of ~12" for an estimated total, or "Page 3" if unknown. """
+    current_page = (offset // limit) + 1
+    if total_rows is None:
+        return f"Page {current_page}"
+    total_pages = max(1, -(-total_rows // limit))
+    return f"Page {current_page} of {'' if total_exact else '~'}{total_pages}"
+
+def update_page_buttons(prev_button, next_button, offset, limit, total_rows=None, total_exact=True):
+    """ Prev is enabled past the first page; Next unless an exact total says this is the last page. """
+    prev_button.setEnabled(offset > 0)
+    next_button.setEnabled(total_rows is None or not total_exact or offset + limit < total_rows)
 
-    table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-    table_widget.verticalHeader().setVisible(False)
 def update_table_offset_ui(
     table_widget,
     pagination_label,
     prev_button,
     next_button,
     fetch_function,
-    table_name,
     current_offset,
     limit,
-    change,  # <- not needed anymore
-    refresh_callback,
-    parent=None
+    render_callback,
+    total_rows=None,
+    total_exact=True,
 ):
-    # ✅ Fetch new page data based on fixed offset
-    data = fetch_function(table_name, limit, current_offset)
-    total_rows = len(data)
+    """
+    Shows the page at `current_offset`.
+
+    Args:
+        fetch_function (callable): offset -> page dict (see fetch_table_page()).
+        render_callback (callable): page dict -> None; fills the grid.
+
+    Returns:
+        dict or None: The page shown, or None if there was nothing past the end.
+    """
+    # ✅ Fetch the page once; the same rows are rendered
+    page = fetch_function(current_offset)
 
     # ✅ Stop if you're at the end
-    if not data and current_offset > 0:
+    if not page["rows"] and current_offset > 0:
         show_info(table_widget.parent(), "📦 No more records to load.", title="End of Data")
-        return
+        return None
 
-    # ✅ Clear and refill table
-    table_widget.clearContents()
-    table_widget.setRowCount(total_rows)
-    refresh_callback()
+    render_callback(page)
 
     # ✅ Reset scroll bar
     table_widget.verticalScrollBar().setValue(0)
 
-    # ✅ Update page label
-    current_page = (current_offset // limit) + 1
-    pagination_label.setText(f"Page {current_page}")
+    # ✅ Update page label and buttons
+    pagination_label.setText(format_page_label(current_offset, limit, total_rows, total_exact))
+    update_page_buttons(prev_button, next_button, current_offset, limit, total_rows, total_exact)
+    return page
 
-    # ✅ Update buttons
-    prev_button.setEnabled(current_offset > 0)
-    next_button.setEnabled(total_rows == limit)
 def populate_table(table_widget, table_name, data, status_update_callback):
     """Populates the table with fresh data without triggering unnecessary updates."""
 
@@ -2019,7 +2677,10 @@ def create_table_view_dialog(
     edit_handler,
     delete_handler,
     print_handler,
-    close_handler
+    close_handler,
+    bulk_edit_handler=None,
+    columns_handler=None,
+    jump_handler=None
 ):
     dialog = QDialog()
     dialog.setWindowFlags(Qt.Window)
@@ -2172,6 +2833,20 @@ def create_table_view_dialog(
     # Layout: search bar row
     search_layout.addWidget(filter_toggle_btn)
     search_layout.addWidget(search_entry)
+    if columns_handler:
+        columns_button = QPushButton("🧩 Columns")
+        columns_button.clicked.connect(columns_handler)
+        columns_button.setFont(QFont("Segoe UI", 10))
+        columns_button.setFixedHeight(32)
+        columns_button.setStyleSheet(filter_toggle_btn.styleSheet())
+        search_layout.addWidget(columns_button)
+    if jump_handler:
+        jump_button = QPushButton("🎯 Go to ID")
+        jump_button.clicked.connect(lambda: jump_handler())  # clicked(checked) must not reach the key argument
+        jump_button.setFont(QFont("Segoe UI", 10))
+        jump_button.setFixedHeight(32)
+        jump_button.setStyleSheet(filter_toggle_btn.styleSheet())
+        search_layout.addWidget(jump_button)
     search_layout.addWidget(refresh_button)
     main_layout.addLayout(search_layout)
 
@@ -2275,6 +2950,9 @@ def create_table_view_dialog(
         # Add the Print button
         button_layout.addWidget(styled_button("🖨️ Print", print_handler, "#5BC0DE", "#31B0D5"))
 
+    if bulk_edit_handler:
+        button_layout.addWidget(styled_button("✏️ Bulk Edit", bulk_edit_handler, "#8E44AD", "#6C3483"))
+
     button_layout.addWidget(styled_button("🗑 Delete Record", delete_handler, "#D9534F", "#C9302C"))
     button_layout.addWidget(styled_button("❌ Close", close_handler, "#444444", "#666666"))
 
@@ -12,18 +12,13 @@ from PyQt5.QtWidgets import (
     QHeaderView, QSizePolicy, QFrame, QDateEdit
 )
 
-from DB.data_access import (
-    get_cost_columns, get_costs_by_job, insert_cost, delete_cost,
-    get_payments, insert_payment, delete_payment,
-    get_customer_contact, get_communications, insert_communication, delete_communication,
-    get_orders, insert_order, delete_order,
-    get_editable_columns, get_job_data, update_job_data
-)
+from DB.data_access import insert_order
+from DB.job_cache import JobCache
 
 from UI.job_dialogs_style import JOB_DIALOG_STYLESHEET
 
 class JobNotesEditor(QDialog): #UI
-    def __init__(self, job_id, job_data, save_callback, cursor, conn, parent=None):
+    def __init__(self, job_id, job_data, save_callback, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.notes, self.status, self.technician = [x or "" for x in job_data]
@@ -33,6 +28,9 @@ class JobNotesEditor(QDialog): #UI
         self.cursor = cursor
         self.conn = conn
 
+        # ✅ Shared with every related-info dialog opened from here
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
+
         self.setWindowTitle(f"📝 Edit Notes for Job {job_id}")
         self.setGeometry(100, 100, 500, 600)
         self.setStyleSheet(JOB_DIALOG_STYLESHEET)
@@ -153,6 +151,11 @@ class JobNotesEditor(QDialog): #UI
         layout.addLayout(nav_button_row)
         self.setLayout(layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: flag (don't overwrite) edits made to this job on another terminal. """
+        if changes.touches("jobs", key=self.job_id):
+            self.setWindowTitle(f"📝 Edit Notes for Job {self.job_id} — ⚠ changed on another terminal")
+
     def save_notes(self):
         new_notes = self.notes_text.toPlainText()
         new_status = self.status_box.currentText().strip()
@@ -172,21 +175,22 @@ class JobNotesEditor(QDialog): #UI
             QMessageBox.critical(self, "❌ Error", f"Could not save changes: {e}")
 
     def open_dialog(self, dialog_class, *args):
-        dialog = dialog_class(*args, self.cursor, self.conn)
+        dialog = dialog_class(*args, self.cursor, self.conn, job_cache=self.job_cache)
         dialog.exec_()
 
 class CostsDialog(QDialog): #UI
-    def __init__(self, job_id, cursor, conn, parent=None):
+    def __init__(self, job_id, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.setStyleSheet(JOB_DIALOG_STYLESHEET)
         self.job_id = job_id
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
 
         self.setWindowTitle(f"💰 Costs for Job {job_id}")
         self.setGeometry(600, 100, 700, 500)
 
-        self.columns = get_cost_columns(self.cursor)
+        self.columns = self.job_cache.cost_columns
         self.display_columns = [c for c in self.columns if c.lower() not in ['costid', 'jobid']]
 
         self.init_ui()
@@ -245,9 +249,16 @@ class CostsDialog(QDialog): #UI
 
         self.setLayout(self.layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: reload when another terminal changed this job's costs. """
+        if changes.touches("costs", job_id=self.job_id):
+            self.conn.commit()  # new snapshot, so the reload sees the other terminal's commit
+            self.job_cache.reload()
+            self.load_costs()
+
     def load_costs(self):
         self.table.clearContents()
-        data = get_costs_by_job(self.cursor, self.job_id, self.columns)
+        data = self.job_cache.costs
         self.table.setRowCount(len(data))
 
         total = 0
@@ -281,8 +292,7 @@ class CostsDialog(QDialog): #UI
         confirm = QMessageBox.question(self, "Delete", "Delete this cost?",
                                        QMessageBox.Yes | QMessageBox.No)
         if confirm == QMessageBox.Yes:
-            delete_cost(self.cursor, cost_id)
-            self.conn.commit()
+            self.job_cache.remove_cost(cost_id)
             self.load_costs()
 
     def open_add_dialog(self):
@@ -331,8 +341,7 @@ class CostsDialog(QDialog): #UI
                 desc = description.toPlainText().strip()
                 if not desc:
                     raise ValueError("Description required")
-                insert_cost(self.cursor, self.job_id, cost_type.currentText(), amt, desc)
-                self.conn.commit()
+                self.job_cache.add_cost(cost_type.currentText(), amt, desc)
                 dialog.close()
                 self.load_costs()
             except Exception as e:
@@ -342,16 +351,17 @@ class CostsDialog(QDialog): #UI
         dialog.exec_()
 
     def open_add_to_orders(self, part_description):
-        dialog = AddToOrdersDialog(self.job_id, part_description, self.cursor, self.conn)
+        dialog = AddToOrdersDialog(self.job_id, part_description, self.cursor, self.conn, job_cache=self.job_cache)
         dialog.exec_()
 
 class AddToOrdersDialog(QDialog): #UI
-    def __init__(self, job_id, part_description, cursor, conn, parent=None):
+    def __init__(self, job_id, part_description, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.part_description = part_description
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache
 
         self.setWindowTitle("📦 Add Part to Orders")
         self.setMinimumWidth(350)
@@ -396,12 +406,11 @@ class AddToOrdersDialog(QDialog): #UI
             total_cost = float(total_cost)
             quantity = 1
 
-            self.cursor.execute(
-                "INSERT INTO orders (JobID, OrderDate, Description, Quantity, TotalCost) "
-                "VALUES (%s, NOW(), %s, %s, %s)",
-                (self.job_id, self.part_description, quantity, total_cost)
-            )
-            self.conn.commit()
+            if self.job_cache:
+                self.job_cache.add_order(self.part_description, quantity, total_cost)
+            else:
+                insert_order(self.cursor, self.job_id, self.part_description, quantity, total_cost)
+                self.conn.commit()
 
             QMessageBox.information(self, "✅ Success", "Part added to orders successfully.")
             self.accept()
@@ -409,11 +418,12 @@ class AddToOrdersDialog(QDialog): #UI
             QMessageBox.warning(self, "⚠ Input Error", "Total cost must be a valid number.")
 
 class PaymentsDialog(QDialog): #IMPROVE FURTHER UI
-    def __init__(self, job_id, cursor, conn, parent=None):
+    def __init__(self, job_id, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
 
         self.setWindowTitle(f"💳 Payments for Job {job_id}")
         self.setGeometry(600, 100, 600, 500)
@@ -470,9 +480,16 @@ class PaymentsDialog(QDialog): #IMPROVE FURTHER UI
 
         self.setLayout(self.layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: reload when another terminal changed this job's payments. """
+        if changes.touches("payments", job_id=self.job_id):
+            self.conn.commit()  # new snapshot, so the reload sees the other terminal's commit
+            self.job_cache.reload()
+            self.load_payments()
+
     def load_payments(self):
         self.table.clearContents()
-        payments = get_payments(self.cursor, self.job_id)
+        payments = self.job_cache.payments
         self.table.setRowCount(len(payments))
 
         total = 0
@@ -494,8 +511,7 @@ class PaymentsDialog(QDialog): #IMPROVE FURTHER UI
         confirm = QMessageBox.question(self, "Delete", "Delete this payment?",
                                        QMessageBox.Yes | QMessageBox.No)
         if confirm == QMessageBox.Yes:
-            delete_payment(self.cursor, payment_id)
-            self.conn.commit()
+            self.job_cache.remove_payment(payment_id)
             self.load_payments()
 
     def open_add_payment_dialog(self):
@@ -537,8 +553,7 @@ class PaymentsDialog(QDialog): #IMPROVE FURTHER UI
                 payment_type = type_dropdown.currentText()
                 payment_date = date_entry.date().toString("yyyy-MM-dd")
 
-                insert_payment(self.cursor, self.job_id, amount, payment_type, payment_date)
-                self.conn.commit()
+                self.job_cache.add_payment(amount, payment_type, payment_date)
                 dialog.accept()
                 self.load_payments()
             except ValueError:
@@ -551,11 +566,12 @@ class PaymentsDialog(QDialog): #IMPROVE FURTHER UI
         dialog.exec_()
 
 class CommunicationsDialog(QDialog): #fix UI
-    def __init__(self, job_id, cursor, conn, parent=None):
+    def __init__(self, job_id, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
         self.setStyleSheet(JOB_DIALOG_STYLESHEET)
         self.setWindowTitle(f"📞 Communications for Job {job_id}")
         self.setGeometry(600, 100, 700, 500)
@@ -567,7 +583,7 @@ class CommunicationsDialog(QDialog): #fix UI
         self.layout = QVBoxLayout()
 
         # --- Customer Info ---
-        contact = get_customer_contact(self.cursor, self.job_id)
+        contact = self.job_cache.contact
         contact = contact or ("N/A", "N/A", "N/A", "N/A")
         fields = ["First Name", "Surname", "📞 Phone", "✉ Email"]
 
@@ -669,9 +685,16 @@ class CommunicationsDialog(QDialog): #fix UI
         self.layout.addLayout(btn_layout)
         self.setLayout(self.layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: reload when another terminal changed this job's communications. """
+        if changes.touches("communications", job_id=self.job_id):
+            self.conn.commit()  # new snapshot, so the reload sees the other terminal's commit
+            self.job_cache.reload()
+            self.load_communications()
+
     def load_communications(self):
         self.comms_table.clearContents()
-        comms = get_communications(self.cursor, self.job_id)
+        comms = self.job_cache.communications
         self.comms_table.setRowCount(len(comms))
 
         for row_idx, (comm_id, date_time, comm_type, message) in enumerate(comms):
@@ -719,8 +742,7 @@ class CommunicationsDialog(QDialog): #fix UI
         """)
 
         if confirm_box.exec_() == QMessageBox.Yes:
-            delete_communication(self.cursor, comm_id)
-            self.conn.commit()
+            self.job_cache.remove_communication(comm_id)
             self.load_communications()
 
     def open_add_dialog(self):
@@ -747,8 +769,7 @@ class CommunicationsDialog(QDialog): #fix UI
                 QMessageBox.warning(dialog, "⚠ Input Error", "All fields must be filled.")
                 return
 
-            insert_communication(self.cursor, self.job_id, comm_type, message)
-            self.conn.commit()
+            self.job_cache.add_communication(comm_type, message)
             dialog.accept()
             self.load_communications()
 
@@ -759,11 +780,12 @@ class CommunicationsDialog(QDialog): #fix UI
         dialog.exec_()
 
 class OrdersDialog(QDialog): #PERFECT
-    def __init__(self, job_id, cursor, conn, parent=None):
+    def __init__(self, job_id, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
 
         self.setWindowTitle(f"📦 Orders for Job {job_id}")
         self.setMinimumSize(700, 520)
@@ -815,9 +837,16 @@ class OrdersDialog(QDialog): #PERFECT
 
         self.setLayout(self.layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: reload when another terminal changed this job's orders. """
+        if changes.touches("orders", job_id=self.job_id):
+            self.conn.commit()  # new snapshot, so the reload sees the other terminal's commit
+            self.job_cache.reload()
+            self.load_orders()
+
     def load_orders(self):
         self.table.clearContents()
-        orders = get_orders(self.cursor, self.job_id)
+        orders = self.job_cache.orders
         self.table.setRowCount(len(orders))
 
         for row_idx, (order_id, date, desc, qty, total) in enumerate(orders):
@@ -839,8 +868,7 @@ class OrdersDialog(QDialog): #PERFECT
         confirm = QMessageBox.question(self, "Delete", "Delete this order?",
                                        QMessageBox.Yes | QMessageBox.No)
         if confirm == QMessageBox.Yes:
-            delete_order(self.cursor, order_id)
-            self.conn.commit()
+            self.job_cache.remove_order(order_id)
             self.load_orders()
 
     def open_add_order_dialog(self):
@@ -885,8 +913,7 @@ class OrdersDialog(QDialog): #PERFECT
             try:
                 qty = int(qty)
                 cost = float(cost)
-                insert_order(self.cursor, self.job_id, desc, qty, cost)
-                self.conn.commit()
+                self.job_cache.add_order(desc, qty, cost)
                 dialog.accept()
                 self.load_orders()
             except ValueError:
@@ -897,18 +924,19 @@ class OrdersDialog(QDialog): #PERFECT
         dialog.exec_()
 
 class JobDetailsDialog(QDialog): #MINOR
-    def __init__(self, job_id, cursor, conn, parent=None):
+    def __init__(self, job_id, cursor, conn, parent=None, job_cache=None):
         super().__init__(parent)
         self.job_id = job_id
         self.cursor = cursor
         self.conn = conn
+        self.job_cache = job_cache or JobCache(job_id, cursor, conn)
 
         self.setWindowTitle(f"🛠 Edit Job Details - Job {job_id}")
         self.setMinimumSize(700, 520)
 
         self.setStyleSheet(JOB_DIALOG_STYLESHEET)
-        self.columns = get_editable_columns(self.cursor)
-        self.original_data = get_job_data(self.cursor, self.job_id, self.columns)
+        self.columns = self.job_cache.detail_columns
+        self.original_data = self.job_cache.details
 
         if not self.original_data:
             QMessageBox.critical(self, "❌ Error", "Job not found.")
@@ -954,6 +982,11 @@ class JobDetailsDialog(QDialog): #MINOR
         self.layout.addLayout(btn_layout)
         self.setLayout(self.layout)
 
+    def on_data_changed(self, changes):
+        """ Live updates: flag (don't overwrite) edits made to this job on another terminal. """
+        if changes.touches("jobs", key=self.job_id):
+            self.setWindowTitle(f"🛠 Edit Job Details - Job {self.job_id} — ⚠ changed on another terminal")
+
     def save_changes(self):
         new_data = []
 
@@ -975,8 +1008,7 @@ class JobDetailsDialog(QDialog): #MINOR
             return
 
         try:
-            update_job_data(self.cursor, self.job_id, self.columns, new_data)
-            self.conn.commit()
+            self.job_cache.save_details(new_data)
             QMessageBox.information(self, "✅ Success", "Job details updated.")
             self.close()
         except Exception as e:
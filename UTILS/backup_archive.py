@@ -0,0 +1,474 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from DB.cursors import stream_rows
+from DB.data_access import clear_schema_cache, fetch_primary_key_column, fetch_primary_key_columns, fetch_tables
+
+# Backup archive format
+# ---------------------------
+# An archive backup is a small JSON manifest (database_backup_<ts>.dbarc)
+# plus compressed row chunks in a content-addressed store next to it:
+#
+#   backups/
+#     database_backup_20250101_020000.dbarc   schema, row counts, checksums,
+#     database_backup_20250102_020000.dbarc   and the chunk list per table
+#     chunks/3f/3fa9...e1.z                   zlib-compressed JSON rows
+#
+# Rows are read in primary key order and cut into chunks on fixed key
+# ranges (CHUNK_ROWS keys per chunk), so between two backups only the
+# chunks whose rows actually changed get a new hash. Chunks are stored
+# once per hash, so successive backups share every unchanged chunk.
+#
+# Each chunk entry in the manifest carries a zone map (min/max of the
+# primary key, CustomerID and JobID in that chunk). Restoring one table
+# reads only that table's chunks; restoring one customer reads only the
+# chunks whose zone maps can contain that customer or their jobs.
+
+ARCHIVE_FORMAT = "dbdoc-archive"
+ARCHIVE_VERSION = 1
+ARCHIVE_EXT = ".dbarc"
+CHUNK_DIR = "chunks"
+CHUNK_ROWS = 2000
+FETCH_SIZE = 2000
+COMPRESSION_LEVEL = 6
+ZONE_COLUMNS = ("CustomerID", "JobID")
+
+# Chunks younger than this are never garbage collected, so a backup that is
+# still writing (and has no manifest yet) can't lose its chunks.
+GC_GRACE_SECONDS = 3600
+
+
+#--------------------------------------------------------------------
+# Row encoding
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, timedelta):
+        return {"$td": value.total_seconds()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$b": base64.b64encode(bytes(value)).decode("ascii")}
+    return str(value)
+
+def _decode_value(obj):
+    if len(obj) != 1:
+        return obj
+    (tag, value), = obj.items()
+    if tag == "$dt":
+        return datetime.fromisoformat(value)
+    if tag == "$d":
+        return date.fromisoformat(value)
+    if tag == "$dec":
+        return Decimal(value)
+    if tag == "$td":
+        return timedelta(seconds=value)
+    if tag == "$b":
+        return base64.b64decode(value)
+    return obj
+
+def encode_rows(rows):
+    """ Serialises rows to the canonical bytes that are hashed and compressed. """
+    return json.dumps([list(row) for row in rows], separators=(",", ":"),
+                      ensure_ascii=False, default=_encode_value).encode("utf-8")
+
+def decode_rows(payload):
+    return [tuple(row) for row in json.loads(payload.decode("utf-8"), object_hook=_decode_value)]
+
+
+#--------------------------------------------------------------------
+# Chunking
+
+def iter_table_chunks(cursor, table, columns, primary_key):
+    """
+    Streams a table in primary key order (unbuffered cursor, so nothing else
+    may run on the connection until the generator is done) and yields
+    (rows, payload, sha256).
+
+    Integer keys are cut on fixed ranges of CHUNK_ROWS keys so chunk
+    boundaries stay put between backups; other keys fall back to CHUNK_ROWS rows.
+
+    Rows are ordered by every primary key column (composite keys), or by all
+    columns when there is no primary key, so the same data always yields the
+    same chunks and checksum.
+    """
+    column_list = ", ".join(f"`{col}`" for col in columns)
+    order_columns = (fetch_primary_key_columns(cursor, f"`{table}`") if primary_key else None) or columns
+    order = " ORDER BY " + ", ".join(f"`{col}`" for col in order_columns)
+
+    pk_index = columns.index(primary_key) if primary_key else None
+    rows, bucket = [], None
+
+    def flush():
+        payload = encode_rows(rows)
+        return rows, payload, hashlib.sha256(payload).hexdigest()
+
+    # Unbuffered: the table is never held in memory, only the current chunk
+    for _, batch in stream_rows(cursor, f"SELECT {column_list} FROM `{table}`{order}", batch_size=FETCH_SIZE):
+        for row in batch:
+            key = row[pk_index] if pk_index is not None else None
+            row_bucket = key // CHUNK_ROWS if isinstance(key, int) else None
+            if rows and (row_bucket != bucket or (row_bucket is None and len(rows) >= CHUNK_ROWS)):
+                yield flush()
+                rows = []
+            bucket = row_bucket
+            rows.append(row)
+
+    if rows:
+        yield flush()
+
+def table_columns(cursor, table):
+    cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
+    cursor.fetchall()
+    return [desc[0] for desc in cursor.description]
+
+def zone_map(rows, columns, primary_key):
+    """ min/max of the primary key and ZONE_COLUMNS within one chunk. """
+    zones = {}
+    for col in {primary_key, *ZONE_COLUMNS}:
+        if col not in columns:
+            continue
+        index = columns.index(col)
+        values = [row[index] for row in rows if isinstance(row[index], (int, str))]
+        if values and len({type(value) for value in values}) == 1:
+            zones[col] = [min(values), max(values)]
+    return zones
+
+def table_checksum(chunk_hashes):
+    """ A table's checksum is the hash of its chunk hashes in key order. """
+    return hashlib.sha256("".join(chunk_hashes).encode("ascii")).hexdigest()
+
+def table_digest(cursor, table, columns=None, primary_key=None):
+    """
+    Computes (row_count, checksum) for a live table exactly as an archive would
+    record it, without writing anything. Used to check a restore against the archive.
+    """
+    if columns is None:
+        columns = table_columns(cursor, table)
+    if primary_key is None:
+        primary_key = fetch_primary_key_column(cursor, f"`{table}`")
+
+    count, hashes = 0, []
+    for rows, _, digest in iter_table_chunks(cursor, table, columns, primary_key):
+        count += len(rows)
+        hashes.append(digest)
+    return count, table_checksum(hashes)
+
+
+#--------------------------------------------------------------------
+# .sql backup digests
+#
+# A .sql backup ends with one comment line per table holding the same row
+# count and checksum table_digest() computes, so verification can check a
+# restored .sql backup as strictly as an archive. Comment lines are skipped
+# on restore.
+
+SQL_DIGEST_PREFIX = "-- dbdoc-digest"
+_SQL_DIGEST_LINE = re.compile(rf"^{re.escape(SQL_DIGEST_PREFIX)} `([^`]+)` (\d+) ([0-9a-f]+)$", re.MULTILINE)
+
+def format_sql_digest(table, rows, checksum):
+    return f"{SQL_DIGEST_PREFIX} `{table}` {rows} {checksum}\n"
+
+def read_sql_digests(backup_file):
+    """
+    Returns {table: (rows, checksum)} from the digest lines of a .sql backup
+    (empty for backups written before digests were recorded).
+    """
+    with open(backup_file, "r", encoding="utf-8") as f:
+        return {table: (int(rows), checksum) for table, rows, checksum in _SQL_DIGEST_LINE.findall(f.read())}
+
+
+#--------------------------------------------------------------------
+# Chunk store
+
+def chunk_path(directory, digest):
+    return os.path.join(directory, CHUNK_DIR, digest[:2], f"{digest}.z")
+
+def write_chunk(directory, digest, payload):
+    """
+    Stores a chunk unless one with the same hash already exists.
+
+    Returns:
+        int: Compressed bytes written (0 when the chunk was deduplicated).
+    """
+    path = chunk_path(directory, digest)
+    if os.path.exists(path):
+        try:
+            os.utime(path)  # reused by a backup still writing: restart its garbage-collection grace period
+            return 0
+        except FileNotFoundError:
+            pass  # collected in the meantime: write it again
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = zlib.compress(payload, COMPRESSION_LEVEL)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+def read_chunk(directory, digest):
+    """ Decompresses and verifies one chunk, returning its rows. """
+    with open(chunk_path(directory, digest), "rb") as f:
+        payload = zlib.decompress(f.read())
+    if hashlib.sha256(payload).hexdigest() != digest:
+        raise ValueError(f"Chunk {digest} is corrupt (checksum mismatch).")
+    return decode_rows(payload)
+
+def collect_garbage(directory):
+    """
+    Deletes chunks no archive manifest in `directory` refers to any more.
+
+    Returns:
+        int: Number of chunks removed.
+    """
+    chunk_root = os.path.join(directory, CHUNK_DIR)
+    if not os.path.isdir(chunk_root):
+        return 0
+
+    referenced = set()
+    for name in os.listdir(directory):
+        if name.endswith(ARCHIVE_EXT):
+            manifest = load_manifest(os.path.join(directory, name))
+            for info in manifest["tables"].values():
+                referenced.update(chunk["hash"] for chunk in info["chunks"])
+
+    removed = 0
+    cutoff = time.time() - GC_GRACE_SECONDS
+    for prefix in os.listdir(chunk_root):
+        prefix_dir = os.path.join(chunk_root, prefix)
+        for name in os.listdir(prefix_dir):
+            path = os.path.join(prefix_dir, name)
+            if name[:-2] in referenced or os.path.getmtime(path) > cutoff:
+                continue
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+#--------------------------------------------------------------------
+# Writing
+
+def write_backup_archive(cursor, backup_directory):
+    """
+    Writes an archive backup of every table to `backup_directory`.
+
+    Returns:
+        str: Path of the manifest (.dbarc) file.
+    """
+    started = time.perf_counter()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    manifest_file = os.path.join(backup_directory, f"database_backup_{timestamp}{ARCHIVE_EXT}")
+
+    cursor.execute("SELECT DATABASE()")
+    database = cursor.fetchone()[0]
+    tables = fetch_tables(cursor)  # the change feed log is not backed up
+
+    manifest = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "database": database,
+        "compression": "zlib",
+        "tables": {},
+    }
+    stats = {"chunks": 0, "new_chunks": 0, "raw_bytes": 0, "stored_bytes": 0}
+
+    for table in tables:
+        cursor.execute(f"SHOW CREATE TABLE `{table}`;")
+        create_statement = cursor.fetchone()[1]
+        cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
+        cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        primary_key = fetch_primary_key_column(cursor, f"`{table}`")
+
+        chunks, row_count = [], 0
+        for rows, payload, digest in iter_table_chunks(cursor, table, columns, primary_key):
+            stored = write_chunk(backup_directory, digest, payload)
+            chunks.append({
+                "hash": digest,
+                "rows": len(rows),
+                "size": len(payload),
+                "zones": zone_map(rows, columns, primary_key),
+            })
+            row_count += len(rows)
+            stats["chunks"] += 1
+            stats["raw_bytes"] += len(payload)
+            if stored:
+                stats["new_chunks"] += 1
+                stats["stored_bytes"] += stored
+
+        manifest["tables"][table] = {
+            "create": create_statement,
+            "columns": columns,
+            "primary_key": primary_key,
+            "rows": row_count,
+            "checksum": table_checksum(chunk["hash"] for chunk in chunks),
+            "chunks": chunks,
+        }
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    manifest["stats"] = stats
+
+    # Manifest last: an archive only exists once all its chunks are on disk
+    tmp_path = f"{manifest_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, default=str)
+    os.replace(tmp_path, manifest_file)
+    return manifest_file
+
+
+#--------------------------------------------------------------------
+# Reading and restoring
+
+def load_manifest(manifest_file):
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != ARCHIVE_FORMAT:
+        raise ValueError(f"{manifest_file} is not a backup archive.")
+    if manifest.get("version", 0) > ARCHIVE_VERSION:
+        raise ValueError(f"{manifest_file} was written by a newer version (format {manifest['version']}).")
+    return manifest
+
+def is_archive(backup_file):
+    return str(backup_file).endswith(ARCHIVE_EXT)
+
+def iter_archive_rows(manifest_file, table, column=None, values=None, manifest=None):
+    """
+    Yields the rows of one table, optionally only where `column` is in `values`.
+
+    Chunks whose zone map shows they can't contain any of `values` are skipped
+    without being read.
+    """
+    manifest = manifest or load_manifest(manifest_file)
+    directory = os.path.dirname(os.path.abspath(manifest_file))
+    info = manifest["tables"][table]
+    index = info["columns"].index(column) if column else None
+    wanted = set(values) if values is not None else None
+
+    for chunk in info["chunks"]:
+        if wanted is not None:
+            zone = chunk["zones"].get(column)
+            if zone and not any(zone[0] <= value <= zone[1] for value in wanted):
+                continue
+        for row in read_chunk(directory, chunk["hash"]):
+            if wanted is None or row[index] in wanted:
+                yield row
+
+def _insert_rows(cursor, table, columns, rows):
+    """ INSERT IGNORE so restoring into a populated table only fills in missing rows. """
+    if not rows:
+        return 0
+    column_list = ", ".join(f"`{col}`" for col in columns)
+    placeholders = ", ".join(["%s"] * len(columns))
+    cursor.executemany(f"INSERT IGNORE INTO `{table}` ({column_list}) VALUES ({placeholders})", rows)
+    return len(rows)
+
+def _prepare_database(cursor, db_name, manifest, tables):
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name};")
+    cursor.execute(f"USE {db_name};")
+    clear_schema_cache(cursor)  # cached columns belong to the previous database
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0;")
+    for table in tables:
+        create = manifest["tables"][table]["create"]
+        cursor.execute(create.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1))
+
+def load_archive_table(cursor, manifest_file, table, manifest=None, create=True):
+    """
+    Loads one table from an archive into the current database (no commit).
+    Lets callers restore tables in parallel, one connection per table.
+
+    Returns:
+        int: Rows inserted.
+    """
+    manifest = manifest or load_manifest(manifest_file)
+    directory = os.path.dirname(os.path.abspath(manifest_file))
+    info = manifest["tables"][table]
+    if create:
+        cursor.execute(info["create"].replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1))
+
+    inserted = 0
+    for chunk in info["chunks"]:
+        inserted += _insert_rows(cursor, table, info["columns"], read_chunk(directory, chunk["hash"]))
+    return inserted
+
+def restore_archive(conn, cursor, manifest_file, db_name, tables=None, verbose=True):
+    """
+    Restores all tables, or only `tables`, from an archive into `db_name`.
+    Existing tables are kept and only rows missing from them are inserted.
+
+    Returns:
+        dict: Rows restored per table.
+    """
+    manifest = load_manifest(manifest_file)
+    tables = list(tables or manifest["tables"])
+    missing = [table for table in tables if table not in manifest["tables"]]
+    if missing:
+        raise ValueError(f"Archive has no table(s): {', '.join(missing)}")
+
+    _prepare_database(cursor, db_name, manifest, tables)
+
+    restored = {}
+    try:
+        for table in tables:
+            restored[table] = load_archive_table(cursor, manifest_file, table, manifest, create=False)
+            if verbose:
+                print(f"📥 {table}: {restored[table]:,} rows")
+        conn.commit()
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1;")
+    return restored
+
+def restore_customer(conn, cursor, manifest_file, db_name, customer_id, verbose=True):
+    """
+    Restores one customer's rows: every table with a CustomerID column, then
+    every table linked to that customer's jobs by JobID.
+
+    Returns:
+        dict: Rows restored per table (only tables that had matching rows).
+    """
+    manifest = load_manifest(manifest_file)
+    tables = manifest["tables"]
+
+    by_customer = {
+        table: list(iter_archive_rows(manifest_file, table, "CustomerID", [customer_id], manifest))
+        for table, info in tables.items() if "CustomerID" in info["columns"]
+    }
+
+    job_ids = set()
+    for table, rows in by_customer.items():
+        if tables[table]["primary_key"] == "JobID":
+            index = tables[table]["columns"].index("JobID")
+            job_ids.update(row[index] for row in rows)
+
+    by_job = {
+        table: list(iter_archive_rows(manifest_file, table, "JobID", job_ids, manifest))
+        for table, info in tables.items()
+        if job_ids and "JobID" in info["columns"] and "CustomerID" not in info["columns"]
+    }
+
+    found = {table: rows for table, rows in {**by_customer, **by_job}.items() if rows}
+    if not found:
+        return {}
+
+    _prepare_database(cursor, db_name, manifest, list(found))
+    restored = {}
+    try:
+        for table, rows in found.items():
+            restored[table] = _insert_rows(cursor, table, tables[table]["columns"], rows)
+            if verbose:
+                print(f"📥 {table}: {restored[table]:,} rows for customer {customer_id}")
+        conn.commit()
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1;")
+    return restored
@@ -4,11 +4,15 @@ from UTILS.error_utils import log_error, handle_db_error
 from PyQt5.QtWidgets import QInputDialog, QMessageBox, QFileDialog
 import os
 from datetime import datetime
-from DB.data_access import connect_to_database
+from DB.data_access import connect_to_database, clear_schema_cache, fetch_tables, fetch_primary_key_column
 
 from PyQt5.QtWidgets import QInputDialog, QMessageBox, QLineEdit
 import os
 from FILE_OPS.config import (load_settings)
+from UTILS.backup_archive import (
+    is_archive, load_manifest, restore_archive, restore_customer, write_backup_archive,
+    iter_table_chunks, table_checksum, table_columns, format_sql_digest
+)
 import os
 from datetime import datetime
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
@@ -54,7 +58,16 @@ def sql_escape(value):
         escaped = str(value).replace("\\", "\\\\").replace("'", "''").replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
         return f"'{escaped}'"
 
-def backup_database(cursor, backup_directory=None, interactive=True):
+def backup_database(cursor, backup_directory=None, interactive=True, raise_errors=False, archive=None):
+    """
+    Writes a plain .sql dump of every table to `backup_directory`, or a
+    compressed, deduplicated archive (see UTILS.backup_archive) when `archive`
+    is True. archive=None follows "backup_format" in settings.json.
+    With raise_errors=True failures are re-raised instead of only being reported.
+
+    Returns:
+        str or None: The backup file path, or None if cancelled or failed.
+    """
     if not backup_directory:
         if interactive:
             backup_directory = QFileDialog.getExistingDirectory(None, "Select Backup Directory")
@@ -64,48 +77,88 @@ def backup_database(cursor, backup_directory=None, interactive=True):
             print("❌ No backup directory specified. Backup cancelled.")
             return
 
+    if archive is None:
+        archive = load_settings().get("backup_format") == "archive"
+    if archive:
+        return _backup_database_archive(cursor, backup_directory, interactive, raise_errors)
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = os.path.join(backup_directory, f"database_backup_{timestamp}.sql")
+    part_file = f"{backup_file}.part"  # renamed into place only once complete, so retention never sees a partial dump
 
     try:
-        with open(backup_file, "w", encoding="utf-8") as f:
+        with open(part_file, "w", encoding="utf-8") as f:
             f.write("-- MariaDB SQL Backup\n")
             f.write("SET FOREIGN_KEY_CHECKS = 0;\n\n")
 
-            cursor.execute("SHOW TABLES;")
-            tables = [table[0] for table in cursor.fetchall()]
-
-            for table in tables:
+            digests = []
+            for table in fetch_tables(cursor):  # the change feed log is not backed up
                 # Write CREATE TABLE statement
                 cursor.execute(f"SHOW CREATE TABLE `{table}`;")
                 create_table_statement = cursor.fetchone()[1]
                 f.write(f"{create_table_statement};\n\n")
 
-                # Write INSERT statements for data
-                cursor.execute(f"SELECT * FROM `{table}`;")
-                rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-
-                for row in rows:
-                    # Escape each value to treat all as plain text
-                    escaped_values = ", ".join(sql_escape(val) for val in row)
-                    column_list = ", ".join(f"`{col}`" for col in columns)
-                    f.write(f"INSERT INTO `{table}` ({column_list}) VALUES ({escaped_values});\n")
+                columns = table_columns(cursor, table)
+                column_list = ", ".join(f"`{col}`" for col in columns)
+                primary_key = fetch_primary_key_column(cursor, f"`{table}`")
+
+                # Write INSERT statements for data, streamed in key order (unbuffered cursor);
+                # the chunks are hashed exactly like table_digest() so verification can compare
+                row_count, hashes = 0, []
+                for rows, _, digest in iter_table_chunks(cursor, table, columns, primary_key):
+                    for row in rows:
+                        # Escape each value to treat all as plain text
+                        escaped_values = ", ".join(sql_escape(val) for val in row)
+                        f.write(f"INSERT INTO `{table}` ({column_list}) VALUES ({escaped_values});\n")
+                    row_count += len(rows)
+                    hashes.append(digest)
+                digests.append((table, row_count, table_checksum(hashes)))
 
                 f.write("\n")
 
-            f.write("SET FOREIGN_KEY_CHECKS = 1;\n")
-            
-            if interactive:
-                    show_custom_messagebox(QMessageBox.Information, "Success", f"✅ Database backup saved to:\n{backup_file}")
-            else:
-                print(f"✅ Backup saved to {backup_file}")
+            f.write("SET FOREIGN_KEY_CHECKS = 1;\n\n")
+            for table, row_count, checksum in digests:
+                f.write(format_sql_digest(table, row_count, checksum))
+
+        os.replace(part_file, backup_file)
+        if interactive:
+            show_custom_messagebox(QMessageBox.Information, "Success", f"✅ Database backup saved to:\n{backup_file}")
+        else:
+            print(f"✅ Backup saved to {backup_file}")
+
+        return backup_file
 
     except Exception as e:
+        try:
+            os.remove(part_file)
+        except OSError:
+            pass
         if interactive:
             show_custom_messagebox(QMessageBox.Critical, "Error", f"❌ Failed to back up database: {e}")
         else:
             print(f"❌ Failed to back up database: {e}")
+        if raise_errors:
+            raise
+
+def _backup_database_archive(cursor, backup_directory, interactive, raise_errors):
+    try:
+        backup_file = write_backup_archive(cursor, backup_directory)
+        stats = load_manifest(backup_file)["stats"]
+        summary = (f"{stats['new_chunks']} of {stats['chunks']} chunks new, "
+                   f"{stats['stored_bytes'] / 2**20:.1f} MB written")
+        if interactive:
+            show_custom_messagebox(QMessageBox.Information, "Success", f"✅ Database backup saved to:\n{backup_file}\n{summary}")
+        else:
+            print(f"✅ Backup saved to {backup_file} ({summary})")
+        return backup_file
+
+    except Exception as e:
+        if interactive:
+            show_custom_messagebox(QMessageBox.Critical, "Error", f"❌ Failed to back up database: {e}")
+        else:
+            print(f"❌ Failed to back up database: {e}")
+        if raise_errors:
+            raise
 
 def change_db_password(_, conn):
     """Prompts for old & new DB password and updates it securely using fresh config from load_settings()."""
@@ -183,7 +236,7 @@ def change_db_password(_, conn):
 
         # ✅ Correct: use parsed user + host, NOT db_user
         print(f"📝 Updating password for '{db_username}'@'{db_host}'")
-        cursor.execute(f"SET PASSWORD = PASSWORD('{new_password}');")
+        cursor.execute("SET PASSWORD = PASSWORD(%s);", (new_password,))
 
         conn.commit()
 
@@ -199,6 +252,69 @@ def change_db_password(_, conn):
         if 'cursor' in locals() and cursor:
             cursor.close()
 
+def restore_database_from_file(conn, cursor, db_name, backup_file, on_created=None, verbose=True):
+    """
+    Creates `db_name` (if needed), switches to it and replays a .sql backup (no dialogs).
+
+    Returns:
+        list: (command, error) for every statement that failed; those are skipped.
+    """
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name};")
+    if on_created:
+        on_created()
+
+    cursor.execute(f"USE {db_name};")
+    clear_schema_cache(cursor)  # cached columns belong to the previous database
+
+    # Open the backup file and execute its content
+    with open(backup_file, "r") as file:
+        sql_commands = file.read()
+
+    # Execute each command in the SQL file
+    failed = []
+    for command in sql_commands.split(";"):
+        command = command.strip()
+        if command and not all(line.startswith("--") for line in command.splitlines() if line.strip()):
+            try:
+                if verbose:
+                    print(f"Executing: {command}")
+                cursor.execute(command)
+            except mariadb.Error as e:
+                failed.append((command, e))
+                continue  # Skip the failed command
+
+    conn.commit()
+    return failed
+
+def restore_from_archive_dialog(conn, cursor, db_name, backup_file, parent_widget=None):
+    """
+    Asks whether to restore the whole archive, one table or one customer, then does it.
+
+    Returns:
+        dict or None: Rows restored per table, or None if the user cancelled.
+    """
+    manifest = load_manifest(backup_file)
+    scopes = ["Whole database", "Single table", "Single customer"]
+    scope, ok = QInputDialog.getItem(parent_widget, "Restore Archive", "What do you want to restore?", scopes, 0, False)
+    if not ok:
+        return None
+
+    if scope == "Single table":
+        tables = sorted(manifest["tables"])
+        labels = [f"{table} ({manifest['tables'][table]['rows']:,} rows)" for table in tables]
+        label, ok = QInputDialog.getItem(parent_widget, "Restore Table", "Table:", labels, 0, False)
+        if not ok:
+            return None
+        return restore_archive(conn, cursor, backup_file, db_name, tables=[tables[labels.index(label)]])
+
+    if scope == "Single customer":
+        customer_id, ok = QInputDialog.getInt(parent_widget, "Restore Customer", "Customer ID:", 1, 1)
+        if not ok:
+            return None
+        return restore_customer(conn, cursor, backup_file, db_name, customer_id)
+
+    return restore_archive(conn, cursor, backup_file, db_name)
+
 def restore_database(conn, cursor, parent_widget=None):
     db_name, ok = get_styled_database_name(parent_widget)
     if not ok or not db_name:
@@ -217,7 +333,7 @@ def restore_database(conn, cursor, parent_widget=None):
         parent_widget,
         "Select Backup File",
         "",
-        "SQL Files (*.sql);;All Files (*)"
+        "Backups (*.sql *.dbarc);;SQL Files (*.sql);;Backup Archives (*.dbarc);;All Files (*)"
     )
     if not backup_file:
         # Use QMessageBox with custom styles
@@ -234,27 +350,23 @@ def restore_database(conn, cursor, parent_widget=None):
         if not conn:
             raise Exception("No valid database connection found.")
 
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name};")
-        QMessageBox.information(parent_widget, "Success", f"Database '{db_name}' created successfully.")
-
-        cursor.execute(f"USE {db_name};")
-
-        # Open the backup file and execute its content
-        with open(backup_file, "r") as file:
-            sql_commands = file.read()
-
-        # Execute each command in the SQL file
-        for command in sql_commands.split(";"):
-            command = command.strip()
-            if command:
-                try:
-                    print(f"Executing: {command}")
-                    cursor.execute(command)
-                except mariadb.Error as e:
-                    log_error(f"Failed to execute command: {command}. Error: {e}")
-                    continue  # Skip the failed command
+        if is_archive(backup_file):
+            restored = restore_from_archive_dialog(conn, cursor, db_name, backup_file, parent_widget)
+            if restored is None:
+                return
+            show_custom_messagebox(
+                QMessageBox.Information, "Success",
+                f"Restored {sum(restored.values()):,} rows from {len(restored)} table(s) into '{db_name}'.",
+                parent_widget
+            )
+            return
 
-        conn.commit()
+        failed = restore_database_from_file(
+            conn, cursor, db_name, backup_file,
+            on_created=lambda: QMessageBox.information(parent_widget, "Success", f"Database '{db_name}' created successfully.")
+        )
+        for command, error in failed:
+            log_error(f"Failed to execute command: {command}. Error: {error}")
         # Use QMessageBox with custom styles for success
         msg_box = QMessageBox(parent_widget)
         msg_box.setIcon(QMessageBox.Information)
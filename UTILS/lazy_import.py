@@ -0,0 +1,110 @@
+import importlib
+import sys
+import threading
+import time
+
+# Lazy imports
+# ---------------------------
+# pandas and matplotlib are only needed for the dashboard, Excel exports
+# and reports, but importing them costs far more than the rest of the app
+# put together. lazy_import() hands back a stand-in module that performs
+# the real import the first time one of its attributes is used, so:
+#
+#     pd = lazy_import("pandas")
+#
+# at the top of a module costs nothing until pd.DataFrame(...) is called.
+#
+# Every real import done through this layer is timed, and import_report()
+# lists them so slow subsystems are easy to spot. prewarm() loads a set
+# of modules on a daemon thread (e.g. right after login) so the first
+# chart or export doesn't stall the GUI.
+
+_import_times = {}  # module name -> (seconds, loaded on thread name)
+_import_lock = threading.Lock()
+
+
+class LazyModule:
+    """ Stand-in for a module that is imported on first attribute access. """
+
+    def __init__(self, name):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = _timed_import(self.__dict__["_lazy_name"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+
+def _timed_import(name):
+    with _import_lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        _import_times[name] = (time.perf_counter() - started, threading.current_thread().name)
+        return module
+
+def lazy_import(name):
+    """ Returns the module if it's already loaded, otherwise a LazyModule proxy. """
+    return sys.modules.get(name) or LazyModule(name)
+
+def is_loaded(name):
+    return name in sys.modules
+
+def prewarm(module_names):
+    """
+    Imports the given modules on a background daemon thread.
+
+    Returns:
+        threading.Thread: The started thread (already finished if nothing needed loading).
+    """
+    pending = [name for name in module_names if name not in sys.modules]
+
+    def load_all():
+        for name in pending:
+            try:
+                _timed_import(name)
+            except ImportError as e:
+                print(f"⚠️ Pre-warm of {name} failed: {e}")
+
+    thread = threading.Thread(target=load_all, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+def import_report():
+    """
+    Returns the imports made through this layer, slowest first.
+
+    Returns:
+        list: (module_name, seconds, thread_name) tuples.
+    """
+    return sorted(
+        ((name, seconds, thread) for name, (seconds, thread) in _import_times.items()),
+        key=lambda item: item[1],
+        reverse=True
+    )
+
+def print_import_report():
+    report = import_report()
+    if not report:
+        print("📦 No deferred imports have been loaded yet.")
+        return
+    print("📦 Deferred import times:")
+    for name, seconds, thread in report:
+        print(f"   {seconds * 1000:8.1f} ms  {name}  ({thread})")
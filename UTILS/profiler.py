@@ -0,0 +1,249 @@
+import atexit
+import builtins
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Profiling mode
+# ---------------------------
+# Started with `python DatabaseAppV2.py --profile[=trace.json]` or by
+# setting DBDOC_PROFILE=1 (or DBDOC_PROFILE=trace.json).
+#
+# While enabled this records:
+#   - first-time module imports (like `python -X importtime`)
+#   - named spans such as building the login page and handle_login()
+#   - every call into an instrumented module (DB/data_access.py)
+#   - instant markers such as the first paint of the main window
+#
+# On exit everything is written as a Chrome trace (open it in
+# chrome://tracing or https://ui.perfetto.dev) with an extra "summary"
+# section of per-name call counts and totals that is easy to diff
+# between releases. When profiling is off every helper here is a no-op.
+
+PROFILE_FLAG = "--profile"
+PROFILE_ENV = "DBDOC_PROFILE"
+
+_state = {
+    "enabled": False,
+    "path": None,
+    "origin": time.perf_counter(),
+    "events": [],
+}
+_pid = os.getpid()
+
+
+def is_enabled():
+    return _state["enabled"]
+
+def _now_us():
+    return (time.perf_counter() - _state["origin"]) * 1_000_000
+
+def _record(name, category, start_us, duration_us, args=None):
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": round(start_us, 1),
+        "dur": round(duration_us, 1),
+        "pid": _pid,
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = args
+    _state["events"].append(event)
+
+
+#--------------------------------------------------------------------
+# Enabling
+
+def enable(path=None):
+    """ Turns profiling on and schedules the trace to be written at exit. """
+    if _state["enabled"]:
+        return
+    _state["enabled"] = True
+    _state["path"] = path or f"profile_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    _install_import_hook()
+    atexit.register(write_trace)
+    print(f"⏱ Profiling enabled, trace will be written to {_state['path']}")
+
+def enable_from_argv(argv=None):
+    """
+    Enables profiling if --profile[=path] is on the command line or DBDOC_PROFILE is set.
+    The flag is removed from argv so Qt doesn't see it.
+    """
+    argv = sys.argv if argv is None else argv
+    path, requested = None, False
+
+    for arg in list(argv[1:]):
+        if arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + "="):
+            requested = True
+            path = arg.partition("=")[2] or None
+            argv.remove(arg)
+
+    env_value = os.environ.get(PROFILE_ENV, "").strip()
+    if env_value and env_value != "0":
+        requested = True
+        if not path and env_value not in ("1", "true", "yes"):
+            path = env_value
+
+    if requested:
+        enable(path)
+    return requested
+
+
+#--------------------------------------------------------------------
+# Recording
+
+@contextmanager
+def span(name, category="app", **args):
+    """ Times the enclosed block as one trace event. """
+    if not _state["enabled"]:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        _record(name, category, start, _now_us() - start, args or None)
+
+def mark(name, category="app"):
+    """ Records an instant marker, measured from process start of profiling. """
+    if not _state["enabled"]:
+        return
+    _state["events"].append({
+        "name": name, "cat": category, "ph": "i", "s": "g",
+        "ts": round(_now_us(), 1), "pid": _pid, "tid": threading.get_ident(),
+    })
+
+def timed(func, name=None, category="app"):
+    """ Wraps a function so each call becomes a trace event. """
+    label = name or f"{func.__module__}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _state["enabled"]:
+            return func(*args, **kwargs)
+        start = _now_us()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(label, category, start, _now_us() - start)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+def instrument_module(module, category=None):
+    """
+    Wraps every function defined in `module` with timed().
+
+    Modules that already did `from module import name` keep a reference to the
+    original function, so those references are swapped for the wrappers too.
+
+    Returns:
+        int: Number of functions instrumented.
+    """
+    category = category or module.__name__
+    replacements = {}
+
+    for attr, value in list(vars(module).items()):
+        if (callable(value) and getattr(value, "__module__", None) == module.__name__
+                and not isinstance(value, type) and not getattr(value, "__profiled__", False)):
+            wrapped = timed(value, f"{module.__name__}.{attr}", category)
+            setattr(module, attr, wrapped)
+            replacements[id(value)] = wrapped
+
+    for other in list(sys.modules.values()):
+        if other is None or other is module:
+            continue
+        try:
+            items = list(vars(other).items())
+        except TypeError:
+            continue
+        for attr, value in items:
+            if id(value) in replacements:
+                setattr(other, attr, replacements[id(value)])
+
+    return len(replacements)
+
+
+#--------------------------------------------------------------------
+# Import timing (first-time imports only, nested like -X importtime)
+
+def _install_import_hook():
+    original_import = builtins.__import__
+
+    def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)
+        start = _now_us()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            _record(f"import {name}", "import", start, _now_us() - start)
+
+    builtins.__import__ = profiled_import
+
+
+#--------------------------------------------------------------------
+# Output
+
+def summarize(events=None):
+    """
+    Aggregates complete events by name.
+
+    Returns:
+        dict: name -> {"calls", "total_ms", "max_ms"}, slowest total first.
+    """
+    summary = {}
+    for event in events if events is not None else _state["events"]:
+        if event["ph"] != "X":
+            continue
+        entry = summary.setdefault(event["name"], {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        duration_ms = event["dur"] / 1000
+        entry["calls"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+
+    for entry in summary.values():
+        entry["total_ms"] = round(entry["total_ms"], 3)
+        entry["max_ms"] = round(entry["max_ms"], 3)
+    return dict(sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+def write_trace(path=None):
+    """ Writes the Chrome trace + summary JSON. Returns the path, or None if profiling is off. """
+    if not _state["enabled"]:
+        return None
+    path = path or _state["path"]
+
+    from UTILS.lazy_import import import_report
+
+    events = list(_state["events"])
+    trace = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "metadata": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "argv": sys.argv,
+            "deferred_imports_ms": {
+                name: round(seconds * 1000, 3) for name, seconds, _ in import_report()
+            },
+        },
+        "summary": summarize(events),
+    }
+
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, indent=1, default=str)
+        print(f"⏱ Profile trace written to {path} ({len(events)} events)")
+    except OSError as e:
+        print(f"❌ Could not write profile trace: {e}")
+        return None
+    return path
@@ -0,0 +1,218 @@
+"""
+Headless database benchmarks.
+
+Loads synthetic shop data into a scratch database on a local MariaDB/MySQL
+server and times the app's real data paths (paging, search, dashboard
+queries, customer report, backup, restore, Excel export). Results are
+written as JSON and can be compared against an earlier run.
+
+    python -m benchmarks.bench_db --user root --password secret --scale 10k
+    python -m benchmarks.bench_db ... --compare benchmarks/results/previous.json
+
+See benchmarks/README.md for setting up the server.
+"""
+import argparse
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import mariadb
+
+from DB.data_access import (
+    connect_to_database,
+    fetch_table_data,
+    search_table_rows,
+    get_customer_report,
+    get_customer_acquisition,
+    get_top_customers_by_jobs,
+    get_most_frequent_device_brands,
+    get_device_type_trends,
+    get_job_status_distribution,
+    get_avg_job_duration_by_technician,
+    get_top_device_issues,
+    get_technician_workload,
+    get_avg_job_completion_time,
+    get_walkin_volume,
+    get_walkin_service_types,
+    get_jobs_per_day_by_week,
+    get_avg_jobs_per_day_by_week,
+    get_job_start_times_in_minutes,
+    get_database_summary_counts,
+)
+from UTILS.db_utils import backup_database, restore_database_from_file
+from FILE_OPS.file_ops import export_tables_to_excel
+from benchmarks.results import compare_results, git_revision, load_results, write_results
+from benchmarks.synthetic_data import SCALES, generate
+
+
+DEFAULT_DATABASE = "dbdoc_bench"
+EXCEL_ROW_LIMIT = 1_048_576  # rows per sheet; larger tables can't be exported
+
+DASHBOARD_QUERIES = [
+    get_customer_acquisition,
+    get_top_customers_by_jobs,
+    get_most_frequent_device_brands,
+    get_device_type_trends,
+    get_job_status_distribution,
+    get_avg_job_duration_by_technician,
+    get_top_device_issues,
+    get_technician_workload,
+    get_avg_job_completion_time,
+    get_walkin_volume,
+    get_walkin_service_types,
+    get_jobs_per_day_by_week,
+    get_avg_jobs_per_day_by_week,
+    get_job_start_times_in_minutes,
+    get_database_summary_counts,
+]
+
+
+#--------------------------------------------------------------------
+# Timing
+
+def time_case(name, func, repeat):
+    """ Runs `func` `repeat` times and returns min/median/max in ms. """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    entry = {
+        "name": name,
+        "repeat": repeat,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+    }
+    if isinstance(result, (list, tuple)):
+        entry["rows"] = len(result)
+    print(f"  {entry['median_ms']:10.1f} ms  {name}")
+    return entry
+
+def build_cases(cursor, conn, job_count, scratch_dir, database, skip_slow=False):
+    """ Returns [(name, callable, repeat)] for every benchmarked code path. """
+    last_page = max(job_count - 50, 0)
+    sample_job = max(job_count // 2, 1)
+
+    cases = [
+        ("fetch_table_data jobs first page", lambda: fetch_table_data(cursor, "jobs", 50, 0), 5),
+        ("fetch_table_data jobs middle page", lambda: fetch_table_data(cursor, "jobs", 50, job_count // 2), 5),
+        ("fetch_table_data jobs last page", lambda: fetch_table_data(cursor, "jobs", 50, last_page), 5),
+        ("fetch_table_data jobs last page ordered", lambda: fetch_table_data(cursor, "jobs", 50, last_page, "JobID"), 5),
+        ("search_table_rows jobs 1 token", lambda: search_table_rows(cursor, "jobs", ["Issue", "DeviceBrand"], "screen"), 3),
+        ("search_table_rows jobs 2 tokens", lambda: search_table_rows(cursor, "jobs", ["Issue", "DeviceBrand"], "screen apple"), 3),
+        ("get_customer_report", lambda: get_customer_report(cursor, sample_job), 5),
+    ]
+    cases += [(func.__name__, (lambda f=func: f(cursor)), 3) for func in DASHBOARD_QUERIES]
+
+    if skip_slow:
+        return cases
+
+    backup_dir = os.path.join(scratch_dir, "backups")
+    os.makedirs(backup_dir, exist_ok=True)
+
+    def backup():
+        backup_database(cursor, backup_dir, interactive=False)
+        return sorted(os.listdir(backup_dir))
+
+    def restore():
+        backups = sorted(os.listdir(backup_dir))
+        if not backups:
+            backup()
+            backups = sorted(os.listdir(backup_dir))
+        failed = restore_database_from_file(
+            conn, cursor, f"{database}_restore", os.path.join(backup_dir, backups[-1]), verbose=False
+        )
+        cursor.execute(f"DROP DATABASE IF EXISTS `{database}_restore`")
+        cursor.execute(f"USE `{database}`")
+        return failed
+
+    cases += [
+        ("backup_database", backup, 1),
+        ("restore_database_from_file", restore, 1),
+    ]
+
+    if job_count * 2 < EXCEL_ROW_LIMIT:
+        cases.append((
+            "export_tables_to_excel",
+            lambda: export_tables_to_excel(cursor, os.path.join(scratch_dir, "export.xlsx")),
+            1
+        ))
+    else:
+        print("⚠️ Skipping export_tables_to_excel: tables exceed Excel's sheet row limit at this scale.")
+
+    return cases
+
+
+#--------------------------------------------------------------------
+# Runner
+
+def run(args):
+    job_count = int(SCALES.get(args.scale.lower(), args.scale))
+
+    if not args.skip_load:
+        print(f"🏗 Loading {job_count:,} jobs into '{args.database}'...")
+        setup = mariadb.connect(user=args.user, password=args.password, host=args.host, port=args.port)
+        try:
+            load = generate(setup.cursor(), setup, args.database, job_count, seed=args.seed)
+        finally:
+            setup.close()
+        print(f"✅ Loaded in {load['load_seconds']:.1f}s")
+    else:
+        load = None
+
+    conn, cursor = connect_to_database(args.user, args.password, args.host, args.database)
+    try:
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            print("⏱ Running benchmarks:")
+            cases = [
+                time_case(name, func, args.repeat or repeat)
+                for name, func, repeat in build_cases(cursor, conn, job_count, scratch_dir, args.database, args.skip_slow)
+            ]
+    finally:
+        conn.close()
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "scale": args.scale,
+        "jobs": job_count,
+        "seed": args.seed,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "load": load,
+        "cases": cases,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the app's database code paths against synthetic data.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3306)
+    parser.add_argument("--user", default="root")
+    parser.add_argument("--password", default=os.environ.get("DBDOC_BENCH_PASSWORD", ""))
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="Scratch database (dropped and recreated).")
+    parser.add_argument("--scale", default="10k", help=f"Number of jobs or one of {', '.join(SCALES)}.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=0, help="Override the per-case repeat count.")
+    parser.add_argument("--skip-load", action="store_true", help="Reuse the data already in --database.")
+    parser.add_argument("--skip-slow", action="store_true", help="Skip backup, restore and export.")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/db_<scale>_<timestamp>.json).")
+    parser.add_argument("--compare", help="Earlier result file to compare against.")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    write_results(results, args.output, prefix=f"db_{args.scale}")
+
+    if args.compare and compare_results(load_results(args.compare), results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
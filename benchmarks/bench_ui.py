@@ -0,0 +1,303 @@
+"""
+Offscreen Qt UI benchmarks.
+
+Feeds canned row sets of increasing size into the grid and report builders
+(load_table, populate_table, create_customer_report_window) and builds the
+TabbedDashboard from canned chart data, without a database or a display.
+For each case it records construction time, the longest event-loop stall
+while the widget is built and first shown, peak Python memory, the Python
+memory still held once the widget is closed, and the change in current RSS.
+
+    python -m benchmarks.bench_ui
+    python -m benchmarks.bench_ui --sizes 100 1000 10000 --compare benchmarks/results/<earlier>.json
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import gc
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from PyQt5.QtCore import QCoreApplication, QEvent, QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QTableWidget
+
+from UI.ui import load_table, populate_table, create_customer_report_window
+from benchmarks.results import compare_results, git_revision, load_results, write_results
+from benchmarks.synthetic_data import (
+    BRANDS, COMM_TYPES, COST_TYPES, DEVICE_TYPES, FIRST_NAMES, HOW_HEARD, ISSUES,
+    PAYMENT_TYPES, STATUSES, SURNAMES, TECHNICIANS,
+)
+
+
+DEFAULT_SIZES = (50, 500, 2000, 10000)
+HEARTBEAT_MS = 5
+SETTLE_MS = 100
+
+JOB_COLUMNS = [
+    "JobID", "CustomerID", "DeviceType", "DeviceBrand", "DeviceModel", "Issue", "Password",
+    "DataSave", "Status", "Technician", "Notes", "Deposit", "StartDate", "EndDate",
+]
+CUSTOMER_COLUMNS = ["CustomerID", "FirstName", "SurName", "Phone", "Email", "PostCode", "DoorNumber"]
+
+
+#--------------------------------------------------------------------
+# Canned data
+
+def canned_jobs(count, seed=42):
+    rng = random.Random(seed)
+    epoch = datetime(2022, 1, 3, 9, 0)
+    rows = []
+    for job_id in range(1, count + 1):
+        start = epoch + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        rows.append((
+            job_id, rng.randrange(1, count // 2 + 2), rng.choice(DEVICE_TYPES), rng.choice(BRANDS),
+            f"Model {rng.randrange(1, 40)}", rng.choice(ISSUES), "", "Yes", rng.choice(STATUSES),
+            rng.choice(TECHNICIANS), f"Note {job_id}", round(rng.uniform(0, 80), 2), start, None,
+        ))
+    return rows
+
+class CannedCursor:
+    """ Just enough of a cursor for load_table(): schema, row count and paged SELECT * on canned rows. """
+
+    def __init__(self, rows, columns, primary_key, table="jobs"):
+        self.rows = rows
+        self.columns = columns
+        self.primary_key = primary_key
+        self.table = table
+        self.description = [(name,) for name in columns]
+        self._result = []
+
+    def execute(self, query, params=None):
+        normalised = " ".join(query.split()).upper()
+        if "INFORMATION_SCHEMA.COLUMNS" in normalised:
+            self._result = [
+                (self.table, name, "varchar(255)", "PRI" if name == self.primary_key else "")
+                for name in self.columns
+            ]
+        elif "INFORMATION_SCHEMA.TABLES" in normalised or normalised.startswith("SELECT COUNT(*)"):
+            self._result = [(len(self.rows),)]
+        elif normalised.startswith("SHOW KEYS"):
+            self._result = [(None, 0, "PRIMARY", 1, self.primary_key)]
+        else:
+            params = list(params or ())
+            limit = params[0] if params else len(self.rows)
+            offset = params[1] if len(params) > 1 else 0  # OFFSET is left out for the first page
+            self._result = self.rows[offset:offset + limit]
+
+    def fetchall(self):
+        return list(self._result)
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+def canned_dashboard_data(seed=42):
+    """ Return values for every data function the dashboard calls, keyed by function name. """
+    rng = random.Random(seed)
+    return {
+        "get_database_summary_counts": (5000, 10000, 2500),
+        "get_job_status_distribution": [(status, rng.randrange(50, 3000)) for status in STATUSES],
+        "get_customer_acquisition": [(source, rng.randrange(10, 900)) for source in HOW_HEARD],
+        "get_top_customers_by_jobs": [(rng.randrange(1, 5000), rng.randrange(5, 40)) for _ in range(10)],
+        "get_most_frequent_device_brands": [(brand, rng.randrange(100, 2000)) for brand in BRANDS],
+        "get_device_type_trends": [(device, rng.randrange(100, 3000)) for device in DEVICE_TYPES],
+        "get_top_device_issues": [(issue, rng.randrange(100, 2000)) for issue in ISSUES],
+        "get_avg_job_duration_by_technician": [(tech, rng.uniform(1, 10)) for tech in TECHNICIANS],
+        "get_technician_workload": [(tech, rng.randrange(500, 3000)) for tech in TECHNICIANS],
+        "get_avg_job_completion_time": rng.uniform(2, 8),
+        "get_jobs_per_day_by_week": [(week, day, rng.randrange(5, 40)) for week in range(52) for day in range(2, 8)],
+        "get_avg_jobs_per_day_by_week": [(day, rng.uniform(5, 30)) for day in range(2, 8)],
+        "get_job_start_times_in_minutes": [rng.uniform(540, 1080) for _ in range(10000)],
+        "get_walkin_volume": [(datetime(2023, 1, 1).date() + timedelta(days=d), rng.randrange(1, 30)) for d in range(365)],
+        "get_walkin_service_types": [(issue, rng.randrange(10, 500)) for issue in ISSUES],
+    }
+
+def canned_customer_report(job_count, seed=42):
+    rng = random.Random(seed)
+    jobs = canned_jobs(job_count, seed)
+    customer_info = (1, rng.choice(FIRST_NAMES), rng.choice(SURNAMES), "07000000000", "a@example.com", "AB1 2CD", "12")
+    related = {
+        "costs": (["CostID", "JobID", "CostType", "Amount", "Description"],
+                  [(i, rng.randrange(1, job_count + 1), rng.choice(COST_TYPES), 20.0, rng.choice(ISSUES)) for i in range(job_count * 2)]),
+        "payments": (["PaymentID", "JobID", "Amount", "PaymentType", "Date"],
+                     [(i, rng.randrange(1, job_count + 1), 50.0, rng.choice(PAYMENT_TYPES), "2024-01-01") for i in range(job_count)]),
+        "communications": (["CommunicationID", "JobID", "DateTime", "CommunicationType", "Note"],
+                           [(i, rng.randrange(1, job_count + 1), "2024-01-01 10:00:00", rng.choice(COMM_TYPES), "Update") for i in range(job_count * 2)]),
+    }
+    return 1, customer_info, CUSTOMER_COLUMNS, jobs, JOB_COLUMNS, related
+
+@contextmanager
+def patched_dashboard_data(module, data):
+    originals = {name: getattr(module, name) for name in data if hasattr(module, name)}
+    try:
+        for name in originals:
+            setattr(module, name, (lambda value: lambda cursor: value)(data[name]))
+        yield
+    finally:
+        for name, func in originals.items():
+            setattr(module, name, func)
+
+
+#--------------------------------------------------------------------
+# Measurement
+
+def measure(app, build):
+    """
+    Runs `build` from inside the event loop while a heartbeat timer ticks.
+
+    `build` returns the widget it created (or None); the widget is shown and
+    the loop keeps running for SETTLE_MS so layout and first paint are included.
+
+    Returns:
+        dict: build_ms, max_stall_ms, python_peak_kb, python_retained_kb, rss_delta_kb.
+    """
+    ticks = []
+    heartbeat = QTimer()
+    heartbeat.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    loop = QEventLoop()
+    result = {}
+    created = []
+
+    rss_before = current_rss_kb()
+    tracemalloc.start()
+
+    def run_build():
+        started = time.perf_counter()
+        widget = build()
+        result["build_ms"] = (time.perf_counter() - started) * 1000
+        if widget is not None:
+            widget.show()
+            created.append(widget)
+        result["python_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        QTimer.singleShot(SETTLE_MS, loop.quit)
+
+    heartbeat.start(HEARTBEAT_MS)
+    ticks.append(time.perf_counter())
+    QTimer.singleShot(0, run_build)
+    loop.exec_()
+    heartbeat.stop()
+
+    gaps = [(later - earlier) * 1000 for earlier, later in zip(ticks, ticks[1:])]
+    result["max_stall_ms"] = max(gaps, default=0.0)
+    rss_after = current_rss_kb()
+    result["rss_delta_kb"] = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+
+    for widget in created:
+        widget.close()
+        widget.deleteLater()
+    app.processEvents()
+    created.clear()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)  # processEvents() doesn't run deleteLater()
+    gc.collect()  # drop Python wrappers only held by reference cycles
+    # Python memory still allocated since the build started, after the widget is gone (a leak shows here)
+    result["python_retained_kb"] = tracemalloc.get_traced_memory()[0] // 1024
+    tracemalloc.stop()
+    return result
+
+def current_rss_kb():
+    """ Current (not peak) resident set size from /proc; None where that isn't available. """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+def run_case(app, name, build, repeat):
+    runs = [measure(app, build) for _ in range(repeat)]
+    entry = {
+        "name": name,
+        "repeat": repeat,
+        "median_ms": round(statistics.median(run["build_ms"] for run in runs), 3),
+        "min_ms": round(min(run["build_ms"] for run in runs), 3),
+        "max_ms": round(max(run["build_ms"] for run in runs), 3),
+        "max_stall_ms": round(max(run["max_stall_ms"] for run in runs), 3),
+        "python_peak_kb": max(run["python_peak_kb"] for run in runs),
+        "python_retained_kb": max(run["python_retained_kb"] for run in runs),
+        "rss_delta_kb": max((run["rss_delta_kb"] for run in runs if run["rss_delta_kb"] is not None), default=None),
+    }
+    print(f"  {entry['median_ms']:10.1f} ms  stall {entry['max_stall_ms']:8.1f} ms  "
+          f"peak {entry['python_peak_kb']:8,} KB  retained {entry['python_retained_kb']:6,} KB  {name}")
+    return entry
+
+
+#--------------------------------------------------------------------
+# Cases
+
+def _job_table():
+    table = QTableWidget(0, len(JOB_COLUMNS))
+    table.setHorizontalHeaderLabels(JOB_COLUMNS)
+    table.resize(1200, 700)
+    return table
+
+def build_cases(sizes):
+    cases = []
+    for size in sizes:
+        rows = canned_jobs(size)
+
+        def populate(rows=rows):
+            table = _job_table()
+            populate_table(table, "jobs", rows, lambda row, text: None)
+            return table
+
+        def load(rows=rows, size=size):
+            table = _job_table()
+            load_table(table, CannedCursor(rows, JOB_COLUMNS, "JobID"), "jobs", lambda row, text: None, 0, size,
+                       count_mode="exact")
+            return table
+
+        def report(size=size):
+            customer_id, info, customer_columns, jobs, job_columns, related = canned_customer_report(max(size // 10, 1))
+            return create_customer_report_window(None, customer_id, info, customer_columns, jobs, job_columns, related)
+
+        cases += [
+            (f"populate_table jobs {size} rows", populate),
+            (f"load_table jobs {size} rows", load),
+            (f"create_customer_report_window {max(size // 10, 1)} jobs", report),
+        ]
+
+    def dashboard():
+        import UI.tabbed_dashboard as tabbed_dashboard
+        with patched_dashboard_data(tabbed_dashboard, canned_dashboard_data()):
+            return tabbed_dashboard.TabbedDashboard(parent=None, cursor=None)
+
+    cases.append(("TabbedDashboard build", dashboard))
+    return cases
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen Qt benchmarks for grid, report and dashboard construction.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Row counts to feed the grid.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/ui_<timestamp>.json).")
+    parser.add_argument("--compare", help="Earlier result file to compare against.")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    print(f"⏱ Running UI benchmarks ({os.environ.get('QT_QPA_PLATFORM')} platform):")
+    cases = [run_case(app, name, build, args.repeat) for name, build in build_cases(args.sizes)]
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "sizes": args.sizes,
+        "cases": cases,
+    }
+
+    write_results(results, args.output, prefix="ui")
+
+    if args.compare and compare_results(load_results(args.compare), results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+from datetime import datetime
+
+# Shared result handling for the benchmark scripts: every run is written
+# as JSON under benchmarks/results/ and can be compared with an earlier one.
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+REGRESSION_THRESHOLD = 0.10  # flag changes of more than 10 %
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def write_results(results, output=None, prefix="bench"):
+    """ Writes a result dict as JSON; returns the path used. """
+    output = output or os.path.join(RESULTS_DIR, f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, default=str)
+    print(f"💾 Results written to {output}")
+    return output
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare_results(previous, current, threshold=REGRESSION_THRESHOLD):
+    """
+    Prints median changes between two result files.
+
+    Returns:
+        list: Names of cases that got slower by more than `threshold`.
+    """
+    before = {case["name"]: case for case in previous.get("cases", [])}
+    regressions = []
+
+    print(f"\n📊 Compared with {previous.get('revision') or '?'} ({previous.get('created', '?')}):")
+    for case in current["cases"]:
+        old = before.get(case["name"])
+        if not old or not old["median_ms"]:
+            print(f"  {'new':>8}  {case['name']}")
+            continue
+        change = (case["median_ms"] - old["median_ms"]) / old["median_ms"]
+        flag = "🔺" if change > threshold else ("🟢" if change < -threshold else "  ")
+        print(f"  {change:+8.1%} {flag} {case['name']}  ({old['median_ms']:.1f} → {case['median_ms']:.1f} ms)")
+        if change > threshold:
+            regressions.append(case["name"])
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} case(s) regressed by more than {threshold:.0%}.")
+    return regressions
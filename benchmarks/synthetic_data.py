@@ -0,0 +1,207 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+# Synthetic shop data
+# ---------------------------
+# Builds a throwaway database with the same tables and column names the
+# app queries (customers, jobs, costs, payments, communications, orders,
+# walkins, howheard) and fills it with deterministic pseudo-random data.
+#
+# `scale` is the number of jobs; the other tables are sized from it
+# (roughly 1 customer per 2 jobs, 2 costs / 1 payment / 2 messages per
+# job, 1 order per 3 jobs, 1 walk-in per 4 jobs). The same seed always
+# produces the same rows so runs are comparable.
+
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+INSERT_BATCH_SIZE = 5000
+
+SCHEMA = [
+    """CREATE TABLE customers (
+        CustomerID INT AUTO_INCREMENT PRIMARY KEY,
+        FirstName VARCHAR(50),
+        SurName VARCHAR(50),
+        Phone VARCHAR(20),
+        Email VARCHAR(100),
+        PostCode VARCHAR(10),
+        DoorNumber VARCHAR(10)
+    )""",
+    """CREATE TABLE howheard (
+        HowHeardID INT AUTO_INCREMENT PRIMARY KEY,
+        CustomerID INT,
+        HowHeard VARCHAR(50),
+        INDEX (CustomerID)
+    )""",
+    """CREATE TABLE jobs (
+        JobID INT AUTO_INCREMENT PRIMARY KEY,
+        CustomerID INT,
+        DeviceType VARCHAR(50),
+        DeviceBrand VARCHAR(50),
+        DeviceModel VARCHAR(50),
+        Issue VARCHAR(255),
+        Password VARCHAR(50),
+        DataSave VARCHAR(10),
+        Status ENUM('Waiting for Parts','In Progress','Completed','Picked Up','Cancelled') DEFAULT 'In Progress',
+        Technician VARCHAR(50),
+        Notes TEXT,
+        Deposit DECIMAL(10,2),
+        StartDate DATETIME,
+        EndDate DATETIME,
+        INDEX (CustomerID)
+    )""",
+    """CREATE TABLE costs (
+        CostID INT AUTO_INCREMENT PRIMARY KEY,
+        JobID INT,
+        CostType VARCHAR(50),
+        Amount DECIMAL(10,2),
+        Description VARCHAR(255),
+        CostDate DATETIME DEFAULT CURRENT_TIMESTAMP,
+        INDEX (JobID)
+    )""",
+    """CREATE TABLE payments (
+        PaymentID INT AUTO_INCREMENT PRIMARY KEY,
+        JobID INT,
+        Amount DECIMAL(10,2),
+        PaymentType VARCHAR(50),
+        Date DATE,
+        INDEX (JobID)
+    )""",
+    """CREATE TABLE communications (
+        CommunicationID INT AUTO_INCREMENT PRIMARY KEY,
+        JobID INT,
+        DateTime DATETIME DEFAULT CURRENT_TIMESTAMP,
+        CommunicationType VARCHAR(50),
+        Note TEXT,
+        INDEX (JobID)
+    )""",
+    """CREATE TABLE orders (
+        PartID INT AUTO_INCREMENT PRIMARY KEY,
+        JobID INT,
+        OrderDate DATETIME DEFAULT CURRENT_TIMESTAMP,
+        Description VARCHAR(255),
+        Quantity INT,
+        TotalCost DECIMAL(10,2),
+        INDEX (JobID)
+    )""",
+    """CREATE TABLE walkins (
+        WalkinID INT AUTO_INCREMENT PRIMARY KEY,
+        WalkinDate DATETIME,
+        Description VARCHAR(255)
+    )""",
+]
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Chris", "Jamie", "Morgan", "Casey", "Riley", "Avery"]
+SURNAMES = ["Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson", "Davies", "Evans", "Thomas"]
+DEVICE_TYPES = ["Laptop", "Desktop", "Phone", "Tablet", "Console", "Printer"]
+BRANDS = ["Apple", "Dell", "HP", "Lenovo", "Samsung", "Asus", "Acer", "Sony", "Microsoft", "Google"]
+ISSUES = ["Cracked screen", "Won't power on", "Battery drain", "Water damage", "Slow performance",
+          "Virus removal", "Keyboard fault", "Charging port", "Data recovery", "OS reinstall"]
+STATUSES = ["Waiting for Parts", "In Progress", "Completed", "Picked Up", "Cancelled"]
+TECHNICIANS = ["Dan", "Priya", "Tom", "Lena", "Marcus"]
+HOW_HEARD = ["Google", "Facebook", "Walk past", "Friend", "Returning customer", "Flyer"]
+COST_TYPES = ["Parts", "Labor", "Shipping", "Miscellaneous"]
+PAYMENT_TYPES = ["Card", "Cash", "Bank Transfer"]
+COMM_TYPES = ["Email", "Call", "SMS", "In-Person", "Other"]
+
+
+def create_schema(cursor, conn, database):
+    """ Drops and recreates `database` with the benchmark tables. """
+    cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+    cursor.execute(f"CREATE DATABASE `{database}`")
+    cursor.execute(f"USE `{database}`")
+    for statement in SCHEMA:
+        cursor.execute(statement)
+    conn.commit()
+
+def _insert(cursor, conn, table, columns, rows):
+    placeholders = ", ".join(["%s"] * len(columns))
+    query = f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES ({placeholders})"
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        cursor.executemany(query, rows[start:start + INSERT_BATCH_SIZE])
+        conn.commit()
+
+def generate(cursor, conn, database, scale, seed=42, progress=print):
+    """
+    Creates the benchmark database and fills it.
+
+    Args:
+        scale (int or str): Number of jobs, or a key of SCALES.
+
+    Returns:
+        dict: Row count per table and the seconds spent loading.
+    """
+    job_count = SCALES.get(str(scale).lower(), scale)
+    job_count = int(job_count)
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    epoch = datetime(2022, 1, 3, 9, 0)
+
+    create_schema(cursor, conn, database)
+    counts = {}
+
+    customer_count = max(job_count // 2, 1)
+    progress(f"👥 customers: {customer_count:,}")
+    customers = [
+        (
+            rng.choice(FIRST_NAMES), rng.choice(SURNAMES), f"07{rng.randrange(10**9):09d}",
+            f"customer{i}@example.com", f"AB{rng.randrange(1, 99)} {rng.randrange(1, 9)}CD",
+            str(rng.randrange(1, 300)),
+        )
+        for i in range(customer_count)
+    ]
+    _insert(cursor, conn, "customers",
+            ["FirstName", "SurName", "Phone", "Email", "PostCode", "DoorNumber"], customers)
+    _insert(cursor, conn, "howheard", ["CustomerID", "HowHeard"],
+            [(i + 1, rng.choice(HOW_HEARD)) for i in range(customer_count)])
+    counts["customers"] = counts["howheard"] = customer_count
+    del customers
+
+    progress(f"🛠 jobs: {job_count:,}")
+    jobs = []
+    for _ in range(job_count):
+        start = epoch + timedelta(minutes=rng.randrange(0, 60 * 24 * 365 * 3))
+        status = rng.choice(STATUSES)
+        end = start + timedelta(days=rng.randrange(0, 21)) if status in ("Completed", "Picked Up") else None
+        jobs.append((
+            rng.randrange(1, customer_count + 1), rng.choice(DEVICE_TYPES), rng.choice(BRANDS),
+            f"Model {rng.randrange(1, 40)}", rng.choice(ISSUES), "", rng.choice(["Yes", "No"]),
+            status, rng.choice(TECHNICIANS), f"Synthetic note {rng.randrange(10**6)}",
+            round(rng.uniform(0, 80), 2), start, end,
+        ))
+    _insert(cursor, conn, "jobs",
+            ["CustomerID", "DeviceType", "DeviceBrand", "DeviceModel", "Issue", "Password", "DataSave",
+             "Status", "Technician", "Notes", "Deposit", "StartDate", "EndDate"], jobs)
+    counts["jobs"] = job_count
+    del jobs
+
+    def per_job(table, columns, per_job_count, make_row):
+        total = int(job_count * per_job_count)
+        progress(f"📄 {table}: {total:,}")
+        rows = [make_row(rng.randrange(1, job_count + 1)) for _ in range(total)]
+        _insert(cursor, conn, table, columns, rows)
+        counts[table] = total
+
+    per_job("costs", ["JobID", "CostType", "Amount", "Description"], 2,
+            lambda job: (job, rng.choice(COST_TYPES), round(rng.uniform(5, 250), 2), rng.choice(ISSUES)))
+    per_job("payments", ["JobID", "Amount", "PaymentType", "Date"], 1,
+            lambda job: (job, round(rng.uniform(10, 400), 2), rng.choice(PAYMENT_TYPES),
+                         (epoch + timedelta(days=rng.randrange(0, 1095))).date()))
+    per_job("communications", ["JobID", "CommunicationType", "Note"], 2,
+            lambda job: (job, rng.choice(COMM_TYPES), f"Update {rng.randrange(10**6)}"))
+    per_job("orders", ["JobID", "Description", "Quantity", "TotalCost"], 1 / 3,
+            lambda job: (job, f"Part {rng.randrange(1, 500)}", rng.randrange(1, 4), round(rng.uniform(5, 300), 2)))
+
+    walkin_count = max(job_count // 4, 1)
+    progress(f"🚶 walkins: {walkin_count:,}")
+    _insert(cursor, conn, "walkins", ["WalkinDate", "Description"], [
+        (epoch + timedelta(minutes=rng.randrange(0, 60 * 24 * 365 * 3)), rng.choice(ISSUES))
+        for _ in range(walkin_count)
+    ])
+    counts["walkins"] = walkin_count
+
+    return {"rows": counts, "load_seconds": time.perf_counter() - started}